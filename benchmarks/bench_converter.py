@@ -0,0 +1,87 @@
+""" Micro-benchmark of converter.gzip_to_json against the previous
+split-based implementation.
+
+    python benchmarks/bench_converter.py [recorded_feed.txt ...]
+
+Without arguments a synthetic 5,000 match daily feed is used. Exits with 1
+when the current implementation is slower than `MIN_SPEEDUP` times the
+legacy one on any feed.
+"""
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flashscore import converter
+
+
+# About x1.15-1.2 on the synthetic feed, the floor leaves room for timing noise
+MIN_SPEEDUP = 1.05
+
+
+def legacy_gzip_to_json(gzip: str) -> List[Dict]:
+    items = gzip.split('~')
+    
+    json_result = []
+    for item in items:
+        if item in ['', ' ']: continue
+        item_params = item.split('¬')
+        item_data = {}
+        
+        for param in item_params:
+            if param in ['', ' ']: continue
+            
+            try:
+                key, value = param.split('÷')
+            except Exception:
+                key, value = param.split('·')
+            
+            if item_data.get(key) is None:
+                item_data[key] = value
+            else:
+                item_data[f'{key}_2'] = value
+        
+        json_result.append(item_data)
+    return json_result
+
+
+def synthetic_feed(matches: int = 5000) -> str:
+    parts = ['SA÷1¬~ZA÷ENGLAND: Premier League¬ZEE÷dYlOSQOD¬ZB÷198¬ZY÷England¬~']
+    for i in range(matches):
+        parts.append(
+            f'AA÷{i:08x}¬AD÷{1696000000 + i * 60}¬AB÷3¬CR÷3¬AC÷3¬'
+            f'AE÷Home Team {i}¬AF÷Away Team {i}¬AG÷{i % 5}¬AH÷{i % 3}¬'
+            f'BA÷{i % 2}¬BB÷{i % 2}¬WM÷HOM¬WN÷AWA¬AX÷1¬~'
+        )
+    parts.append('A1÷d41d8cd98f00b204e9800998ecf8427e¬~')
+    return ''.join(parts)
+
+
+def main(paths: List[str]) -> int:
+    feeds = {path: Path(path).read_text(encoding='utf-8') for path in paths}
+    if not feeds:
+        feeds = {'synthetic 5000 matches': synthetic_feed()}
+
+    slower = []
+    for name, feed in feeds.items():
+        assert converter.gzip_to_json(feed) == legacy_gzip_to_json(feed), name
+
+        number = 20
+        legacy = min(timeit.repeat(lambda: legacy_gzip_to_json(feed), number=number, repeat=5)) / number
+        current = min(timeit.repeat(lambda: converter.gzip_to_json(feed), number=number, repeat=5)) / number
+        print('%s (%d bytes)' % (name, len(feed.encode('utf-8'))))
+        print('  legacy:  %8.3f ms' % (legacy * 1000))
+        print('  current: %8.3f ms  (x%.2f)' % (current * 1000, legacy / current))
+        if legacy / current < MIN_SPEEDUP:
+            slower.append(name)
+
+    if slower:
+        print('slower than legacy: %s' % ', '.join(slower))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
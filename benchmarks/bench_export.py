@@ -0,0 +1,101 @@
+""" Bulk export of matches into columnar tables against dumping
+`get_json` dicts.
+
+    python benchmarks/bench_export.py [count] [csv|parquet|arrow] [max_peak_ratio]
+
+Builds `count` fully loaded matches from recorded-like payloads and
+reports the time and the traced peak memory on top of the matches
+themselves for each approach. Exits with 1 when the export peaks over
+`max_peak_ratio` (0.25 by default) of the `get_json` dump peak.
+"""
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flashscore.export import export_matches
+from flashscore.match import Match
+
+
+NAMES = (
+    '<script>window.environment = {"header":{"tournament":{"tournament":"Premier League",'
+    '"category":"ENGLAND"}},"participantsData":{"home":[{"name":"Arsenal","id":"p1"}],'
+    '"away":[{"name":"Chelsea","id":"p2"}]}};</script>'
+)
+GENERAL = 'DA÷3¬DB÷3¬DC÷1696000000¬DD÷1696000000¬DE÷2¬DF÷1¬~A1÷x¬~'
+STATS = (
+    'SE÷Match¬~SG÷Ball Possession¬SH÷54%¬SI÷46%¬~SG÷Goal Attempts¬SH÷12¬SI÷7¬~SG÷Corner Kicks¬SH÷6¬SI÷2¬~'
+    'SE÷1st Half¬~SG÷Ball Possession¬SH÷50%¬SI÷50%¬~SE÷2nd Half¬~SG÷Ball Possession¬SH÷58%¬SI÷42%¬~A1÷x¬~'
+)
+EVENTS = (
+    "III÷1¬IK÷Goal¬IB÷23'¬IF÷Saka B.¬IU÷/player/saka¬INX÷1¬IOX÷0¬~"
+    "III÷2¬IK÷Yellow Card¬IB÷40'¬IF÷James R.¬IU÷/player/james¬TL÷Foul¬~A1÷x¬~"
+)
+ODDS = json.dumps({'data': {'findPrematchOddsById': {'odds': [{'odds': [
+    {'eventParticipantId': None, 'value': '3.40'},
+    {'eventParticipantId': 'p2', 'value': '4.10'},
+    {'eventParticipantId': 'p1', 'value': '1.90'},
+]}]}}})
+HEAD2HEADS = ''.join(
+    'KB÷Section %d¬~' % section + ''.join(
+        'KP÷h%d¬KC÷1695000000¬FH÷Arsenal¬FK÷Spurs¬KU÷2¬KT÷1¬KF÷Premier League¬KH÷England¬KL÷2:1¬KS÷home¬KN÷w¬~' % i
+        for i in range(5)
+    )
+    for section in range(3)
+) + 'A1÷x¬~'
+
+
+def build_matches(count: int):
+    for i in range(count):
+        match = Match(id='%08x' % i, country_name='ENGLAND', league_name='Premier League')
+        match.load_content(
+            names=NAMES, general=GENERAL, stats=STATS, events=EVENTS,
+            odds=ODDS, head2heads=HEAD2HEADS,
+        )
+        yield match
+
+
+def measure(name: str, function, *args) -> int:
+    """ Prints the time and the traced peak of `function`, returns the peak """
+    started_at = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print('%-10s %8.3fs  peak %8.1f MiB' % (name, elapsed, peak / 2 ** 20))
+    return peak
+
+
+def main(count: int, format: str, max_peak_ratio: float) -> int:
+    matches = list(build_matches(count))
+    with tempfile.TemporaryDirectory() as directory:
+        def dump_json(matches):
+            with open(Path(directory) / 'matches.json', 'w') as file:
+                file.write(json.dumps([match.get_json() for match in matches]))
+
+        def export(matches):
+            export_matches(matches, directory, format)
+
+        print('%d loaded matches' % count)
+        json_peak = measure('get_json', dump_json, matches)
+        export_peak = measure(format, export, matches)
+
+    if export_peak > json_peak * max_peak_ratio:
+        print('%s peak over %.2f of the get_json peak' % (format, max_peak_ratio))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        sys.argv[2] if len(sys.argv) > 2 else 'csv',
+        float(sys.argv[3]) if len(sys.argv) > 3 else 0.25,
+    ))
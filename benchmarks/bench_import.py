@@ -0,0 +1,63 @@
+""" Import time of the package, measured with `python -X importtime`.
+
+    python benchmarks/bench_import.py [budget_ms] [module]
+
+Imports `module` (flashscore by default) in fresh interpreters, reports the
+best cumulative time of a few runs and the slowest modules it pulled in.
+Exits with 1 when the time is over `budget_ms` or when an http backend
+(requests, urllib3, aiohttp) or the no longer used grequests/gevent is
+imported, since backends are only loaded by the first request of their
+mode.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BACKENDS = ('requests', 'urllib3', 'aiohttp', 'grequests', 'gevent')
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """ Self and cumulative microseconds of every module `module` imports """
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get('PYTHONPATH')])))
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+        capture_output=True, text=True, env=environment, check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line: continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def main(budget: float, module: str, runs: int = 5) -> int:
+    results: List[Dict[str, Tuple[int, int]]] = [import_times(module) for _ in range(runs)]
+    best = min(results, key=lambda times: times[module][1])
+    total = best[module][1] / 1000
+
+    print('import %s: %.1f ms (best of %d)' % (module, total, runs))
+    print('slowest modules')
+    for name, (self_time, cumulative) in sorted(best.items(), key=lambda item: -item[1][0])[:10]:
+        print('  %-40s self %7.1f ms  cumulative %7.1f ms' % (name, self_time / 1000, cumulative / 1000))
+
+    backends = sorted({name.split('.')[0] for name in best} & set(BACKENDS))
+    if backends:
+        print('http backends imported eagerly: %s' % ', '.join(backends))
+        return 1
+    if budget and total > budget:
+        print('over the %.1f ms budget' % budget)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 0.0,
+        sys.argv[2] if len(sys.argv) > 2 else 'flashscore',
+    ))
@@ -0,0 +1,74 @@
+""" Memory held per model object.
+
+    python benchmarks/bench_memory.py [count] [max_bytes]
+
+Creates `count` matches (with three stats, two events and three history
+matches each) and reports the traced bytes per Match. Exits with 1 when
+a loaded Match takes more than `max_bytes` (2048 by default).
+"""
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flashscore.match import Event, HistoryMatch, Match, StatValue
+
+
+def build_match(i: int) -> Match:
+    match = Match(id='%08x' % i, country_name='ENGLAND', league_name='Premier League')
+    match.stats_match = [
+        StatValue('Ball Possession', 54, 46, '54%', '46%'),
+        StatValue('Goal Attempts', 12, 7, '12', '7'),
+        StatValue('Corner Kicks', 6, 2, '6', '2'),
+    ]
+    match.events = [
+        Event(type='Goal', player_name='Saka B.', player_url='/player/saka', time="23'"),
+        Event(type='Yellow Card', player_name='James R.', player_url='/player/james', time="40'"),
+    ]
+    match.head2head_matches = [
+        HistoryMatch(
+            id='%08x' % (i + j),
+            timestamp=1690000000 + j,
+            date=datetime.fromtimestamp(1690000000 + j),
+            home_team_name='Arsenal',
+            away_team_name='Chelsea',
+            league_name='Premier League',
+            country='England',
+            final_total_score='1:0',
+        )
+        for j in range(3)
+    ]
+    return match
+
+
+def main(count: int, max_bytes: int) -> int:
+    build_match(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    matches = [build_match(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_match = (after - before) / count
+    print('%d matches: %d bytes per Match (with stats, events and history)' % (len(matches), per_match))
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bare_matches = [Match(id='%08x' % i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('%d matches: %d bytes per bare Match' % (len(bare_matches), (after - before) / count))
+
+    if per_match > max_bytes:
+        print('over the %d bytes budget' % max_bytes)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2048,
+    ))
@@ -0,0 +1,55 @@
+""" Parsing match payloads inline against a ParsePool process pool.
+
+    python benchmarks/bench_parse.py [count] [workers] [min_per_second]
+
+Parses `count` matches worth of section payloads, the ones of
+bench_export.py, and reports matches parsed per second. Exits with 1 when
+inline parsing is under `min_per_second` matches (1000 by default).
+"""
+import concurrent.futures
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_export import EVENTS, GENERAL, HEAD2HEADS, NAMES, ODDS, STATS
+from flashscore.match import parse_sections
+from flashscore.pipeline import parse_matches_sections
+
+
+CONTENTS = {
+    'names': NAMES, 'general': GENERAL, 'stats': STATS,
+    'events': EVENTS, 'odds': ODDS, 'head2heads': HEAD2HEADS,
+}
+
+
+def main(count: int, workers: int, min_per_second: float, chunk_size: int = 32) -> int:
+    matches_contents = [CONTENTS] * count
+
+    started_at = time.perf_counter()
+    for contents in matches_contents:
+        parse_sections(contents)
+    inline = count / (time.perf_counter() - started_at)
+    print('inline       %8.0f matches/s' % inline)
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        list(executor.map(parse_matches_sections, [matches_contents[:chunk_size]] * workers))
+        started_at = time.perf_counter()
+        chunks = [matches_contents[i:i + chunk_size] for i in range(0, count, chunk_size)]
+        for _ in executor.map(parse_matches_sections, chunks): pass
+        elapsed = time.perf_counter() - started_at
+    print('%2d processes %8.0f matches/s' % (workers, count / elapsed))
+
+    if inline < min_per_second:
+        print('under %.0f matches/s' % min_per_second)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 1000,
+    ))
@@ -0,0 +1,168 @@
+""" Offline benchmarks over recorded responses.
+
+    python benchmarks/bench_replay.py [fixtures_directory] [latency] [max_load_ms] [min_matches_per_s]
+
+Reports parse throughput per endpoint, `Match.load_content` latency and
+season bulk load throughput, served by ReplayTransport with `latency`
+seconds per response (0.05 by default). Without a fixtures directory, or
+when it does not exist, synthetic fixtures are written to a temporary
+one, record real ones with benchmarks/record_fixtures.py.
+
+Exits with 1 when the p95 of `Match.load_content` is over `max_load_ms`
+or the season loads under `min_matches_per_s`. By default sections are
+expected to be fetched concurrently: one load within three response
+latencies plus 50 ms, a season at half the rate the transport concurrency
+allows.
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_export import EVENTS, GENERAL, HEAD2HEADS, NAMES, ODDS, STATS
+from flashscore.api import FlashscoreApi
+from flashscore.country import Country
+from flashscore.league import League
+from flashscore.match import SECTIONS, SECTIONS_PARSERS, Match
+from flashscore.replay import ReplayTransport
+from flashscore.season import Season
+
+
+LEAGUE_URL = 'https://www.flashscore.com/football/england/premier-league/'
+
+
+def season_page(count: int) -> str:
+    return 'SA÷1¬~ZA÷ENGLAND: Premier League¬ZY÷England¬~' + ''.join(
+        'AA÷%08x¬AD÷1696000000¬AB÷3¬AE÷Arsenal¬AF÷Chelsea¬AG÷2¬AH÷1¬~' % i for i in range(count)
+    ) + 'A1÷x¬~'
+
+
+def write_synthetic_fixtures(directory: str) -> None:
+    transport = ReplayTransport(directory)
+    league = League('abc', 'Premier League', LEAGUE_URL, 198, 'England', 'x', transport=transport)
+    season = Season(176, '2022/2023', 198, 'abc', 'England', 'Premier League', transport=transport)
+    match = Match('00000000', transport=transport)
+    raw_data = [{'SCC': [{'MC': 198, 'MCN': 'England', 'ML': '/football/england/'}]}]
+
+    fixtures = {
+        league._main_url: 'rawData: %s,\n' % json.dumps(raw_data),
+        league._league_url + '198': 'MN÷Premier League¬MTI÷abc¬MU÷premier-league¬MT÷x¬~A1÷x¬~',
+        league._archive_url: (
+            '<div class="archive__season"><a href="/football/england/premier-league-2022-2023/">'
+            'Premier League 2022/2023</a></div>'
+        ),
+        league._main_url + 'football/england/premier-league-2022-2023/': 'var season_id = 176;',
+        season.get_matches_url(0): season_page(380),
+        league._today_matches_url.replace('{day}', '0'): season_page(1000),
+        match._flashscore_url: NAMES,
+        match._general_url: GENERAL,
+        match._stats_url: STATS,
+        match._events_url: EVENTS,
+        match._odds_url: ODDS,
+        match._head2heads_url: HEAD2HEADS,
+    }
+    for url, text in fixtures.items():
+        transport._write(url, text)
+
+
+def endpoint_parsers(transport: ReplayTransport):
+    api = FlashscoreApi(transport=transport)
+    country = Country(198, 'England', 'https://www.flashscore.com/football/england/', transport=transport)
+    league = League('abc', 'Premier League', LEAGUE_URL, 198, 'England', 'x', transport=transport)
+    season = Season(176, '2022/2023', 198, 'abc', 'England', 'Premier League', transport=transport)
+    return {
+        'main': api._parse_countries,
+        'leagues': country._parse_leagues,
+        'archive': league._parse_archive,
+        'season': lambda text: season._page_records(text, {}),
+        'feed': lambda text: list(api._iter_today_matches(text)),
+        **SECTIONS_PARSERS,
+    }
+
+
+def bench_parsers(transport: ReplayTransport, repeat: int = 20) -> None:
+    print('parse throughput per endpoint')
+    for endpoint, parser in endpoint_parsers(transport).items():
+        texts = [Path(path).read_text(encoding='utf-8') for path in transport._endpoint_fixtures(endpoint)]
+        if not texts: continue
+        size = sum(len(text.encode('utf-8')) for text in texts)
+
+        started_at = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                parser(text)
+        elapsed = time.perf_counter() - started_at
+        print('  %-10s %8.0f responses/s %8.1f MiB/s' % (
+            endpoint, repeat * len(texts) / elapsed, repeat * size / elapsed / 2 ** 20,
+        ))
+
+
+def bench_load_content(transport: ReplayTransport, count: int = 20) -> float:
+    """ Returns the p95 latency in seconds """
+    timings = []
+    for i in range(count):
+        match = Match('%08x' % i, transport=transport)
+        started_at = time.perf_counter()
+        match.load_content()
+        timings.append(time.perf_counter() - started_at)
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95)]
+    print('Match.load_content   mean %6.1f ms  p50 %6.1f ms  p95 %6.1f ms' % (
+        statistics.mean(timings) * 1000,
+        timings[len(timings) // 2] * 1000,
+        p95 * 1000,
+    ))
+    return p95
+
+
+def bench_season(transport: ReplayTransport) -> float:
+    """ Returns the matches loaded per second """
+    season = Season(176, '2022/2023', 198, 'abc', 'England', 'Premier League', transport=transport)
+    started_at = time.perf_counter()
+    matches = season.get_matches_with_alreday_loaded_content()
+    elapsed = time.perf_counter() - started_at
+    print('season bulk load     %d matches in %.2fs, %.0f matches/s' % (len(matches), elapsed, len(matches) / elapsed))
+    return len(matches) / elapsed
+
+
+def main(directory: str, latency: float, max_load_ms: Optional[float], min_matches_per_s: Optional[float]) -> int:
+    if not os.path.isdir(directory):
+        directory = tempfile.mkdtemp(prefix='flashscore-fixtures-')
+        write_synthetic_fixtures(directory)
+        print('synthetic fixtures in %s' % directory)
+
+    transport = ReplayTransport(directory, latency=latency)
+    if max_load_ms is None:
+        max_load_ms = (3 * latency + 0.05) * 1000
+    if min_matches_per_s is None:
+        min_matches_per_s = transport.concurrency / (len(SECTIONS) * latency) / 2 if latency else 0.0
+
+    print('latency %.0f ms per response' % (latency * 1000))
+    bench_parsers(transport)
+    load_p95 = bench_load_content(transport)
+    matches_per_s = bench_season(transport)
+    transport.close()
+
+    failed = False
+    if load_p95 * 1000 > max_load_ms:
+        print('Match.load_content p95 over %.1f ms' % max_load_ms)
+        failed = True
+    if matches_per_s < min_matches_per_s:
+        print('season bulk load under %.0f matches/s' % min_matches_per_s)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(
+        sys.argv[1] if len(sys.argv) > 1 else '',
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.05,
+        float(sys.argv[3]) if len(sys.argv) > 3 else None,
+        float(sys.argv[4]) if len(sys.argv) > 4 else None,
+    ))
@@ -0,0 +1,58 @@
+""" Records one response of every endpoint for the replay benchmarks.
+
+    python benchmarks/record_fixtures.py [directory] [matches]
+
+Needs network access. Walks the first league of the first country that
+has one, lists its latest season, today's feed and loads every section
+of the first `matches` matches, writing each response into `directory`
+(benchmarks/fixtures by default). `recorded.json` lists the recorded
+matches with the participant ids their listing gave and the validators
+of the polled feeds, tests/test_recorded.py checks them.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flashscore import FlashscoreApi
+from flashscore.match import load_matches
+from flashscore.replay import ReplayTransport
+
+
+def main(directory: str, matches_count: int) -> None:
+    transport = ReplayTransport(directory, record=True)
+    api = FlashscoreApi(transport=transport)
+
+    countries = api.get_countries()
+    league = next(leagues[0] for leagues in (country.get_leagues() for country in countries) if leagues)
+    season = league.get_seasons()[0]
+    matches = season.get_matches()
+    listed = {
+        match.id: [match._home_participant_id, match._away_participant_id]
+        for match in matches[:matches_count]
+    }
+    load_matches(matches[:matches_count])
+    api.get_today_matches()
+
+    with open(os.path.join(directory, 'recorded.json'), 'w', encoding='utf-8') as file:
+        json.dump({
+            'matches': listed,
+            'validators': {
+                key.split('|', 1)[1]: {'etag': validators.etag, 'last_modified': validators.last_modified}
+                for key, validators in transport._validators.items()
+            },
+        }, file, indent=2)
+
+    print('%s: %s, %s %s, %d matches recorded into %s' % (
+        league.country_name, league.name, season.title, len(matches), matches_count, directory,
+    ))
+    transport.close()
+
+
+if __name__ == '__main__':
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else str(Path(__file__).resolve().parent / 'fixtures'),
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
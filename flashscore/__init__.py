@@ -1 +1,15 @@
-from .api import FlashscoreApi
+from .api import AsyncFlashscoreApi, FlashscoreApi
+from .batch import BatchLoadError, BatchProgress, RetryPolicy
+from .cache import Cache, CachePolicy, MemoryCache, SQLiteCache, TieredCache
+from .crawler import CrawlCheckpoint, Crawler, CrawlStats
+from .export import ColumnarExporter, export_matches
+from .instrumentation import (Instrumentation, LoggingInstrumentation, MetricsRegistry, MultiInstrumentation,
+                              OpenTelemetryInstrumentation, PrometheusInstrumentation)
+from .league import SeasonsParseError
+from .live import LiveTracker, LiveUpdate
+from .odds import EventOdds, OddsFetcher, OddsMovement, OddsSnapshot
+from .pipeline import ParsePool
+from .replay import ReplayTransport
+from .stats import STATS_IDS, STATS_NAMES, StatsMatrix, season_stats_matrix
+from .store import MatchStore
+from .transport import Transport, get_transport, set_transport
@@ -0,0 +1,79 @@
+""" Command line entry point.
+
+    python -m flashscore crawl --country England --league "Premier League" \\
+        --season 2022/2023 --sections general stats --export premier-league
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from .crawler import CrawlCheckpoint, Crawler, CrawlStats
+from .export import FORMATS, ColumnarExporter
+from .match import SECTIONS
+from .pipeline import ParsePool
+from .transport import Transport
+
+
+def _print_progress(stats: CrawlStats) -> None:
+    print('\r' + str(stats), end='', file=sys.stderr, flush=True)
+
+
+def crawl(args: argparse.Namespace) -> None:
+    transport = Transport(concurrency=args.concurrency, rate_limit=args.rate_limit)
+    checkpoint = CrawlCheckpoint(args.checkpoint)
+    parse_pool = ParsePool(args.parse_workers) if args.parse_workers else None
+    exporter = ColumnarExporter(args.export, args.format) if args.export is not None else None
+    crawler = Crawler(
+        countries=args.country,
+        leagues=args.league,
+        seasons=args.season,
+        sections=args.sections,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        checkpoint=checkpoint,
+        on_matches=exporter.write if exporter is not None else None,
+        on_progress=_print_progress,
+        parse_pool=parse_pool,
+        locale=args.locale,
+        transport=transport,
+    )
+    try:
+        stats = crawler.run()
+    finally:
+        if exporter is not None:
+            exporter.close()
+        checkpoint.close()
+        if parse_pool is not None:
+            parse_pool.close()
+        transport.close()
+    print('\r' + str(stats), file=sys.stderr)
+    for key, error in stats.errors.items():
+        print('%s: %s' % (key, error), file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m flashscore')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    crawl_parser = commands.add_parser('crawl', help='crawl matches with resumable checkpoints')
+    crawl_parser.add_argument('--country', action='append', help='country name or id, repeatable')
+    crawl_parser.add_argument('--league', action='append', help='league name or id, repeatable')
+    crawl_parser.add_argument('--season', action='append', help='season title or id, repeatable')
+    crawl_parser.add_argument('--sections', nargs='+', choices=SECTIONS, help='match sections to load')
+    crawl_parser.add_argument('--workers', type=int, default=4, help='seasons crawled at once')
+    crawl_parser.add_argument('--chunk-size', type=int, default=200, help='matches loaded per batch')
+    crawl_parser.add_argument('--parse-workers', type=int, default=0, help='processes parsing payloads, 0 parses inline')
+    crawl_parser.add_argument('--concurrency', type=int, default=32, help='requests in flight per season worker')
+    crawl_parser.add_argument('--rate-limit', type=float, help='requests per second per host')
+    crawl_parser.add_argument('--checkpoint', default='flashscore-crawl.sqlite', help='checkpoint file')
+    crawl_parser.add_argument('--export', help='directory to export crawled matches into')
+    crawl_parser.add_argument('--format', choices=FORMATS, default='csv', help='export format')
+    crawl_parser.add_argument('--locale', default='en')
+    crawl_parser.set_defaults(handler=crawl)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
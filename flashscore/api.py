@@ -1,20 +1,23 @@
 import json
-from typing import List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional
 
 from . import converter
 from .base import Base
+from .batch import BatchProgress
 from .country import Country
-from .match import Match
+from .match import Match, async_load_matches, get_match, load_matches
+from .pipeline import ParsePool
+from .transport import Transport
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 
 class FlashscoreApi(Base):
-    def __init__(self, locale: str = 'en'):
-        self.locale = locale
-        super().__init__(self.locale)
-    
-    def get_countries(self) -> List[Country]:
-        response = self.make_request(self._main_url)
-        flashscore_html = response.text         
+    def __init__(self, locale: str = 'en', transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
+
+    def _parse_countries(self, flashscore_html: str) -> List[Country]:
         raw_data_start = flashscore_html.find('rawData: ') + len('rawData: ')
         raw_data_end = raw_data_start + flashscore_html[raw_data_start:].find('\n') - 1
 
@@ -26,42 +29,162 @@ class FlashscoreApi(Base):
                     id=country['MC'],
                     name=country['MCN'],
                     url=f"{self._main_url}{country['ML'][1:]}",
+                    locale=self.locale,
+                    transport=self._transport,
                 ))
-                
+
         return sorted(countries, key=lambda country: country.id)
 
+    def _iter_today_matches(self, today_matches_gzip: str, only_live: bool = False) -> Iterator[Match]:
+        header = None
+        for today_match in converter.iter_records(today_matches_gzip):
+            if today_match.get('ZA') is not None: header = today_match
+            if today_match.get('AA') is None: continue
+            if only_live and today_match.get('AB') != '2': continue
+
+            match = get_match(today_match['AA'], locale=self.locale, transport=self._transport)
+            match._load_feed_record(today_match, header)
+            yield match
+
+    def _day_matches_url(self, day: Optional[int]) -> str:
+        return self._today_matches_url.replace('{day}', str(day))
+
+    def get_countries(self) -> List[Country]:
+        return self._parse_countries(self.make_request(self._main_url).text)
+
+    async def async_get_countries(self) -> List[Country]:
+        return self._parse_countries(await self.async_make_request(self._main_url))
+
+    def iter_today_matches(self, day: Optional[int] = 0) -> Iterator[Match]:
+        today_matches_gzip = self.make_request(self._day_matches_url(day))
+        return self._iter_today_matches(today_matches_gzip.text)
+
     def get_today_matches(self, day: Optional[int] = 0) -> List[Match]:
-        today_matches_gzip = self.make_request(self._today_matches_url.replace('{day}', str(day)))
-        today_matches_json = converter.gzip_to_json(today_matches_gzip.text)
-        return [
-            Match(id=today_match['AA'], locale=self.locale)
-            for today_match in today_matches_json
-            if today_match.get('AA') is not None
-        ]
+        return list(self.iter_today_matches(day))
+
+    async def async_iter_today_matches(self, day: Optional[int] = 0) -> AsyncIterator[Match]:
+        today_matches_gzip = await self.async_make_request(self._day_matches_url(day))
+        for match in self._iter_today_matches(today_matches_gzip):
+            yield match
+
+    async def async_get_today_matches(self, day: Optional[int] = 0) -> List[Match]:
+        today_matches_gzip = await self.async_make_request(self._day_matches_url(day))
+        return list(self._iter_today_matches(today_matches_gzip))
+
+    async def async_get_calendar(self,
+                                 days: Iterable[int] = range(-7, 8),
+                                 progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[int, List[Match]]:
+        """ Matches of every day relative to today, the day feeds are
+        fetched concurrently and their records fill the matches teams,
+        kickoff, status, score and league, so no `load_content` is needed
+        for a fixture list """
+        days = list(dict.fromkeys(days))
+        feeds = await self.async_batch_requests([self._day_matches_url(day) for day in days], progress)
+        return {day: list(self._iter_today_matches(feed)) for day, feed in zip(days, feeds)}
+
+    def get_calendar(self,
+                     days: Iterable[int] = range(-7, 8),
+                     progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[int, List[Match]]:
+        return self._transport.run(self.async_get_calendar(days, progress))
+
+    def iter_live_matches(self) -> Iterator[Match]:
+        today_matches_gzip = self.make_request(self._day_matches_url(0))
+        return self._iter_today_matches(today_matches_gzip.text, only_live=True)
 
     def get_live_matches(self) -> List[Match]:
-        today_matches_gzip = self.make_request(self._today_matches_url.replace('{day}', '0'))
-        today_matches_json = converter.gzip_to_json(today_matches_gzip.text)
-
-        return [
-            Match(id=today_match['AA'], locale=self.locale)
-            for today_match in today_matches_json
-            if today_match.get('AA') is not None\
-            and today_match.get('AB') == '2'
-        ]
-    
-    def get_matches_with_already_loaded_content(self, matches_ids: List[str]) -> List[Match]:
-        matches = [ Match(id=id, locale=self.locale) for id in matches_ids ]
-        urls = []
-        for match in matches:
-            urls += [
-                match._flashscore_url, 
-                match._general_url,
-                match._stats_url,
-                match._events_url,
-                match._odds_url,
-                match._head2heads_url,
-            ]
-        for match, responses in zip(matches, self.split_list_to_chinks(self.make_grequest(urls), 6)):
-            match.load_content(*[response.text for response in responses]) 
+        return list(self.iter_live_matches())
+
+    async def async_iter_live_matches(self) -> AsyncIterator[Match]:
+        today_matches_gzip = await self.async_make_request(self._day_matches_url(0))
+        for match in self._iter_today_matches(today_matches_gzip, only_live=True):
+            yield match
+
+    async def async_get_live_matches(self) -> List[Match]:
+        today_matches_gzip = await self.async_make_request(self._day_matches_url(0))
+        return list(self._iter_today_matches(today_matches_gzip, only_live=True))
+
+    def get_matches_with_already_loaded_content(self,
+                                                matches_ids: List[str],
+                                                progress: Optional[Callable[[BatchProgress], None]] = None,
+                                                sections: Optional[List[str]] = None,
+                                                parse_pool: Optional[ParsePool] = None) -> List[Match]:
+        matches = [ get_match(id, locale=self.locale, transport=self._transport) for id in matches_ids ]
+        # Reused matches that have not ended may be stale, their content is fetched again
+        for match in matches: match._unload_unfinished()
+        if parse_pool is not None:
+            parse_pool.load_matches(matches, sections, progress)
+        else:
+            load_matches(matches, sections, progress)
+        return matches
+
+    async def async_get_matches_with_already_loaded_content(self,
+                                                            matches_ids: List[str],
+                                                            progress: Optional[Callable[[BatchProgress], None]] = None,
+                                                            sections: Optional[List[str]] = None,
+                                                            parse_pool: Optional[ParsePool] = None) -> List[Match]:
+        matches = [ get_match(id, locale=self.locale, transport=self._transport) for id in matches_ids ]
+        # Reused matches that have not ended may be stale, their content is fetched again
+        for match in matches: match._unload_unfinished()
+        if parse_pool is not None:
+            await parse_pool.async_load_matches(matches, sections, progress)
+        else:
+            await async_load_matches(matches, sections, progress)
         return matches
+
+
+class AsyncFlashscoreApi(FlashscoreApi):
+    """ Awaitable API for code already running inside an event loop.
+
+    Every object it returns shares one `aiohttp.ClientSession`, either the
+    caller's `session` or one owned by the api and closed by `close()`.
+
+        async with AsyncFlashscoreApi(session=session) as api:
+            countries = await api.get_countries()
+            leagues = await countries[0].async_get_leagues()
+    """
+
+    def __init__(self,
+                 locale: str = 'en',
+                 session: Optional['ClientSession'] = None,
+                 transport: Optional[Transport] = None):
+        if transport is None:
+            transport = Transport(client_session=session) if session is not None else Transport()
+        super().__init__(locale, transport)
+
+    async def __aenter__(self) -> 'AsyncFlashscoreApi':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._transport.aclose()
+
+    async def get_countries(self) -> List[Country]:
+        return await self.async_get_countries()
+
+    async def iter_today_matches(self, day: Optional[int] = 0) -> AsyncIterator[Match]:
+        async for match in self.async_iter_today_matches(day):
+            yield match
+
+    async def get_today_matches(self, day: Optional[int] = 0) -> List[Match]:
+        return await self.async_get_today_matches(day)
+
+    async def get_calendar(self,
+                           days: Iterable[int] = range(-7, 8),
+                           progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[int, List[Match]]:
+        return await self.async_get_calendar(days, progress)
+
+    async def iter_live_matches(self) -> AsyncIterator[Match]:
+        async for match in self.async_iter_live_matches():
+            yield match
+
+    async def get_live_matches(self) -> List[Match]:
+        return await self.async_get_live_matches()
+
+    async def get_matches_with_already_loaded_content(self,
+                                                      matches_ids: List[str],
+                                                      progress: Optional[Callable[[BatchProgress], None]] = None,
+                                                      sections: Optional[List[str]] = None,
+                                                      parse_pool: Optional[ParsePool] = None) -> List[Match]:
+        return await self.async_get_matches_with_already_loaded_content(matches_ids, progress, sections, parse_pool)
@@ -1,93 +1,191 @@
 import asyncio
-from typing import List, Optional
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-import grequests
-import requests
-from aiohttp import ClientSession
+from .batch import BatchLoader, BatchLoadError, BatchProgress
+from .instrumentation import Instrumentation
+from .transport import Transport, get_transport
 
+if TYPE_CHECKING:
+    import requests
 
-class Base:
-    def __init__(self, locale: str = 'en'):
-        self._locales = {
-            'en': {
-                'code': '2', 
-                'url': 'https://www.flashscore.com/',
-                'ninja': 'https://local-global.flashscore.ninja/'
-            },
-            'ua': {
-                'code': '35',
-                'url': 'https://www.flashscore.ua/',
-                'ninja': 'https://local-ruua.flashscore.ninja/',
-            },
-            'ru': {
-                'code': '32',
-                'url': 'https://www.flashscore.ua/',
-                'ninja': 'https://local-ruua.flashscore.ninja/',
-            },
-        }
-        
-        self._locale_code, self._main_url, self._ninja_url = self._locales[locale].values()
-           
-        self._league_url = f'{self._main_url}{self._locale_code}/req/m_1_'
-        self._matches_url = self._ninja_url + self._locale_code + '/x/feed/tr_{endpoint}_{season}_{page}_3_' + locale + '_1'
-        self._today_matches_url = self._ninja_url + self._locale_code + '/x/feed/f_1_{day}_3_' + locale + '_1'
-        
-        self._flashscore_endpoint: str = f"{self._main_url}match/"
-        self._general_endpoint: str = f'{self._ninja_url}{self._locale_code}/x/feed/dc_1_'
-        self._stats_endpoint: str = f'{self._ninja_url}{self._locale_code}/x/feed/df_st_1_'
-        self._events_endpoint: str = f'{self._ninja_url}{self._locale_code}/x/feed/df_sui_1_'
-        self._odds_endpoint: str = f'https://2.ds.lsapp.eu/pq_graphql'
-        self._head2heads_endpoint: str = f'{self._ninja_url}{self._locale_code}/x/feed/df_hh_1_'
-        self._matches_url = f'{self._ninja_url}{self._locale_code}/x/feed/'
-            
-        self._headers = {
+
+LOCALES = {
+    'en': {
+        'code': '2', 
+        'url': 'https://www.flashscore.com/',
+        'ninja': 'https://local-global.flashscore.ninja/'
+    },
+    'ua': {
+        'code': '35',
+        'url': 'https://www.flashscore.ua/',
+        'ninja': 'https://local-ruua.flashscore.ninja/',
+    },
+    'ru': {
+        'code': '32',
+        'url': 'https://www.flashscore.ua/',
+        'ninja': 'https://local-ruua.flashscore.ninja/',
+    },
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LocaleConfig:
+    """ Urls and headers of one locale, shared by every object using it """
+    locale: str
+    code: str
+    main_url: str
+    ninja_url: str
+    league_url: str
+    today_matches_url: str
+    feed_url: str
+    flashscore_endpoint: str
+    general_endpoint: str
+    stats_endpoint: str
+    events_endpoint: str
+    odds_endpoint: str
+    head2heads_endpoint: str
+    headers: Dict[str, str]
+
+
+@functools.lru_cache(maxsize=None)
+def get_locale_config(locale: str) -> LocaleConfig:
+    code, main_url, ninja_url = LOCALES[locale].values()
+    feed_url = f'{ninja_url}{code}/x/feed/'
+    return LocaleConfig(
+        locale=locale,
+        code=code,
+        main_url=main_url,
+        ninja_url=ninja_url,
+        league_url=f'{main_url}{code}/req/m_1_',
+        today_matches_url=feed_url + 'f_1_{day}_3_' + locale + '_1',
+        feed_url=feed_url,
+        flashscore_endpoint=f'{main_url}match/',
+        general_endpoint=f'{feed_url}dc_1_',
+        stats_endpoint=f'{feed_url}df_st_1_',
+        events_endpoint=f'{feed_url}df_sui_1_',
+        odds_endpoint='https://2.ds.lsapp.eu/pq_graphql',
+        head2heads_endpoint=f'{feed_url}df_hh_1_',
+        headers={
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/117.0',
             'Accept': '*/*',
             'Accept-Language': locale,
-            'Referer': self._main_url,
+            'Referer': main_url,
             'x-fsign': 'SW9D1eZo',
-            'Origin': self._main_url,
+            'Origin': main_url,
             'Connection': 'keep-alive',
             'Sec-Fetch-Dest': 'empty',
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'cross-site',
-            'Pragma': 'no-cache',
-            'Cache-Control': 'no-cache',
-        }
+        },
+    )
+
+
+class Base:
+    """ Request helpers for every model, an instance only keeps references
+    to its locale config and transport """
+
+    __slots__ = ('_config', '_transport', '__weakref__')
+
+    def __init__(self, locale: str = 'en', transport: Optional[Transport] = None):
+        self._config = get_locale_config(locale)
+        self._transport = transport if transport is not None else get_transport()
+
+    @property
+    def locale(self) -> str:
+        return self._config.locale
+
+    @property
+    def _locale_code(self) -> str:
+        return self._config.code
+
+    @property
+    def _main_url(self) -> str:
+        return self._config.main_url
+
+    @property
+    def _ninja_url(self) -> str:
+        return self._config.ninja_url
+
+    @property
+    def _league_url(self) -> str:
+        return self._config.league_url
+
+    @property
+    def _today_matches_url(self) -> str:
+        return self._config.today_matches_url
+
+    @property
+    def _matches_url(self) -> str:
+        return self._config.feed_url
+
+    @property
+    def _flashscore_endpoint(self) -> str:
+        return self._config.flashscore_endpoint
+
+    @property
+    def _general_endpoint(self) -> str:
+        return self._config.general_endpoint
+
+    @property
+    def _stats_endpoint(self) -> str:
+        return self._config.stats_endpoint
+
+    @property
+    def _events_endpoint(self) -> str:
+        return self._config.events_endpoint
+
+    @property
+    def _odds_endpoint(self) -> str:
+        return self._config.odds_endpoint
+
+    @property
+    def _head2heads_endpoint(self) -> str:
+        return self._config.head2heads_endpoint
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        return self._config.headers
+
+    @property
+    def _instrumentation(self) -> Instrumentation:
+        return self._transport.instrumentation
     
-    def make_request(self, url: str) -> requests.Response:
-        return requests.get(url, headers=self._headers) 
-
-    def make_grequest(self, urls: List[str]) -> List[requests.models.Response]:
-        result = grequests.map([
-            grequests.get(url, headers=self._headers)
-            for url in urls
-        ], gtimeout=20) 
+    def make_request(self, url: str) -> 'requests.Response':
+        return self._transport.get(url, self._headers)
+
+    def make_grequest(self, urls: List[str]) -> List['requests.Response']:
+        result = self._transport.get_many(urls, self._headers)
         
         if None in result:
-            return self.make_grequest(urls)
+            raise BatchLoadError([url for url, response in zip(urls, result) if response is None])
         return result
 
     async def async_requests(self, urls: List[str]) -> List[str]:
-        async def async_request(url: str) -> str:
-            async with ClientSession() as session:
-                try:
-                    async with session.get(url, headers=self._headers, timeout=20) as response:
-                        return await response.text()
-                except asyncio.TimeoutError:
-                    async with session.get(url, headers=self._headers, timeout=20) as response:
-                        return await response.text()
-
+        # Timeouts are retried by the transport
         tasks_result = []
         async with asyncio.TaskGroup() as tg:
             for url in urls:
-                tasks_result.append(tg.create_task(async_request(url)))
+                tasks_result.append(tg.create_task(self._transport.async_get_text(url, self._headers)))
 
         return [r.result() for r in tasks_result]
     
+    async def async_make_request(self, url: str) -> str:
+        return await self._transport.async_get_text(url, self._headers)
+
     def make_async_requests(self, urls: List[str]) -> List[str]:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self.async_requests(urls))
+        return self._transport.run(self.async_requests(urls))
+    
+    async def async_batch_requests(self,
+                                   urls: List[str],
+                                   progress: Optional[Callable[[BatchProgress], None]] = None) -> List[str]:
+        return await BatchLoader(self._transport, self._headers, progress=progress).async_load(urls)
+
+    def make_batch_requests(self,
+                            urls: List[str],
+                            progress: Optional[Callable[[BatchProgress], None]] = None) -> List[str]:
+        return self._transport.run(self.async_batch_requests(urls, progress))
     
     def split_list_to_chinks(self, lst, chunk_size):
         for i in range(0, len(lst), chunk_size):
@@ -0,0 +1,159 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .transport import Transport
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class BatchLoadError(Exception):
+    def __init__(self, urls: List[str]):
+        self.urls = urls
+        super().__init__('%s url(s) failed after retries, first: %s' % (len(urls), urls[0]))
+
+
+@dataclass()
+class RetryPolicy:
+    attempts: int = 4
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+    jitter: float = 0.5
+    # Retries allowed for a whole batch, by default a tenth of its urls
+    budget: Optional[int] = None
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return delay + random.uniform(0, delay * self.jitter)
+
+    def budget_for(self, urls_count: int) -> int:
+        return self.budget if self.budget is not None else max(10, urls_count // 10)
+
+
+@dataclass()
+class BatchProgress:
+    total: int
+    done: int = 0
+    failed: int = 0
+    retries: int = 0
+    bytes: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class RetryBudget:
+    """ Retries left to the requests of one batch, shared by all of them """
+
+    def __init__(self, retries: int):
+        self.retries = retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.used >= self.retries:
+                return False
+            self.used += 1
+            return True
+
+
+class RateLimiter:
+    """ Token bucket per host, shared by every batch of a transport """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, List[float]] = {}
+
+    def reserve(self, host: str) -> float:
+        """ Takes a token and returns how long to wait before using it """
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate) - 1
+            self._buckets[host] = [tokens, now]
+        return -tokens / self.rate if tokens < 0 else 0.0
+
+    async def acquire(self, host: str) -> None:
+        delay = self.reserve(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class BatchLoader:
+    """ Fetches many urls with a concurrency cap, the transport rate limits
+    and retries them as set by `retry`, its own policy by default, the
+    whole batch sharing one retry budget """
+
+    def __init__(self,
+                 transport: 'Transport',
+                 headers: Dict[str, str],
+                 concurrency: Optional[int] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 progress: Optional[Callable[[BatchProgress], None]] = None):
+        self.transport = transport
+        self.headers = headers
+        self.concurrency = concurrency if concurrency is not None else transport.concurrency
+        self.retry = retry if retry is not None else transport.retry
+        self.progress = progress
+
+    async def async_load(self,
+                         urls: List[str],
+                         on_result: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """ Returns the responses text in `urls` order, `on_result` gets
+        each `(index, text)` as soon as it is downloaded """
+        errors = self.transport._transient_errors(asynchronous=True)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        progress = BatchProgress(total=len(urls))
+        budget = RetryBudget(self.retry.budget_for(len(urls)))
+        failed = []
+
+        async def load(index: int, url: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    result = await self.transport.async_get(url, self.headers, budget, self.retry)
+                except errors:
+                    result = None
+
+            progress.retries = budget.used
+            if result is None or result.status in RETRY_STATUSES:
+                progress.failed += 1
+                failed.append(url)
+                self._report(progress)
+                return None
+
+            progress.done += 1
+            progress.bytes += result.size
+            self._report(progress)
+            if on_result is not None:
+                on_result(index, result.text)
+            return result.text
+
+        results = await asyncio.gather(*[load(index, url) for index, url in enumerate(urls)])
+        if failed:
+            raise BatchLoadError(failed)
+        return results
+
+    def load(self, urls: List[str]) -> List[str]:
+        return self.transport.run(self.async_load(urls))
+
+    def _report(self, progress: BatchProgress) -> None:
+        if self.progress is not None:
+            self.progress(progress)
@@ -0,0 +1,184 @@
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class Cache:
+    """ Response cache interface, `ttl=None` keeps an entry forever """
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[float]]:
+        """ Returns the value with its remaining ttl """
+        return self.get(key), None
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCache(Cache):
+    """ In-memory LRU cache holding up to `maxsize` entries """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Tuple[str, Optional[float]]]' = OrderedDict()
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None, None
+
+            self._entries.move_to_end(key)
+            return value, expires_at - time.time() if expires_at is not None else None
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_with_ttl(key)[0]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl if ttl is not None else None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteCache(Cache):
+    """ Persistent cache in a single SQLite file """
+
+    def __init__(self, path: str = 'flashscore-cache.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)'
+        )
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[float]]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value, expires_at FROM responses WHERE key = ?', (key, ),
+            ).fetchone()
+        if row is None:
+            return None, None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return None, None
+        return value, expires_at - time.time() if expires_at is not None else None
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_with_ttl(key)[0]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, value, time.time() + ttl if ttl is not None else None),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM responses WHERE key = ?', (key, ))
+
+    def purge_expired(self) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(), ))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class TieredCache(Cache):
+    """ Memory LRU in front of a persistent backend """
+
+    def __init__(self, backend: Cache, memory: Optional[MemoryCache] = None):
+        self.backend = backend
+        self.memory = memory if memory is not None else MemoryCache()
+
+    def get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[float]]:
+        value, ttl = self.memory.get_with_ttl(key)
+        if value is not None:
+            return value, ttl
+
+        value, ttl = self.backend.get_with_ttl(key)
+        if value is not None:
+            self.memory.set(key, value, ttl)
+        return value, ttl
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_with_ttl(key)[0]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        self.memory.set(key, value, ttl)
+        self.backend.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        self.backend.delete(key)
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+
+class CachePolicy:
+    """ Picks a ttl by endpoint, the first matching pattern wins.
+
+    Match endpoints get a short ttl here, `Match` keeps them forever
+    once the match status is 'Ended'.
+    """
+
+    default_ttls: List[Tuple[str, Optional[float]]] = [
+        (r'://[^/]+/$', 6 * HOUR),              # main page, countries
+        (r'/archive/$', 24 * HOUR),             # league seasons
+        (r'-\d{4}(?:-\d{4})?/$', 24 * HOUR),    # past seasons pages, their ids
+        (r'/req/m_1_', 6 * HOUR),               # country leagues
+        (r'/x/feed/tr_', HOUR),                 # season matches pages
+        (r'/x/feed/f_1_', 10),                  # today and live matches
+        (r'/x/feed/(dc|df_st|df_sui|df_hh)_1_', 30),
+        (r'/pq_graphql\?', MINUTE),
+        (r'/match/', MINUTE),
+    ]
+
+    def __init__(self,
+                 ttls: Optional[List[Tuple[str, Optional[float]]]] = None,
+                 default_ttl: Optional[float] = MINUTE):
+        self.ttls = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (ttls if ttls is not None else self.default_ttls)
+        ]
+        self.default_ttl = default_ttl
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
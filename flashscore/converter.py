@@ -1,27 +1,95 @@
-from typing import Dict, List
+from itertools import repeat
+from typing import Dict, Iterator, List
+
+
+def _parse_record_slow(item: str) -> Dict[str, str]:
+    record = {}
+    for param in item.split('¬'):
+        if param == '' or param == ' ': continue
+
+        # A param that is not one key÷value or key·value pair raises ValueError
+        try:
+            key, value = param.split('÷')
+        except ValueError:
+            key, value = param.split('·')
+
+        if key in record:
+            record[key + '_2'] = value
+        else:
+            record[key] = value
+    return record
+
+
+def parse_record(item: str) -> Dict[str, str]:
+    # Fast path: the record ends with `¬`, every param splits into exactly
+    # one `key÷value` pair and no key repeats
+    if item.endswith('¬'):
+        params = item.split('¬')
+        params.pop()
+        try:
+            record = dict(map(str.split, params, repeat('÷')))
+        except ValueError:
+            pass
+        else:
+            if len(record) == len(params):
+                return record
+
+    return _parse_record_slow(item)
+
+
+# Deletes every byte but the ones of `~`, `÷` and `¬` from an utf-8 feed
+_NOT_SEPARATORS = bytes(byte for byte in range(256) if byte not in '~÷¬'.encode('utf-8'))
+_PARAM_SEPARATORS = '÷¬'.encode('utf-8')
+
+
+def _is_well_formed(gzip: str) -> bool:
+    """ Whether every param of the feed is one `key÷value` pair ended by `¬` """
+    params = gzip.count('¬')
+    if gzip.count('÷') != params: return False
+
+    # Bytes of other characters are left over only if the lengths differ
+    records = gzip.count('~')
+    separators = gzip.encode('utf-8').translate(None, _NOT_SEPARATORS)
+    if len(separators) != 4 * params + records: return False
+    return separators.replace(_PARAM_SEPARATORS, b'') == b'~' * records
+
+
+def iter_items(gzip: str) -> Iterator[str]:
+    """ Yields raw, not yet parsed records one by one while scanning the
+    feed, without splitting the whole feed up front """
+    start = 0
+    end = gzip.find('~')
+    while end != -1:
+        item = gzip[start:end]
+        if item != '' and item != ' ':
+            yield item
+        start = end + 1
+        end = gzip.find('~', start)
+
+    item = gzip[start:]
+    if item != '' and item != ' ':
+        yield item
+
+
+def iter_records(gzip: str) -> Iterator[Dict[str, str]]:
+    for item in iter_items(gzip):
+        yield parse_record(item)
 
 
 def gzip_to_json(gzip: str) -> List[Dict]:
-    items = gzip.split('~')
-    
-    json_result = []
-    for item in items:
-        if item in ['', ' ']: continue
-        item_params = item.split('¬')
-        item_data = {}
-        
-        for param in item_params:
-            if param in ['', ' ']: continue
-            
-            try:
-                key, value = param.split('÷')
-            except Exception:
-                key, value = param.split('·')
-            
-            if item_data.get(key) is None:
-                item_data[key] = value
-            else:
-                item_data[f'{key}_2'] = value
-        
-        json_result.append(item_data)
-    return json_result
+    """ Parses `~` separated records of `¬` separated `key÷value` pairs,
+    a repeated key is stored a second time as `key_2` """
+    if not _is_well_formed(gzip):
+        return [parse_record(item) for item in gzip.split('~') if item != '' and item != ' ']
+
+    # Keys and values alternate once both separators are the same
+    records = []
+    for item in gzip.split('~'):
+        if item == '' or item == ' ': continue
+        parts = item.replace('¬', '÷').split('÷')
+        record = dict(zip(parts[0::2], parts[1::2]))
+        # Unterminated last fields and repeated keys are left to parse_record
+        if parts[-1] != '' or 2 * len(record) != len(parts) - 1:
+            record = parse_record(item)
+        records.append(record)
+    return records
@@ -4,12 +4,19 @@ from flashscore import converter
 
 from .base import Base
 from .league import League
+from .transport import Transport
 
 
 class Country(Base):
-    def __init__(self, id: int, name: str, url: str, locale: Optional[str] = 'en'):
-        self.locale = locale
-        super().__init__(self.locale)
+    __slots__ = ('id', 'name', 'url', 'leagues')
+
+    def __init__(self,
+                 id: int,
+                 name: str,
+                 url: str,
+                 locale: Optional[str] = 'en',
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
         
         self.id = id
         self.name = name
@@ -24,9 +31,8 @@ class Country(Base):
             self.url,
         )
 
-    def get_leagues(self): 
-        flashscore_api_gzip = self.make_request(self._league_url + str(self.id))
-        flashscore_api_json = converter.gzip_to_json(flashscore_api_gzip.text)
+    def _parse_leagues(self, flashscore_api_gzip: str) -> List[League]:
+        flashscore_api_json = converter.gzip_to_json(flashscore_api_gzip)
         
         return sorted([
             League(
@@ -36,7 +42,15 @@ class Country(Base):
                 country_id=self.id,
                 api_endpoint=league['MT'],
                 country_name=self.name,
+                locale=self.locale,
+                transport=self._transport,
             )  
             for league in flashscore_api_json
             if 'MN' in league.keys()
         ], key=lambda league: league.name)
+
+    def get_leagues(self) -> List[League]:
+        return self._parse_leagues(self.make_request(self._league_url + str(self.id)).text)
+
+    async def async_get_leagues(self) -> List[League]:
+        return self._parse_leagues(await self.async_make_request(self._league_url + str(self.id)))
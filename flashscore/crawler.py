@@ -0,0 +1,277 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .api import FlashscoreApi
+from .base import Base
+from .batch import BatchProgress
+from .match import Match, async_load_matches
+from .pipeline import ParsePool
+from .season import Season
+from .transport import Transport
+
+
+class CrawlCheckpoint:
+    """ SQLite store of crawled match ids and fully crawled seasons """
+
+    def __init__(self, path: str = 'flashscore-crawl.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS matches ('
+            'id TEXT PRIMARY KEY, season TEXT NOT NULL, completed_at REAL NOT NULL)'
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS seasons ('
+            'key TEXT PRIMARY KEY, completed_at REAL NOT NULL)'
+        )
+
+    def completed_matches(self, season: Optional[str] = None) -> Set[str]:
+        with self._lock:
+            if season is None:
+                rows = self._connection.execute('SELECT id FROM matches')
+            else:
+                rows = self._connection.execute('SELECT id FROM matches WHERE season = ?', (season, ))
+            return {id for id, in rows}
+
+    def completed_seasons(self) -> Set[str]:
+        with self._lock:
+            return {key for key, in self._connection.execute('SELECT key FROM seasons')}
+
+    def complete_matches(self, matches_ids: Iterable[str], season: str) -> None:
+        completed_at = time.time()
+        with self._lock:
+            self._connection.execute('BEGIN')
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO matches (id, season, completed_at) VALUES (?, ?, ?)',
+                [(id, season, completed_at) for id in matches_ids],
+            )
+            self._connection.execute('COMMIT')
+
+    def complete_season(self, season: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO seasons (key, completed_at) VALUES (?, ?)', (season, time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+@dataclass()
+class CrawlStats:
+    seasons: int = 0
+    seasons_done: int = 0
+    seasons_failed: int = 0
+    matches: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # Last error of every country, league or season key that failed
+    errors: Dict[str, str] = field(default_factory=dict)
+    requests: int = 0
+    bytes: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def matches_per_second(self) -> float:
+        return self.matches / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return '%d/%d seasons (%d failed), %d matches (%d skipped, %d failed), %.1f matches/s, %.1f KiB/s' % (
+            self.seasons_done, self.seasons, self.seasons_failed, self.matches, self.skipped, self.failed,
+            self.matches_per_second, self.bytes_per_second / 1024,
+        )
+
+
+def season_key(season: Season) -> str:
+    return '%s/%s/%s' % (season.country_id, season.league_id, season.id)
+
+
+def _matches_filter(values: Optional[Iterable[str]]) -> Optional[Set[str]]:
+    return {str(value).lower() for value in values} if values is not None else None
+
+
+class Crawler(Base):
+    """ Crawls every match of the selected countries, leagues and seasons.
+
+    Seasons are put on a queue consumed by `workers` coroutines, each one
+    loads its season matches `chunk_size` at a time. Crawled match ids are
+    checkpointed after every chunk, so an interrupted crawl started again
+    with the same checkpoint skips everything already done. A listing or
+    chunk that fails is recorded in `stats.errors` and left to the next run
+    while the crawl goes on. `on_matches` receives every loaded chunk, for
+    example `ColumnarExporter.write`, with a `parse_pool` the payloads are
+    parsed in worker processes.
+
+        crawler = Crawler(countries=['England'], leagues=['Premier League'],
+                          sections=['general', 'stats'], on_matches=exporter.write)
+        stats = crawler.run()
+    """
+
+    def __init__(self,
+                 countries: Optional[Iterable[str]] = None,
+                 leagues: Optional[Iterable[str]] = None,
+                 seasons: Optional[Iterable[str]] = None,
+                 sections: Optional[List[str]] = None,
+                 workers: int = 4,
+                 chunk_size: int = 200,
+                 checkpoint: Optional[CrawlCheckpoint] = None,
+                 on_matches: Optional[Callable[[List[Match]], None]] = None,
+                 on_progress: Optional[Callable[[CrawlStats], None]] = None,
+                 parse_pool: Optional[ParsePool] = None,
+                 locale: str = 'en',
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
+
+        # Countries and leagues are matched by name or id, seasons by title or id
+        self.countries = _matches_filter(countries)
+        self.leagues = _matches_filter(leagues)
+        self.seasons = _matches_filter(seasons)
+        self.sections = sections
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.checkpoint = checkpoint if checkpoint is not None else CrawlCheckpoint()
+        self.on_matches = on_matches
+        self.on_progress = on_progress
+        self.parse_pool = parse_pool
+        self.stats = CrawlStats()
+
+    def _selected(self, selection: Optional[Set[str]], *values) -> bool:
+        return selection is None or any(str(value).lower() in selection for value in values)
+
+    def _failed(self, key: str, error: BaseException) -> None:
+        self.stats.errors[key] = '%s: %s' % (type(error).__name__, error)
+
+    async def _gather(self, keys: List[str], coroutines: List[Any]) -> List[Any]:
+        """ Results of `coroutines`, the ones that failed are recorded under
+        their key and left out """
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                self._failed(key, result)
+            elif isinstance(result, BaseException):
+                raise result
+        return [result for result in results if not isinstance(result, BaseException)]
+
+    async def async_get_seasons(self) -> List[Season]:
+        """ Expands the selection into the seasons to crawl """
+        api = FlashscoreApi(self.locale, self._transport)
+        countries = [
+            country for country in await api.async_get_countries()
+            if self._selected(self.countries, country.id, country.name)
+        ]
+
+        leagues = [
+            league
+            for country_leagues in await self._gather(
+                [str(country.id) for country in countries],
+                [country.async_get_leagues() for country in countries],
+            )
+            for league in country_leagues
+            if self._selected(self.leagues, league.id, league.name)
+        ]
+        return [
+            season
+            for league_seasons in await self._gather(
+                ['%s/%s' % (league.country_id, league.id) for league in leagues],
+                [league.async_get_seasons() for league in leagues],
+            )
+            for season in league_seasons
+            if self._selected(self.seasons, season.id, season.title)
+        ]
+
+    def _on_batch_progress(self) -> Callable[[BatchProgress], None]:
+        reported = BatchProgress(total=0)
+
+        def on_batch_progress(progress: BatchProgress) -> None:
+            self.stats.requests += progress.done - reported.done
+            self.stats.bytes += progress.bytes - reported.bytes
+            reported.done, reported.bytes = progress.done, progress.bytes
+
+        return on_batch_progress
+
+    async def _crawl_season(self, season: Season) -> None:
+        key = season_key(season)
+        try:
+            matches = await season.async_get_matches()
+        except Exception as error:
+            self._failed(key, error)
+            self.stats.seasons_failed += 1
+            self._report()
+            return
+
+        completed = self.checkpoint.completed_matches(key)
+        matches = [match for match in matches if match.id not in completed]
+        self.stats.skipped += len(completed)
+
+        failed = False
+        for i in range(0, len(matches), self.chunk_size):
+            chunk = matches[i:i + self.chunk_size]
+            try:
+                if self.parse_pool is not None:
+                    await self.parse_pool.async_load_matches(chunk, self.sections, self._on_batch_progress())
+                else:
+                    await async_load_matches(chunk, self.sections, self._on_batch_progress())
+            except Exception as error:
+                # Left out of the checkpoint, the next run retries them
+                self._failed(key, error)
+                self.stats.failed += len(chunk)
+                failed = True
+                continue
+
+            if self.on_matches is not None:
+                self.on_matches(chunk)
+            self.checkpoint.complete_matches([match.id for match in chunk], key)
+            self.stats.matches += len(chunk)
+            self._report()
+
+        if failed:
+            self.stats.seasons_failed += 1
+        else:
+            self.checkpoint.complete_season(key)
+            self.stats.seasons_done += 1
+        self._report()
+
+    async def _worker(self, queue: 'asyncio.Queue[Season]') -> None:
+        while True:
+            try:
+                season = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._crawl_season(season)
+
+    def _report(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.stats)
+
+    async def async_run(self) -> CrawlStats:
+        self.stats = CrawlStats()
+        completed_seasons = self.checkpoint.completed_seasons()
+
+        queue: 'asyncio.Queue[Season]' = asyncio.Queue()
+        for season in await self.async_get_seasons():
+            if season_key(season) in completed_seasons: continue
+            queue.put_nowait(season)
+        self.stats.seasons = queue.qsize()
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(self.workers):
+                tg.create_task(self._worker(queue))
+        return self.stats
+
+    def run(self) -> CrawlStats:
+        return self._transport.run(self.async_run())
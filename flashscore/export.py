@@ -0,0 +1,275 @@
+import csv
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .match import Match, load_matches
+
+
+# Columns of every exported table with their arrow type names
+TABLES: Dict[str, List[Tuple[str, str]]] = {
+    'matches': [
+        ('id', 'string'),
+        ('timestamp', 'int64'),
+        ('date', 'timestamp'),
+        ('country_name', 'string'),
+        ('league_name', 'string'),
+        ('tournament', 'string'),
+        ('home_team_name', 'string'),
+        ('away_team_name', 'string'),
+        ('home_team_score', 'int64'),
+        ('away_team_score', 'int64'),
+        ('final_total_score', 'string'),
+        ('status', 'string'),
+    ],
+    'stats': [
+        ('match_id', 'string'),
+        ('period', 'string'),
+        ('name', 'string'),
+        ('home', 'string'),
+        ('away', 'string'),
+    ],
+    'events': [
+        ('match_id', 'string'),
+        ('position', 'int64'),
+        ('type', 'string'),
+        ('time', 'string'),
+        ('player_name', 'string'),
+        ('player_url', 'string'),
+        ('second_player_name', 'string'),
+        ('second_player_url', 'string'),
+        ('current_score', 'string'),
+        ('description', 'string'),
+    ],
+    'history_matches': [
+        ('match_id', 'string'),
+        ('kind', 'string'),
+        ('id', 'string'),
+        ('timestamp', 'int64'),
+        ('date', 'timestamp'),
+        ('home_team_name', 'string'),
+        ('home_team_score', 'int64'),
+        ('away_team_name', 'string'),
+        ('away_team_score', 'int64'),
+        ('league_name', 'string'),
+        ('country', 'string'),
+        ('final_total_score', 'string'),
+        ('main_team', 'string'),
+        ('result_for_main_team', 'string'),
+    ],
+    'odds': [
+        ('match_id', 'string'),
+        ('home', 'float64'),
+        ('draw', 'float64'),
+        ('away', 'float64'),
+    ],
+}
+
+FORMATS = ('csv', 'parquet', 'arrow')
+
+STATS_PERIODS = (
+    ('Match', '_stats_match'),
+    ('1st Half', '_stats_first_half'),
+    ('2nd Half', '_stats_second_half'),
+)
+HISTORY_KINDS = (
+    ('home', '_home_matches'),
+    ('away', '_away_matches'),
+    ('head2head', '_head2head_matches'),
+)
+
+
+def iter_rows(match: Match) -> Iterator[Tuple[str, tuple]]:
+    """ Yields `(table, row)` for every loaded section of the match,
+    reading backing fields so nothing is fetched """
+    yield 'matches', (
+        match.id,
+        match._timestamp,
+        match._date,
+        match.country_name,
+        match.league_name,
+        match._tournament,
+        match._home_team_name,
+        match._away_team_name,
+        match._home_team_score,
+        match._away_team_score,
+        match._final_total_score,
+        match._status,
+    )
+
+    if match._is_loaded('stats'):
+        for period, attribute in STATS_PERIODS:
+            for stats in getattr(match, attribute) or []:
+                yield 'stats', (
+                    match.id, period, stats.name,
+                    stats.raw_home if stats.raw_home is not None else str(stats.home),
+                    stats.raw_away if stats.raw_away is not None else str(stats.away),
+                )
+
+    if match._is_loaded('events'):
+        for position, event in enumerate(match._events or []):
+            yield 'events', (
+                match.id, position, event.type, event.time,
+                event.player_name, event.player_url,
+                event.second_player_name, event.second_player_url,
+                event.current_score, event.description,
+            )
+
+    if match._is_loaded('head2heads'):
+        for kind, attribute in HISTORY_KINDS:
+            for history in getattr(match, attribute) or []:
+                yield 'history_matches', (
+                    match.id, kind, history.id, history.timestamp, history.date,
+                    history.home_team_name, history.home_team_score,
+                    history.away_team_name, history.away_team_score,
+                    history.league_name, history.country, history.final_total_score,
+                    history.main_team, history.result_for_main_team,
+                )
+
+    if match._is_loaded('odds'):
+        yield 'odds', (
+            match.id, match._prematch_home_odds, match._prematch_middle_odds, match._prematch_away_odds,
+        )
+
+
+class _CSVWriter:
+    def __init__(self, path: str, columns: List[str]):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows: List[tuple]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowWriter:
+    def __init__(self, path: str, columns: List[Tuple[str, str]], format: str):
+        # pyarrow is optional, only needed for parquet and arrow output
+        import pyarrow
+        arrow_types = {
+            'string': pyarrow.string(),
+            'int64': pyarrow.int64(),
+            'float64': pyarrow.float64(),
+            'timestamp': pyarrow.timestamp('s'),
+        }
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(name, arrow_types[type]) for name, type in columns])
+        if format == 'parquet':
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pyarrow.ipc.new_file(path, self._schema)
+
+    def write(self, rows: List[tuple]) -> None:
+        columns = [list(column) for column in zip(*rows)]
+        batch = self._pyarrow.record_batch(
+            [self._pyarrow.array(column, type=field.type) for column, field in zip(columns, self._schema)],
+            schema=self._schema,
+        )
+        if hasattr(self._writer, 'write_batch'):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ColumnarExporter:
+    """ Writes matches into one file per table (matches, stats, events,
+    history_matches, odds) in `directory`.
+
+    Rows are buffered per table and flushed every `chunk_size` rows, so
+    exporting a stream of matches keeps memory flat.
+
+        with ColumnarExporter('premier-league', format='parquet') as exporter:
+            exporter.write(season.get_matches_with_alreday_loaded_content())
+    """
+
+    def __init__(self, directory: str, format: str = 'csv', chunk_size: int = 10000):
+        if format not in FORMATS:
+            raise ValueError("Unknown format '%s', expected one of %s" % (format, ', '.join(FORMATS)))
+
+        self.directory = directory
+        self.format = format
+        self.chunk_size = chunk_size
+        self.rows_written = {table: 0 for table in TABLES}
+        self._rows: Dict[str, List[tuple]] = {table: [] for table in TABLES}
+        self._writers: Dict[str, Any] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, table: str) -> str:
+        extension = 'feather' if self.format == 'arrow' else self.format
+        return os.path.join(self.directory, '%s.%s' % (table, extension))
+
+    def _writer(self, table: str) -> Any:
+        writer = self._writers.get(table)
+        if writer is None:
+            if self.format == 'csv':
+                writer = _CSVWriter(self.path(table), [name for name, _ in TABLES[table]])
+            else:
+                writer = _ArrowWriter(self.path(table), TABLES[table], self.format)
+            self._writers[table] = writer
+        return writer
+
+    def _flush(self, table: str) -> None:
+        rows = self._rows[table]
+        if not rows: return
+        self._writer(table).write(rows)
+        self.rows_written[table] += len(rows)
+        self._rows[table] = []
+
+    def write(self, matches: Iterable[Match]) -> None:
+        for match in matches:
+            for table, row in iter_rows(match):
+                rows = self._rows[table]
+                rows.append(row)
+                if len(rows) >= self.chunk_size:
+                    self._flush(table)
+
+    def close(self) -> None:
+        for table in TABLES:
+            self._flush(table)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    def __enter__(self) -> 'ColumnarExporter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _chunks(matches: Iterable[Match], size: int) -> Iterator[List[Match]]:
+    chunk = []
+    for match in matches:
+        chunk.append(match)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def export_matches(matches: Iterable[Match],
+                   directory: str,
+                   format: str = 'csv',
+                   sections: Optional[List[str]] = None,
+                   load_chunk_size: int = 500,
+                   chunk_size: int = 10000) -> Dict[str, int]:
+    """ Exports `matches` and returns the number of rows per table.
+
+    With `sections` the matches are loaded `load_chunk_size` at a time and
+    each chunk is written before the next one is fetched, otherwise only
+    already loaded sections are exported.
+    """
+    with ColumnarExporter(directory, format, chunk_size) as exporter:
+        for chunk in _chunks(matches, load_chunk_size):
+            if sections is not None:
+                load_matches(chunk, sections)
+            exporter.write(chunk)
+    return exporter.rows_written
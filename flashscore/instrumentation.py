@@ -0,0 +1,331 @@
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Endpoint label of every url, the first matching pattern wins
+ENDPOINTS = [
+    ('main', r'://[^/]+/$'),
+    ('archive', r'/archive/$'),
+    ('leagues', r'/req/m_1_'),
+    ('season', r'/x/feed/tr_'),
+    ('feed', r'/x/feed/f_1_'),
+    ('general', r'/x/feed/dc_1_'),
+    ('stats', r'/x/feed/df_st_1_'),
+    ('events', r'/x/feed/df_sui_1_'),
+    ('head2heads', r'/x/feed/df_hh_1_'),
+    ('odds', r'/pq_graphql\?'),
+    ('names', r'/match/'),
+]
+ENDPOINTS_PATTERNS = [(name, re.compile(pattern)) for name, pattern in ENDPOINTS]
+
+
+def endpoint_for(url: str) -> str:
+    for name, pattern in ENDPOINTS_PATTERNS:
+        if pattern.search(url):
+            return name
+    return 'other'
+
+
+@dataclass()
+class RequestEvent:
+    url: str
+    endpoint: str
+    # Wall clock start and duration in seconds
+    started_at: float
+    elapsed: float
+    status: Optional[int] = None
+    bytes: int = 0
+    cached: bool = False
+    error: Optional[str] = None
+    # Answered 304, saved_bytes counts the body it did not download and the
+    # bytes compression saved otherwise
+    not_modified: bool = False
+    saved_bytes: int = 0
+    # Phases, dns and connect only on the async path and None when a pooled
+    # connection was reused, connect includes dns
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+
+
+@dataclass()
+class RetryEvent:
+    url: str
+    endpoint: str
+    attempt: int
+    delay: float
+    status: Optional[int] = None
+
+
+@dataclass()
+class ParseEvent:
+    section: str
+    match_id: str
+    started_at: float
+    elapsed: float
+    bytes: int = 0
+    error: Optional[str] = None
+
+
+class Instrumentation:
+    """ Receives request, retry and parse events, the base class ignores
+    them and, being disabled, is never even called with one """
+
+    enabled = False
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        pass
+
+    def on_parse(self, event: ParseEvent) -> None:
+        pass
+
+
+class MultiInstrumentation(Instrumentation):
+    enabled = True
+
+    def __init__(self, *instrumentations: Instrumentation):
+        self.instrumentations = [
+            instrumentation for instrumentation in instrumentations if instrumentation.enabled
+        ]
+
+    def on_request(self, event: RequestEvent) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_request(event)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_retry(event)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_parse(event)
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return '%.1fms' % (seconds * 1000) if seconds is not None else '-'
+
+
+class LoggingInstrumentation(Instrumentation):
+    """ Logs every event to the `flashscore` logger at `level` """
+
+    enabled = True
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger if logger is not None else logging.getLogger('flashscore')
+        self.level = level
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.logger.log(
+            self.level, 'GET %s %s %s %d bytes (%d saved) in %s (dns %s, connect %s, ttfb %s)%s%s',
+            event.endpoint, event.url, event.error or event.status, event.bytes, event.saved_bytes,
+            _ms(event.elapsed), _ms(event.dns), _ms(event.connect), _ms(event.ttfb),
+            ' cached' if event.cached else '', ' not modified' if event.not_modified else '',
+        )
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self.logger.log(
+            self.level, 'Retry %d of %s %s after %s, status %s',
+            event.attempt, event.endpoint, event.url, _ms(event.delay), event.status,
+        )
+
+    def on_parse(self, event: ParseEvent) -> None:
+        self.logger.log(
+            self.level, 'Parsed %s of %s, %d bytes in %s%s',
+            event.section, event.match_id, event.bytes, _ms(event.elapsed),
+            ', failed: %s' % event.error if event.error else '',
+        )
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(str(labels[label]) for label in self.labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s counter' % self.name]
+        for key, value in sorted(self.values.items()):
+            lines.append('%s%s %s' % (self.name, _labels(self.labels, key), _number(value)))
+        return lines
+
+
+class Histogram:
+    default_buckets = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Optional[Sequence[float]] = None):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets if buckets is not None else self.default_buckets)
+        # Per labels: counts per bucket, sum and count
+        self.values: Dict[Tuple[str, ...], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[label]) for label in self.labels)
+        with self._lock:
+            counts, total, count = self.values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bucket in enumerate(self.buckets):
+                if value <= bucket:
+                    counts[i] += 1
+            self.values[key] = [counts, total + value, count + 1]
+
+    def render(self) -> List[str]:
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s histogram' % self.name]
+        for key, (counts, total, count) in sorted(self.values.items()):
+            for bucket, bucket_count in zip(self.buckets, counts):
+                lines.append('%s_bucket%s %d' % (
+                    self.name, _labels(self.labels + ('le', ), key + (_number(bucket), )), bucket_count,
+                ))
+            lines.append('%s_bucket%s %d' % (self.name, _labels(self.labels + ('le', ), key + ('+Inf', )), count))
+            lines.append('%s_sum%s %s' % (self.name, _labels(self.labels, key), _number(total)))
+            lines.append('%s_count%s %d' % (self.name, _labels(self.labels, key), count))
+        return lines
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (name, value.replace('"', '\\"')) for name, value in zip(names, values))
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class MetricsRegistry:
+    """ Minimal Prometheus-style registry, `render()` returns the text
+    exposition format to serve on a /metrics endpoint """
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self.metrics.setdefault(name, Counter(name, help, labels))
+
+    def histogram(self,
+                  name: str,
+                  help: str,
+                  labels: Sequence[str] = (),
+                  buckets: Optional[Sequence[float]] = None) -> Histogram:
+        return self.metrics.setdefault(name, Histogram(name, help, labels, buckets))
+
+    def render(self) -> str:
+        return '\n'.join(line for metric in self.metrics.values() for line in metric.render()) + '\n'
+
+
+class PrometheusInstrumentation(Instrumentation):
+    enabled = True
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.requests = self.registry.counter(
+            'flashscore_requests_total', 'Requests by endpoint and status', ('endpoint', 'status', 'cached'),
+        )
+        self.request_seconds = self.registry.histogram(
+            'flashscore_request_seconds', 'Request duration', ('endpoint', ),
+        )
+        self.request_phase_seconds = self.registry.histogram(
+            'flashscore_request_phase_seconds', 'DNS, connect and time to first byte', ('phase', ),
+        )
+        self.response_bytes = self.registry.counter(
+            'flashscore_response_bytes_total', 'Downloaded bytes', ('endpoint', ),
+        )
+        self.saved_bytes = self.registry.counter(
+            'flashscore_saved_bytes_total', 'Bytes saved by 304 responses and compression', ('endpoint', ),
+        )
+        self.retries = self.registry.counter(
+            'flashscore_retries_total', 'Retried requests', ('endpoint', ),
+        )
+        self.parse_seconds = self.registry.histogram(
+            'flashscore_parse_seconds', 'Parse duration by section', ('section', ),
+        )
+        self.parse_errors = self.registry.counter(
+            'flashscore_parse_errors_total', 'Failed parses by section', ('section', ),
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.requests.inc(
+            endpoint=event.endpoint,
+            status=event.status if event.error is None else 'error',
+            cached=str(event.cached).lower(),
+        )
+        self.request_seconds.observe(event.elapsed, endpoint=event.endpoint)
+        self.response_bytes.inc(event.bytes, endpoint=event.endpoint)
+        if event.saved_bytes:
+            self.saved_bytes.inc(event.saved_bytes, endpoint=event.endpoint)
+        for phase in ('dns', 'connect', 'ttfb'):
+            value = getattr(event, phase)
+            if value is not None:
+                self.request_phase_seconds.observe(value, phase=phase)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self.retries.inc(endpoint=event.endpoint)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        self.parse_seconds.observe(event.elapsed, section=event.section)
+        if event.error is not None:
+            self.parse_errors.inc(section=event.section)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """ Records every request and parse as an OpenTelemetry span, needs
+    the `opentelemetry-api` package """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            from opentelemetry import trace
+            tracer = trace.get_tracer('flashscore')
+        self.tracer = tracer
+
+    def _span(self, name: str, started_at: float, elapsed: float, attributes: Dict[str, Any]) -> None:
+        attributes = {key: value for key, value in attributes.items() if value is not None}
+        span = self.tracer.start_span(name, start_time=int(started_at * 1e9), attributes=attributes)
+        span.end(end_time=int((started_at + elapsed) * 1e9))
+
+    def on_request(self, event: RequestEvent) -> None:
+        self._span('GET %s' % event.endpoint, event.started_at, event.elapsed, {
+            'http.request.method': 'GET',
+            'url.full': event.url,
+            'http.response.status_code': event.status,
+            'flashscore.endpoint': event.endpoint,
+            'flashscore.bytes': event.bytes,
+            'flashscore.cached': event.cached,
+            'flashscore.not_modified': event.not_modified,
+            'flashscore.saved_bytes': event.saved_bytes,
+            'flashscore.dns': event.dns,
+            'flashscore.connect': event.connect,
+            'flashscore.ttfb': event.ttfb,
+            'error.type': event.error,
+        })
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._span('retry %s' % event.endpoint, time.time(), 0, {
+            'url.full': event.url,
+            'http.response.status_code': event.status,
+            'flashscore.attempt': event.attempt,
+            'flashscore.delay': event.delay,
+        })
+
+    def on_parse(self, event: ParseEvent) -> None:
+        self._span('parse %s' % event.section, event.started_at, event.elapsed, {
+            'flashscore.match_id': event.match_id,
+            'flashscore.bytes': event.bytes,
+            'error.type': event.error,
+        })
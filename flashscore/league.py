@@ -1,9 +1,38 @@
-from typing import Optional
+import re
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
 from .base import Base
-from .season import Season
+from .season import Season, Seasons
+from .transport import Transport
+
+
+ARCHIVE_SEASON_PATTERN = re.compile(
+    r'class="archive__season"[^>]*>\s*<a[^>]*href="(?P<url>[^"]+)"[^>]*>(?P<name>[^<]+)</a>'
+)
+SEASON_TITLE_PATTERN = re.compile(r'(\d{4}(?:/\d{4})?)\s*$')
+# Season id of the page config, `season_id = 176` or `"seasonId":"176"`
+SEASON_ID_PATTERN = re.compile(r'season_?[Ii]d["\']?\s*[:=]\s*["\']?(\d+)')
+
+
+# Season ids by season page url per transport, an id never changes so each
+# season page is read once, see League._seasons_ids
+_seasons_ids: 'weakref.WeakKeyDictionary[Transport, Dict[str, int]]' = weakref.WeakKeyDictionary()
+_seasons_ids_lock = threading.Lock()
+
+
+class SeasonsParseError(ValueError):
+    """ The archive or a season page of a league could not be parsed """
+
+    def __init__(self, url: str, reason: str):
+        self.url = url
+        super().__init__('%s: %s' % (reason, url))
 
 
 class League(Base):
+    __slots__ = ('id', 'name', 'url', 'country_id', 'country_name', 'api_endpoint', '_seasons')
+
     def __init__(self,
                  id: str,
                  name: str,
@@ -11,17 +40,18 @@ class League(Base):
                  country_id: int,
                  country_name: str,
                  api_endpoint: str,
-                 locale: Optional[str] = 'en'):
-        self.locale = locale
-        super().__init__(self.locale)
-        
+                 locale: Optional[str] = 'en',
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
+
         self.id = id
         self.name = name
         self.url = url
         self.country_id = country_id
         self.country_name = country_name
         self.api_endpoint = api_endpoint
-        
+        self._seasons: Optional[Seasons] = None
+
     def __repr__(self) -> str:
         return "%s(id='%s', name='%s', url='%s')" % (
             self.__class__.__name__,
@@ -30,32 +60,83 @@ class League(Base):
             self.url,
         )
 
-    def get_seasons(self):
-        """ Unfortunately only hardcoding """
-        seasons_ids = [
-            183, 176, 172, 171, 170, 169, 168, 167, 165, 160, 137, 81, 80, 64,
-            5, 4, 11, 12, 13, 14, 15, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28,
-            29, 30, 31, 32,
-        ]
-        
-        seasons_titles = [
-            "2023/2024", "2022/2023", "2021/2022", "2020/2021", "2019/2020",
-            "2018/2019", "2017/2018", "2016/2017", "2015/2016", "2014/2015",
-            "2013/2014", "2012/2013", "2011/2012", "2010/2011", "2009/2010",
-            "2008/2009", "2007/2008", "2006/2007", "2005/2006", "2004/2005",
-            "2003/2004", "2002/2003", "2001/2002", "2000/2001", "1999/2000",
-            "1998/1999", "1997/1998", "1996/1997", "1995/1996", "1994/1995",
-            "1993/1994", "1992/1993", "1991/1992", "1990/1991", "1989/1990",
-        ]
-        
-        return [
-            Season(
-                id=id,
-                title=title,
-                country_id=self.country_id,
-                league_id=self.id,
-                country_name=self.country_name,
-                league_name=self.name,
-            )
-            for id, title in zip(seasons_ids, seasons_titles)
-        ]
+    @property
+    def _archive_url(self) -> str:
+        return self.url + 'archive/'
+
+    def _parse_archive(self, archive_html: str) -> List[Tuple[str, str]]:
+        """ Returns `(title, url)` of every season listed in the archive """
+        seasons = []
+        for season in ARCHIVE_SEASON_PATTERN.finditer(archive_html):
+            title = SEASON_TITLE_PATTERN.search(season['name'])
+            if title is None:
+                raise SeasonsParseError(self._archive_url, "No title in season '%s'" % season['name'].strip())
+            seasons.append((title.group(1), self._main_url + season['url'].lstrip('/')))
+        if not seasons:
+            raise SeasonsParseError(self._archive_url, 'No season in the archive')
+        return seasons
+
+    def _parse_season_id(self, url: str, season_html: str) -> int:
+        season_id = SEASON_ID_PATTERN.search(season_html)
+        if season_id is None:
+            raise SeasonsParseError(url, 'No season id in the season page')
+        return int(season_id.group(1))
+
+    def _create_season(self, id: int, title: str) -> Season:
+        return Season(
+            id=id,
+            title=title,
+            country_id=self.country_id,
+            league_id=self.id,
+            country_name=self.country_name,
+            league_name=self.name,
+            locale=self.locale,
+            transport=self._transport,
+        )
+
+    def _seasons_ids(self) -> Dict[str, int]:
+        with _seasons_ids_lock:
+            seasons_ids = _seasons_ids.get(self._transport)
+            if seasons_ids is None:
+                seasons_ids = _seasons_ids[self._transport] = {}
+            return seasons_ids
+
+    def _missing_pages(self, archive: List[Tuple[str, str]]) -> List[str]:
+        """ Urls of the season pages whose id is not known yet """
+        seasons_ids = self._seasons_ids()
+        return [url for _, url in archive if url not in seasons_ids]
+
+    def _create_seasons(self, archive: List[Tuple[str, str]], urls: List[str], pages: List[str]) -> List[Season]:
+        seasons_ids = self._seasons_ids()
+        parsed = {url: self._parse_season_id(url, page) for url, page in zip(urls, pages)}
+        with _seasons_ids_lock:
+            seasons_ids.update(parsed)
+        return [self._create_season(seasons_ids[url], title) for title, url in archive]
+
+    def _load_seasons(self) -> List[Season]:
+        archive = self._parse_archive(self.make_request(self._archive_url).text)
+        urls = self._missing_pages(archive)
+        pages = [response.text for response in self.make_grequest(urls)] if urls else []
+        return self._create_seasons(archive, urls, pages)
+
+    async def _async_load_seasons(self) -> List[Season]:
+        archive = self._parse_archive(await self.async_make_request(self._archive_url))
+        urls = self._missing_pages(archive)
+        pages = await self.async_requests(urls) if urls else []
+        return self._create_seasons(archive, urls, pages)
+
+    def get_seasons(self) -> Seasons:
+        """ Seasons listed in the league archive, fetched on first access.
+
+        Ids are read from the season pages, each one once per transport,
+        raises `SeasonsParseError` when the archive or one of the pages can
+        not be parsed.
+        """
+        if self._seasons is None:
+            self._seasons = Seasons(self._load_seasons)
+        return self._seasons
+
+    async def async_get_seasons(self) -> Seasons:
+        if self._seasons is None or not self._seasons.loaded:
+            self._seasons = Seasons.from_list(await self._async_load_seasons())
+        return self._seasons
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from . import converter
+from .base import Base
+from .match import Event, Match, async_load_matches, get_match
+from .transport import Transport
+
+
+TRACKED_FIELDS = ('status', 'home_team_score', 'away_team_score', 'final_total_score')
+
+
+@dataclass()
+class LiveUpdate:
+    match: Match
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    new_events: List[Event] = field(default_factory=list)
+
+
+class LiveTracker(Base):
+    """ Follows live matches by polling today's feed and emitting only what
+    changed since the previous poll.
+
+    Flashscore has no public delta feed, so each poll downloads `f_1_0` but
+    only records whose raw text differs from the previous snapshot are
+    parsed, and events are fetched only for matches that changed. A feed
+    answered 304 by the transport is not even split into records.
+    """
+
+    def __init__(self,
+                 locale: str = 'en',
+                 interval: float = 5.0,
+                 track_events: bool = True,
+                 on_update: Optional[Callable[[LiveUpdate], None]] = None,
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
+
+        self.interval = interval
+        self.track_events = track_events
+        self.on_update = on_update
+        self.matches: Dict[str, Match] = {}
+        self._items: Dict[str, str] = {}
+        self._feed: Optional[str] = None
+
+    def _diff(self, today_matches_gzip: str) -> List[LiveUpdate]:
+        updates = []
+        items = {}
+        header_item, header = None, None
+        for item in converter.iter_items(today_matches_gzip):
+            if item.startswith('ZA÷'):
+                header_item, header = item, None
+                continue
+
+            match_id = self._match_id(item)
+            if match_id is None: continue
+            items[match_id] = item
+            if self._items.get(match_id) == item: continue
+
+            record = converter.parse_record(item)
+            match = self.matches.get(match_id)
+            if match is None:
+                # Only live matches are picked up, tracked ones are followed
+                # until their final status or until they leave the feed
+                if record.get('AB') != '2': continue
+                match = get_match(match_id, locale=self.locale, transport=self._transport)
+                self.matches[match_id] = match
+
+            if header is None and header_item is not None:
+                header = converter.parse_record(header_item)
+
+            before = {name: getattr(match, '_' + name, None) for name in TRACKED_FIELDS}
+            match._load_feed_record(record, header)
+            changes = {
+                name: (before[name], getattr(match, '_' + name))
+                for name in TRACKED_FIELDS
+                if before[name] != getattr(match, '_' + name)
+            }
+            if changes:
+                updates.append(LiveUpdate(match=match, changes=changes))
+
+        self._items = items
+        for update in updates:
+            if update.match._status != 'Live':
+                self.matches.pop(update.match.id, None)
+        # Postponed, abandoned or otherwise gone from the feed
+        for match_id in [match_id for match_id in self.matches if match_id not in items]:
+            del self.matches[match_id]
+        return updates
+
+    def _match_id(self, item: str) -> Optional[str]:
+        if not item.startswith('AA÷'):
+            return None
+        end = item.find('¬')
+        return item[3:end] if end != -1 else item[3:]
+
+    async def _load_new_events(self, updates: List[LiveUpdate]) -> None:
+        if not self.track_events or not updates:
+            return
+
+        previous_events = {id(update.match): update.match._events for update in updates}
+        await async_load_matches([update.match for update in updates], ['events'], reload=True)
+        for update in updates:
+            previous = previous_events[id(update.match)] or []
+            update.new_events = [event for event in update.match.events if event not in previous]
+
+    async def async_poll(self) -> List[LiveUpdate]:
+        today_matches_gzip = await self.async_make_request(self._today_matches_url.replace('{day}', '0'))
+        if today_matches_gzip == self._feed:
+            return []
+        self._feed = today_matches_gzip
+        updates = self._diff(today_matches_gzip)
+        await self._load_new_events(updates)
+
+        if self.on_update is not None:
+            for update in updates:
+                self.on_update(update)
+        return updates
+
+    def poll(self) -> List[LiveUpdate]:
+        return self._transport.run(self.async_poll())
+
+    async def updates(self) -> AsyncIterator[LiveUpdate]:
+        """ Polls every `interval` seconds forever, yielding each update """
+        while True:
+            started_at = time.monotonic()
+            for update in await self.async_poll():
+                yield update
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started_at)))
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """ Polls every `interval` seconds, passing updates to `on_update`,
+        until `stop` is set """
+        stop = stop if stop is not None else threading.Event()
+        while not stop.is_set():
+            started_at = time.monotonic()
+            self.poll()
+            stop.wait(max(0.0, self.interval - (time.monotonic() - started_at)))
@@ -1,22 +1,37 @@
 import json
+import logging
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from flashscore import converter
 
 from .base import Base
+from .batch import BatchProgress
+from .instrumentation import ParseEvent
+from .odds import odds_url
+from .stats import PERIODS, parse_stat_number
+from .transport import Transport, get_transport
 
+logger = logging.getLogger('flashscore')
 
-@dataclass()
+
+@dataclass(frozen=True, slots=True)
 class StatValue:
     name: str
-    home: Union[str, int, float]
-    away: Union[str, int, float]
+    home: Optional[Union[int, float]]
+    away: Optional[Union[int, float]]
+    # Values as flashscore shows them, like '54%' or '12 (3)'
+    raw_home: Optional[str] = None
+    raw_away: Optional[str] = None
+    # Id of the stat in the feed, the same in every locale
+    stat_id: Optional[str] = None
 
     
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class Event:
     type: str
     player_name: str 
@@ -28,7 +43,7 @@ class Event:
     description: Optional[str] = None
   
     
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class HistoryMatch:
     id: str
     timestamp: int
@@ -42,18 +57,299 @@ class HistoryMatch:
     away_team_score: Optional[int] = None
     main_team: Optional[str] = None
     result_for_main_team: Optional[str] = None
-    
+
+
+SECTIONS = ('names', 'general', 'stats', 'events', 'odds', 'head2heads')
+SECTIONS_BITS = {section: 1 << i for i, section in enumerate(SECTIONS)}
+
+STATUS_CODES = {
+    '1': 'Not started',
+    '2': 'Live',
+    '3': 'Ended',
+}
+
+
+REPR_FIELDS = (
+    'id', 'timestamp', 'date', 'country_name', 'league_name', 'tournament',
+    'home_team_name', 'away_team_name', 'home_team_score', 'away_team_score',
+    'final_total_score', 'status', 'stats_match', 'stats_first_half', 'stats_second_half',
+    'prematch_home_odds', 'prematch_middle_odds', 'prematch_away_odds', 'events',
+    'home_matches', 'away_matches', 'head2head_matches',
+)
+
+
+def parse_names_content(names_content: str) -> Dict[str, Any]:
+    index_start = names_content.find('window.environment = {') + len('window.environment =')
+    index_end = index_start + names_content[index_start:].find('};') + 1
+
+    json_data = json.loads(names_content[index_start:index_end])
+    tournament = json_data['header']['tournament']
+    home, away = json_data['participantsData']['home'][0], json_data['participantsData']['away'][0]
+    return {
+        'tournament': tournament['tournament'],
+        'league_name': '%s' % tournament['tournament'],
+        'country_name': tournament['category'],
+        'home_team_name': home['name'],
+        'away_team_name': away['name'],
+        'home_participant_id': home.get('id'),
+        'away_participant_id': away.get('id'),
+    }
+
+
+def parse_general_content(general_content: str) -> Dict[str, Any]:
+    general_json = converter.gzip_to_json(general_content)[0]
+
+    timestamp = int(general_json['DC'])
+    status = None
+    if general_json['DA'] == '2':
+        if general_json['DB'] == '38':
+            status = 'Half Time'
+        elif general_json['DB']  == '12':
+            status = str(int((int(time.time()) - int(general_json['DD'])) / 60))
+        elif general_json['DB'] == '13':
+            status = str(int((((int(time.time()) - int(general_json['DD'])) / 60) + 45)))
+    else:
+        status = STATUS_CODES[general_json['DA']]
+
+    home_team_score = int(general_json['DE']) if general_json.get('DE') is not None else None
+    away_team_score = int(general_json['DF']) if general_json.get('DF') is not None else None
+    if home_team_score is None and away_team_score is None:
+        final_total_score = None
+    else:
+        final_total_score = "%s:%s" % (home_team_score, away_team_score)
+
+    return {
+        'timestamp': timestamp,
+        'date': datetime.fromtimestamp(timestamp),
+        'status': status,
+        'home_team_score': home_team_score,
+        'away_team_score': away_team_score,
+        'final_total_score': final_total_score,
+    }
+
+
+def parse_stats_content(stats_content: str) -> Dict[str, Any]:
+    stats_json = converter.gzip_to_json(stats_content)
+
+    # Remove {"A1":""} it not used element
+    stats_json = stats_json[:len(stats_json)-1]
+
+    # Periods are listed in the order of PERIODS, under names of the locale
+    periods: List[List[StatValue]] = [[] for _ in PERIODS]
+    period = 0
+    seen_periods = 0
+    for stat in stats_json:
+        if stat.get('SE') is not None:
+            period = PERIODS.index(stat['SE']) if stat['SE'] in PERIODS else seen_periods
+            seen_periods += 1
+            continue
+        if period >= len(periods): continue
+        periods[period].append(StatValue(
+            name=stat['SG'],
+            home=parse_stat_number(stat['SH']),
+            away=parse_stat_number(stat['SI']),
+            raw_home=stat['SH'],
+            raw_away=stat['SI'],
+            stat_id=stat.get('SD'),
+        ))
+
+    return {
+        'stats_match': periods[0],
+        'stats_first_half': periods[1],
+        'stats_second_half': periods[2],
+    }
+
+
+def parse_events_content(events_content: str) -> Dict[str, Any]:
+    events = []
+    for event in converter.gzip_to_json(events_content):
+        if event.get('III') is None: continue
+        if event['IF'] == '' \
+            and event['IU'] == '' \
+            and event.get('INX') is None \
+            and event.get('IOX') is None \
+            and event['IK'] == 'Goal':
+                event['IK'] = 'Penaltie'
+
+        if event['IK'] == 'Goal':
+            events.append(Event(
+                type=event['IK'],
+                time=event.get('IB'),
+                player_name=event['IF'],
+                player_url=event['IU'],
+                second_player_name=event.get('IF_2'),
+                second_player_url=event.get('IU_2'),
+                current_score=f"{event.get('INX')}:{event.get('IOX')}",
+            ))
+        elif event['IK'] in ['Penaltie', 'Substitution - in', 'Substitution - Out']:
+            events.append(Event(
+                type=event['IK'],
+                time=event.get('IB'),
+                player_name=event['IF'],
+                player_url=event['IU'],
+                second_player_name=event.get('IF_2'),
+                second_player_url=event.get('IU_2'),
+            ))
+        elif event['IK'] == 'Yellow Card':
+            events.append(Event(
+                type=event['IK'],
+                time=event.get('IB'),
+                player_name=event['IF'],
+                player_url=event['IU'],
+                description=event.get('TL'),
+            ))
+
+    return {'events': events}
+
+
+def parse_odds_content(odds_content: str) -> Dict[str, Any]:
+    odds_json = json.loads(odds_content)
+    markets = odds_json['data']['findPrematchOddsById']['odds']
+    # The full time 1X2 market of the first bookmaker, other markets and
+    # bookmakers are parsed by odds.parse_event_odds
+    market = next((
+        market for market in markets
+        if market.get('bettingType', 'HOME_DRAW_AWAY') == 'HOME_DRAW_AWAY'
+        and market.get('bettingScope', 'FULL_TIME') == 'FULL_TIME'
+    ), markets[0])
+    odds = [data for data in market['odds'] if data.get('value') not in (None, '')]
+
+    # Listed draw, away, home, the order the odds were always read in. The
+    # draw has no participant, home and away are picked by participant id
+    # when the match knows its ids, see Match._load_participants_odds
+    middle, away, home = [float(data['value']) for data in odds] if len(odds) == 3 else (0.0, 0.0, 0.0)
+    middle = next((float(data['value']) for data in odds if data.get('eventParticipantId') is None), middle)
+    return {
+        'prematch_home_odds': home,
+        'prematch_middle_odds': middle,
+        'prematch_away_odds': away,
+        'prematch_participants_odds': {
+            data['eventParticipantId']: float(data['value'])
+            for data in odds if data.get('eventParticipantId') is not None
+        },
+    }
+
+
+def parse_head2heads_content(head2heads: str) -> Dict[str, Any]:
+    matches_json = converter.gzip_to_json(head2heads)
+
+    # Remove {"A1":""} it not used element
+    matches_json = matches_json[:len(matches_json)-1]
+    current_section = 0
+    results_codes = { 'w': 'Win', 'd': 'Draw', 'lo': 'Loss', 'l': 'Loss'}
+    home_matches = []
+    away_matches = []
+    head2head_matches = []
+    vars_association = {1: home_matches, 2: away_matches, 3: head2head_matches}
+
+    for match in matches_json:
+        if match.get('KB') is not None: current_section += 1
+        if match.get('KP') is None: continue
+        if current_section >= 4: break
+
+        vars_association[current_section].append(HistoryMatch(
+            id=match['KP'],
+            timestamp=int(match['KC']),
+            date=datetime.fromtimestamp(int(match['KC'])),
+            home_team_name=match['FH'],
+            home_team_score=int(match['KU']) if match.get('KU') not in [None,''] else None,
+            away_team_name=match['FK'],
+            away_team_score=int(match['KT']) if match.get('KT') not in [None, ''] else None,
+            league_name=match['KF'],
+            country=match['KH'],
+            final_total_score=match['KL'],
+            main_team=match.get('KS'),
+            result_for_main_team=results_codes.get(match.get('KN')),
+        ))
+
+    return {
+        'home_matches': home_matches,
+        'away_matches': away_matches,
+        'head2head_matches': head2head_matches,
+    }
+
+
+SECTIONS_PARSERS = {
+    'names': parse_names_content,
+    'general': parse_general_content,
+    'stats': parse_stats_content,
+    'events': parse_events_content,
+    'odds': parse_odds_content,
+    'head2heads': parse_head2heads_content,
+}
+
+
+def parse_sections(contents: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """ Parses section payloads into attribute values, pure and picklable so
+    it can run in worker processes """
+    return {section: SECTIONS_PARSERS[section](content) for section, content in contents.items()}
+
+
+class _LazySection:
+    """ Match attribute filled by one section, fetched on first access """
+
+    def __init__(self, section: str):
+        self.section = section
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attribute = '_' + name
+
+    def __get__(self, match: Optional['Match'], owner: type) -> Any:
+        if match is None:
+            return self
+        if not match._is_loaded(self.section):
+            match.load([self.section])
+        return getattr(match, self.attribute)
+
+    def __set__(self, match: 'Match', value: Any) -> None:
+        setattr(match, self.attribute, value)
     
     
 class Match(Base):
+    __slots__ = (
+        'id', 'country_name', 'league_name', '_loaded',
+        '_timestamp', '_date', '_tournament', '_home_team_name', '_away_team_name',
+        '_home_team_score', '_away_team_score', '_final_total_score', '_status',
+        '_stats_match', '_stats_first_half', '_stats_second_half',
+        '_home_participant_id', '_away_participant_id',
+        '_prematch_home_odds', '_prematch_middle_odds', '_prematch_away_odds', '_prematch_participants_odds',
+        '_events', '_home_matches', '_away_matches', '_head2head_matches',
+    )
+
+    timestamp = _LazySection('general')
+    date = _LazySection('general')
+    tournament = _LazySection('names')
+    home_team_name = _LazySection('names')
+    away_team_name = _LazySection('names')
+    home_participant_id = _LazySection('names')
+    away_participant_id = _LazySection('names')
+    home_team_score = _LazySection('general')
+    away_team_score = _LazySection('general')
+    final_total_score = _LazySection('general')
+    status = _LazySection('general')
+    stats_match = _LazySection('stats')
+    stats_first_half = _LazySection('stats')
+    stats_second_half = _LazySection('stats')
+    prematch_home_odds = _LazySection('odds')
+    prematch_middle_odds = _LazySection('odds')
+    prematch_away_odds = _LazySection('odds')
+    prematch_participants_odds = _LazySection('odds')
+    events = _LazySection('events')
+    home_matches = _LazySection('head2heads')
+    away_matches = _LazySection('head2heads')
+    head2head_matches = _LazySection('head2heads')
+
     def __init__(self,
                  id: str,
                  country_name: Optional[str] = None,
                  league_name: Optional[str] = None,
-                 locale: str = 'en'):
-        self._locale = locale
-        super().__init__(self._locale)
+                 locale: str = 'en',
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
         
+        # Bit mask of loaded sections, see SECTIONS_BITS
+        self._loaded = 0
         self.id = id
         self.timestamp: Optional[int] = None
         self.date: Optional[datetime] = None
@@ -63,6 +359,8 @@ class Match(Base):
         
         self.home_team_name: Optional[str] = None
         self.away_team_name: Optional[str] = None
+        self.home_participant_id: Optional[str] = None
+        self.away_participant_id: Optional[str] = None
         self.home_team_score: Optional[int] = None
         self.away_team_score: Optional[int] = None
         
@@ -70,214 +368,221 @@ class Match(Base):
         
         self.status: Optional[str] = None
         
-        self.stats_match: List[StatValue] = []
-        self.stats_first_half: List[StatValue] = []
-        self.stats_second_half: List[StatValue] = []
+        # Lists stay None until their section is loaded, reading them loads it
+        self.stats_match: List[StatValue] = None
+        self.stats_first_half: List[StatValue] = None
+        self.stats_second_half: List[StatValue] = None
         
         self.prematch_home_odds: Optional[float] = None
         self.prematch_middle_odds: Optional[float] = None
         self.prematch_away_odds: Optional[float] = None
+        # Odds of the home and away participants by their id
+        self.prematch_participants_odds: Optional[Dict[str, float]] = None
         
-        self.events: List[Event] = [] 
+        self.events: List[Event] = None
         
-        self.home_matches: List[HistoryMatch] = []
-        self.away_matches: List[HistoryMatch] = [] 
-        self.head2head_matches: List[HistoryMatch] = []
-        
-        self._flashscore_url: str = f"{self._flashscore_endpoint}{self.id}"
-        self._general_url: str = f'{self._general_endpoint}{self.id}'
-        self._stats_url: str = f'{self._stats_endpoint}{self.id}'
-        self._events_url: str = f'{self._events_endpoint}{self.id}'
-        self._odds_url: str = f'{self._odds_endpoint}?_hash=ope&eventId={self.id}&projectId=2&geoIpCode=UA&geoIpSubdivisionCode=UA46'
-        self._head2heads_url: str = f'{self._head2heads_endpoint}{self.id}'
+        self.home_matches: List[HistoryMatch] = None
+        self.away_matches: List[HistoryMatch] = None
+        self.head2head_matches: List[HistoryMatch] = None
+
+    def _is_loaded(self, section: str) -> bool:
+        return bool(self._loaded & SECTIONS_BITS[section])
+
+    def _set_loaded(self, section: str, loaded: bool = True) -> None:
+        if loaded:
+            self._loaded |= SECTIONS_BITS[section]
+        else:
+            self._loaded &= ~SECTIONS_BITS[section]
+
+    def _unload_unfinished(self) -> None:
+        """ Marks the sections of a match that has not ended as not loaded,
+        so the next load fetches them again, names never change """
+        if self._is_loaded('general') and self._status == 'Ended': return
+        self._loaded &= SECTIONS_BITS['names']
 
     def __repr__(self) -> str:
+        # Reads loaded values only, a repr never triggers requests
+        values = [
+            (key, getattr(self, '_' + key) if isinstance(getattr(Match, key), _LazySection) else getattr(self, key))
+            for key in REPR_FIELDS
+        ]
         return "%s(%s)" % (
             self.__class__.__name__,
             ', '.join([
                 f"{key}='{value}'" if isinstance(value, (str, datetime)) else f"{key}={value}"
-                for key, value in vars(self).items()
-                if key[0] != '_' and value is not None and value != []
+                for key, value in values
+                if value is not None and value != []
             ])
         )
 
-    def _make_requests_to_get_all_match_info(self) -> List[str]:
-        return self.make_async_requests([
-            self._flashscore_url, 
-            self._general_url,
-            self._stats_url,
-            self._events_url,
-            self._odds_url,
-            self._head2heads_url,
-        ])
-        
-    def _load_names_content(self, names_content: str) -> None:
-        index_start = names_content.find('window.environment = {') + len('window.environment =')
-        index_end = index_start + names_content[index_start:].find('};') + 1
-
-        json_data = json.loads(names_content[index_start:index_end])
-        json_data = {
-            'header': json_data['header'],
-            'home': json_data['participantsData']['home'][0],
-            'away': json_data['participantsData']['away'][0],
-        }
-        
-        self.tournament = json_data['header']['tournament']['tournament']
-        if self.league_name is None: self.league_name = '%s' % self.tournament
-        if self.country_name is None:
-            self.country_name = json_data['header']['tournament']['category']
-            
-        self.home_team_name = json_data['home']['name']
-        self.away_team_name = json_data['away']['name']
-
-    def _load_general_content(self, general_content: str) -> None:
-        general_json = converter.gzip_to_json(general_content)[0]
-        status_codes = {
-            '1': 'Not started',
-            '2': 'Live',
-            '3': 'Ended',
+    @property
+    def _flashscore_url(self) -> str:
+        return f"{self._flashscore_endpoint}{self.id}"
+
+    @property
+    def _general_url(self) -> str:
+        return f'{self._general_endpoint}{self.id}'
+
+    @property
+    def _stats_url(self) -> str:
+        return f'{self._stats_endpoint}{self.id}'
+
+    @property
+    def _events_url(self) -> str:
+        return f'{self._events_endpoint}{self.id}'
+
+    @property
+    def _odds_url(self) -> str:
+        return odds_url(self._odds_endpoint, self.id)
+
+    @property
+    def _head2heads_url(self) -> str:
+        return f'{self._head2heads_endpoint}{self.id}'
+
+    @property
+    def _section_urls(self) -> Dict[str, str]:
+        return {
+            'names': self._flashscore_url,
+            'general': self._general_url,
+            'stats': self._stats_url,
+            'events': self._events_url,
+            'odds': self._odds_url,
+            'head2heads': self._head2heads_url,
         }
+
+    @property
+    def _content_urls(self) -> List[str]:
+        return list(self._section_urls.values())
         
-        self.timestamp = int(general_json['DC'])
-        self.date = datetime.fromtimestamp(self.timestamp)
-        
-        if general_json['DA'] == '2':
-            if general_json['DB'] == '38':
-                self.status = 'Half Time'
-            elif general_json['DB']  == '12':
-                self.status = str(int((int(time.time()) - int(general_json['DD'])) / 60))
-            elif general_json['DB'] == '13':
-                self.status = str(int((((int(time.time()) - int(general_json['DD'])) / 60) + 45)))
-        else:
-            self.status = status_codes[general_json['DA']]
-            
-        self.home_team_score = int(general_json['DE']) if general_json.get('DE') is not None else None
-        self.away_team_score = int(general_json['DF']) if general_json.get('DF') is not None else None
-        if self.home_team_score is None and self.away_team_score is None:
+    def _load_feed_record(self, record: Dict[str, str], header: Optional[Dict[str, str]] = None) -> None:
+        """ Fills what a today/season listing record already carries, so the
+        names and, unless the match is live, general sections need no request """
+        if header is not None and header.get('ZA') is not None:
+            category, _, tournament = header['ZA'].partition(': ')
+            if tournament:
+                self.tournament = tournament
+                if self.league_name is None: self.league_name = tournament
+                if self.country_name is None: self.country_name = category
+
+        if record.get('AE') is not None: self.home_team_name = record['AE']
+        if record.get('AF') is not None: self.away_team_name = record['AF']
+        if record.get('PX') is not None: self.home_participant_id = record['PX']
+        if record.get('PY') is not None: self.away_participant_id = record['PY']
+        if self._tournament is not None \
+            and self._home_team_name is not None \
+            and self._away_team_name is not None:
+                self._set_loaded('names')
+
+        if record.get('AD') is None or record.get('AB') not in STATUS_CODES:
+            return
+
+        timestamp = int(record['AD'])
+        status = STATUS_CODES[record['AB']]
+        home_team_score = int(record['AG']) if record.get('AG') not in [None, ''] else None
+        away_team_score = int(record['AH']) if record.get('AH') not in [None, ''] else None
+
+        self.timestamp = timestamp
+        self.date = datetime.fromtimestamp(timestamp)
+        self.status = status
+        self.home_team_score = home_team_score
+        self.away_team_score = away_team_score
+        if home_team_score is None and away_team_score is None:
             self.final_total_score = None
         else:
-            self.final_total_score = f"%s:%s" % (self.home_team_score, self.away_team_score)
+            self.final_total_score = "%s:%s" % (home_team_score, away_team_score)
 
-    def _load_stats_content(self, stats_content: str) -> None:
-        stats_json = converter.gzip_to_json(stats_content) 
-        
-        # Remove {"A1":""} it not used element
-        stats_json = stats_json[:len(stats_json)-1]
-        
-        current_section = 'Match'
-        for stat in stats_json:
-            current_section = stat.get('SE') if stat.get('SE') is not None else current_section
-            if stat.get('SE') is not None: continue
-            
-            if current_section == 'Match':
-                self.stats_match.append(StatValue(stat['SG'], stat['SH'], stat['SI']))
-            elif current_section == '1st Half':
-                self.stats_first_half.append(StatValue(stat['SG'], stat['SH'], stat['SI']))
-            elif current_section == '2nd Half':
-                self.stats_second_half.append(StatValue(stat['SG'], stat['SH'], stat['SI']))
-
-    def _load_events_content(self, events_content: str) -> None:
-        events_json = converter.gzip_to_json(events_content)
-        for event in events_json:
-            if event.get('III') is None: continue
-            if event['IF'] == '' \
-                and event['IU'] == '' \
-                and event.get('INX') is None \
-                and event.get('IOX') is None \
-                and event['IK'] == 'Goal':
-                    event['IK'] = 'Penaltie'
-            
-            if event['IK'] == 'Goal':
-                self.events.append(Event(
-                    type=event['IK'],
-                    time=event.get('IB'),
-                    player_name=event['IF'],
-                    player_url=event['IU'],
-                    second_player_name=event.get('IF_2'),
-                    second_player_url=event.get('IU_2'),
-                    current_score=f"{event.get('INX')}:{event.get('IOX')}",
-                ))
-            elif event['IK'] == 'Penaltie':
-                self.events.append(Event(
-                    type=event['IK'],
-                    time=event.get('IB'),
-                    player_name=event['IF'],
-                    player_url=event['IU'],
-                    second_player_name=event.get('IF_2'),
-                    second_player_url=event.get('IU_2'),
-                ))
-            elif event['IK'] in ['Substitution - in', 'Substitution - Out']:
-                self.events.append(Event(
-                    type=event['IK'],
-                    time=event.get('IB'),
-                    player_name=event['IF'],
-                    player_url=event['IU'],
-                    second_player_name=event.get('IF_2'),
-                    second_player_url=event.get('IU_2'),
-                ))
-            elif event['IK'] == 'Yellow Card':
-                self.events.append(Event(
-                    type=event['IK'],
-                    time=event.get('IB'),
-                    player_name=event['IF'],
-                    player_url=event['IU'],
-                    description=event.get('TL'),
+        # A live status is the current minute, which only dc_1_ carries
+        if status != 'Live':
+            self._set_loaded('general')
+
+    def _load_history_match(self, history: HistoryMatch) -> None:
+        """ Fills the names a history row already carries, so the names
+        section needs no request """
+        if self._is_loaded('names'): return
+        self.home_team_name = history.home_team_name
+        self.away_team_name = history.away_team_name
+        if self._tournament is None: self.tournament = history.league_name
+        self._set_loaded('names')
+
+    def _load_parsed(self, values: Dict[str, Any]) -> None:
+        for name, value in values.items():
+            # Names given by a listing win over the ones of the match page
+            if name in ('country_name', 'league_name') and getattr(self, name) is not None: continue
+            setattr(self, name, value)
+
+    def _load_parsed_sections(self, parsed: Dict[str, Dict[str, Any]]) -> None:
+        """ Applies what `parse_sections` returned, possibly in another process """
+        for section, values in parsed.items():
+            self._load_parsed(values)
+            self._set_loaded(section)
+        if 'odds' in parsed or 'names' in parsed:
+            self._load_participants_odds()
+
+        # Finished matches never change, keep their responses cached forever
+        if self._is_loaded('general') and self._status == 'Ended':
+            self._transport.pin(
+                [self._section_urls[section] for section in parsed],
+                self._headers,
+            )
+
+    def _load_sections(self, contents: Dict[str, str]) -> None:
+        if not self._instrumentation.enabled:
+            self._load_parsed_sections(parse_sections(contents))
+            return
+
+        parsed = {}
+        for section, content in contents.items():
+            started_at, started = time.time(), time.perf_counter()
+            error = None
+            try:
+                parsed[section] = SECTIONS_PARSERS[section](content)
+            except Exception as parse_error:
+                error = type(parse_error).__name__
+                raise
+            finally:
+                self._instrumentation.on_parse(ParseEvent(
+                    section=section,
+                    match_id=self.id,
+                    started_at=started_at,
+                    elapsed=time.perf_counter() - started,
+                    bytes=len(content),
+                    error=error,
                 ))
-        
-    def _load_odds_content(self, odds_content: str) -> None:
-        odds_json = json.loads(odds_content)
-        odds = odds_json['data']['findPrematchOddsById']['odds'][0]['odds']
-        if len(odds) == 0:
-            self.prematch_home_odds = 0.0
-            self.prematch_away_odds = 0.0
-            self.prematch_middle_odds = 0.0
-            return 
-        
-        odds = odds_json['data']['findPrematchOddsById']['odds'][0]['odds']
-        if len(odds) == 3:
-            middle, away, home = odds_json['data']['findPrematchOddsById']['odds'][0]['odds']
-            middle = middle['value']
-            away = away['value']
-            home = home['value']
-        else:
-            values = {}
-            for data in odds:
-                values[str(data.get('eventParticipantId'))] = data.get('value')
-
-            middle, away, home = values.values()
-            
-        self.prematch_home_odds = float(home)
-        self.prematch_away_odds = float(away)
-        self.prematch_middle_odds = float(middle)
-
-    def _load_head2heads_content(self, head2heads: str) -> None:
-        matches_json = converter.gzip_to_json(head2heads) 
-        
-        # Remove {"A1":""} it not used element
-        matches_json = matches_json[:len(matches_json)-1]
-        current_section = 0
-        results_codes = { 'w': 'Win', 'd': 'Draw', 'lo': 'Loss', 'l': 'Loss'}
-        vars_association = {1: self.home_matches, 2: self.away_matches, 3: self.head2head_matches}
-        
-        for match in matches_json:
-            if match.get('KB') is not None: current_section += 1
-            if match.get('KP') is None: continue
-            if current_section >= 4: break
-            
-            vars_association[current_section].append(HistoryMatch(
-                id=match['KP'],
-                timestamp=int(match['KC']),
-                date=datetime.fromtimestamp(int(match['KC'])),
-                home_team_name=match['FH'],
-                home_team_score=int(match['KU']) if match.get('KU') not in [None,''] else None,
-                away_team_name=match['FK'],
-                away_team_score=int(match['KT']) if match.get('KT') not in [None, ''] else None,
-                league_name=match['KF'],
-                country=match['KH'],
-                final_total_score=match['KL'],
-                main_team=match.get('KS'),
-                result_for_main_team=results_codes.get(match.get('KN')),
-            ))
+        self._load_parsed_sections(parsed)
+
+    def _load_participants_odds(self) -> None:
+        """ Home and away odds of the participants odds by their ids, the
+        listed order is kept when the ids are unknown or do not match """
+        if not self._is_loaded('odds'): return
+        if self._home_participant_id is None or self._away_participant_id is None: return
+        odds = self._prematch_participants_odds or {}
+        if self._home_participant_id in odds and self._away_participant_id in odds:
+            self.prematch_home_odds = odds[self._home_participant_id]
+            self.prematch_away_odds = odds[self._away_participant_id]
+        elif odds:
+            logger.warning(
+                'Odds of match %s are not keyed by its participants %s and %s but by %s, kept in listed order',
+                self.id, self._home_participant_id, self._away_participant_id, ', '.join(map(str, odds)),
+            )
+
+    def _sections_to_load(self, sections: Optional[Iterable[str]], reload: bool) -> List[str]:
+        return [
+            section for section in _check_sections(sections)
+            if reload or not self._is_loaded(section)
+        ]
+
+    def load(self, sections: Optional[Iterable[str]] = None, reload: bool = False) -> None:
+        """ Fetches and parses only the given sections, all by default """
+        sections = self._sections_to_load(sections, reload)
+        if not sections: return
+        contents = self.make_async_requests([self._section_urls[section] for section in sections])
+        self._load_sections(dict(zip(sections, contents)))
+
+    async def async_load(self, sections: Optional[Iterable[str]] = None, reload: bool = False) -> None:
+        sections = self._sections_to_load(sections, reload)
+        if not sections: return
+        contents = await self.async_requests([self._section_urls[section] for section in sections])
+        self._load_sections(dict(zip(sections, contents)))
 
     def load_content(self,
                      names: Optional[str] = None,
@@ -286,125 +591,239 @@ class Match(Base):
                      events: Optional[str] = None,
                      odds: Optional[str] = None,
                      head2heads: Optional[str] = None) -> None:
-        if names is None and\
-            general is None and\
-            stats is None and\
-            events is None and\
-            odds is None and\
-            head2heads is None:
-                names, general, stats,\
-                events, odds, head2heads = self._make_requests_to_get_all_match_info()
-         
-        self._load_names_content(names)
-        self._load_general_content(general)
-        self._load_stats_content(stats)
-        self._load_events_content(events)
-        self._load_odds_content(odds)
-        self._load_head2heads_content(head2heads)
+        contents = {
+            'names': names,
+            'general': general,
+            'stats': stats,
+            'events': events,
+            'odds': odds,
+            'head2heads': head2heads,
+        }
+        contents = {section: content for section, content in contents.items() if content is not None}
+        if not contents:
+            # Names never change, keep them if a listing already gave them
+            self.load([
+                section for section in SECTIONS
+                if section != 'names' or not self._is_loaded(section)
+            ], reload=True)
+        else:
+            self._load_sections(contents)
+
+    async def async_load_content(self) -> None:
+        await self.async_load([
+            section for section in SECTIONS
+            if section != 'names' or not self._is_loaded(section)
+        ], reload=True)
+
+    def expand_history(self,
+                       depth: int = 1,
+                       sections: Optional[Iterable[str]] = None,
+                       progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[str, 'Match']:
+        """ Loads the matches of the history lists in one batch per level,
+        see `expand_history` """
+        return expand_history([self], depth, sections, progress)
+
+    async def async_expand_history(self,
+                                   depth: int = 1,
+                                   sections: Optional[Iterable[str]] = None,
+                                   progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[str, 'Match']:
+        return await async_expand_history([self], depth, sections, progress)
      
-    def get_json(self) -> Dict[str, Any]:
+    def _json(self) -> Dict[str, Any]:
+        # Reads loaded values only, missing sections are loaded by the callers
         return {
             'id': self.id,
-            'timestamp': self.timestamp,
-            'date': str(self.date),
+            'timestamp': self._timestamp,
+            'date': str(self._date),
             'country_name': self.country_name,
             'league_name': self.league_name,
-            'tournament': self.tournament,
-            'home_team_name': self.home_team_name,
-            'away_team_name': self.away_team_name,
-            'home_team_name': self.home_team_score,
-            'away_team_score': self.away_team_score,
-            'final_total_score': self.final_total_score,
-            'status': self.status,
-            'stats_match': [
-                {
-                    'name': stats.name,
-                    'home': stats.home,
-                    'away': stats.away,
-                }
-                for stats in self.stats_match
-            ],
-            'stats_first_half': [
-                {
-                    'name': stats.name,
-                    'home': stats.home,
-                    'away': stats.away,
-                }
-                for stats in self.stats_first_half
-            ],
-            'stats_second_half': [
-                {
-                    'name': stats.name,
-                    'home': stats.home,
-                    'away': stats.away,
-                }
-                for stats in self.stats_second_half
-            ],
-            'prematch_home_odds': self.prematch_home_odds,
-            'prematch_middle_odds': self.prematch_middle_odds,
-            'prematch_away_odds': self.prematch_away_odds,
-            'events': [
-                {
-                    'type': event.type,
-                    'player_name': event.player_name,
-                    'player_url': event.player_url,
-                    'time': event.time,
-                    'current_score': event.current_score,
-                    'second_player_name': event.second_player_name,
-                    'second_player_url': event.second_player_url,
-                    'description': event.description,
-                } 
-                for event in self.events
-            ],
-            'home_matches': [
-                {
-                    'id': match.id,
-                    'timestamp': match.timestamp,
-                    'date': str(match.date),
-                    'home_team_name': match.home_team_name,
-                    'home_team_score': match.home_team_score,
-                    'away_team_name': match.away_team_name,
-                    'away_team_score': match.away_team_score,
-                    'league_name': match.league_name,
-                    'country': match.country,
-                    'final_total_score': match.final_total_score,
-                    'main_team': match.main_team,
-                    'result_for_main_team': match.result_for_main_team,
-                }
-                for match in self.home_matches
-            ],
-            'away_matches': [
-                {
-                    'id': match.id,
-                    'timestamp': match.timestamp,
-                    'date': str(match.date),
-                    'home_team_name': match.home_team_name,
-                    'home_team_score': match.home_team_score,
-                    'away_team_name': match.away_team_name,
-                    'away_team_score': match.away_team_score,
-                    'league_name': match.league_name,
-                    'country': match.country,
-                    'final_total_score': match.final_total_score,
-                    'main_team': match.main_team,
-                    'result_for_main_team': match.result_for_main_team,
-                }
-                for match in self.away_matches
-            ],
-            'head2heads_matches': [
-                {
-                    'id': match.id,
-                    'timestamp': match.timestamp,
-                    'date': str(match.date),
-                    'home_team_name': match.home_team_name,
-                    'home_team_score': match.home_team_score,
-                    'away_team_name': match.away_team_name,
-                    'away_team_score': match.away_team_score,
-                    'league_name': match.league_name,
-                    'country': match.country,
-                    'final_total_score': match.final_total_score,
-                    'main_team': match.main_team,
-                    'result_for_main_team': match.result_for_main_team,
-                }
-                for match in self.head2head_matches
-            ]
+            'tournament': self._tournament,
+            'home_team_name': self._home_team_name,
+            'away_team_name': self._away_team_name,
+            'home_team_score': self._home_team_score,
+            'away_team_score': self._away_team_score,
+            'final_total_score': self._final_total_score,
+            'status': self._status,
+            'stats_match': [stat_value_json(stats) for stats in self._stats_match],
+            'stats_first_half': [stat_value_json(stats) for stats in self._stats_first_half],
+            'stats_second_half': [stat_value_json(stats) for stats in self._stats_second_half],
+            'prematch_home_odds': self._prematch_home_odds,
+            'prematch_middle_odds': self._prematch_middle_odds,
+            'prematch_away_odds': self._prematch_away_odds,
+            'events': [event_json(event) for event in self._events],
+            'home_matches': [history_match_json(match) for match in self._home_matches],
+            'away_matches': [history_match_json(match) for match in self._away_matches],
+            'head2heads_matches': [history_match_json(match) for match in self._head2head_matches],
         }
+
+    def get_json(self) -> Dict[str, Any]:
+        """ Loads the missing sections in one batch and returns every value """
+        self.load()
+        return self._json()
+
+    async def async_get_json(self) -> Dict[str, Any]:
+        await self.async_load()
+        return self._json()
+
+
+# Matches alive per transport and (locale, id), see get_match
+_matches: 'weakref.WeakKeyDictionary[Transport, weakref.WeakValueDictionary[Tuple[str, str], Match]]' = \
+    weakref.WeakKeyDictionary()
+_matches_lock = threading.Lock()
+
+
+def get_match(id: str,
+              country_name: Optional[str] = None,
+              league_name: Optional[str] = None,
+              locale: str = 'en',
+              transport: Optional[Transport] = None) -> Match:
+    """ Returns the match already alive for this id and transport, so its
+    loaded sections are reused, or a new one """
+    transport = transport if transport is not None else get_transport()
+    with _matches_lock:
+        matches = _matches.get(transport)
+        if matches is None:
+            matches = _matches[transport] = weakref.WeakValueDictionary()
+
+        match = matches.get((locale, id))
+        if match is None:
+            match = matches[(locale, id)] = Match(id, country_name, league_name, locale, transport)
+            return match
+
+    if match.country_name is None: match.country_name = country_name
+    if match.league_name is None: match.league_name = league_name
+    return match
+
+def stat_value_json(stats: StatValue) -> Dict[str, Any]:
+    return {
+        'name': stats.name,
+        'home': stats.home,
+        'away': stats.away,
+        'raw_home': stats.raw_home,
+        'raw_away': stats.raw_away,
+    }
+
+
+def event_json(event: Event) -> Dict[str, Any]:
+    return {
+        'type': event.type,
+        'player_name': event.player_name,
+        'player_url': event.player_url,
+        'time': event.time,
+        'current_score': event.current_score,
+        'second_player_name': event.second_player_name,
+        'second_player_url': event.second_player_url,
+        'description': event.description,
+    }
+
+
+def history_match_json(match: HistoryMatch) -> Dict[str, Any]:
+    return {
+        'id': match.id,
+        'timestamp': match.timestamp,
+        'date': str(match.date),
+        'home_team_name': match.home_team_name,
+        'home_team_score': match.home_team_score,
+        'away_team_name': match.away_team_name,
+        'away_team_score': match.away_team_score,
+        'league_name': match.league_name,
+        'country': match.country,
+        'final_total_score': match.final_total_score,
+        'main_team': match.main_team,
+        'result_for_main_team': match.result_for_main_team,
+    }
+
+def _check_sections(sections: Optional[Iterable[str]]) -> List[str]:
+    sections = list(SECTIONS if sections is None else sections)
+    for section in sections:
+        if section not in SECTIONS:
+            raise ValueError("Unknown section '%s', expected one of %s" % (section, ', '.join(SECTIONS)))
+    return sections
+
+
+def _batch_requests(matches: List[Match],
+                    sections: Optional[Iterable[str]],
+                    reload: bool) -> List[Tuple[Match, str]]:
+    return [
+        (match, section)
+        for match in matches
+        for section in match._sections_to_load(sections, reload)
+    ]
+
+
+def _load_batch_contents(requests: List[Tuple[Match, str]], contents: List[str]) -> None:
+    matches_contents: Dict[int, Tuple[Match, Dict[str, str]]] = {}
+    for (match, section), content in zip(requests, contents):
+        matches_contents.setdefault(id(match), (match, {}))[1][section] = content
+    for match, match_contents in matches_contents.values():
+        match._load_sections(match_contents)
+
+
+def load_matches(matches: List[Match],
+                 sections: Optional[Iterable[str]] = None,
+                 progress: Optional[Callable[[BatchProgress], None]] = None,
+                 reload: bool = False) -> None:
+    """ Loads `sections` of all `matches` through one batch of requests,
+    sections a match already has are skipped unless `reload` is set """
+    requests = _batch_requests(matches, sections, reload)
+    if not requests: return
+    urls = [match._section_urls[section] for match, section in requests]
+    _load_batch_contents(requests, matches[0].make_batch_requests(urls, progress))
+
+
+async def async_load_matches(matches: List[Match],
+                             sections: Optional[Iterable[str]] = None,
+                             progress: Optional[Callable[[BatchProgress], None]] = None,
+                             reload: bool = False) -> None:
+    requests = _batch_requests(matches, sections, reload)
+    if not requests: return
+    urls = [match._section_urls[section] for match, section in requests]
+    _load_batch_contents(requests, await matches[0].async_batch_requests(urls, progress))
+
+
+def _history_matches(matches: List[Match], visited: Set[str]) -> List[Match]:
+    """ Matches of the history lists not `visited` yet, first seen first """
+    history_matches = {}
+    for match in matches:
+        for history in (match._home_matches or []) + (match._away_matches or []) + (match._head2head_matches or []):
+            if history.id in visited or history.id in history_matches: continue
+            history_match = history_matches[history.id] = get_match(
+                history.id,
+                country_name=history.country,
+                league_name=history.league_name,
+                locale=match.locale,
+                transport=match._transport,
+            )
+            history_match._load_history_match(history)
+    visited.update(history_matches)
+    return list(history_matches.values())
+
+
+async def async_expand_history(matches: List[Match],
+                               depth: int = 1,
+                               sections: Optional[Iterable[str]] = None,
+                               progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[str, Match]:
+    """ Loads `sections` of the matches found in the history lists of
+    `matches`, `depth` levels deep, and returns them by id.
+
+    Each level is one batch: the history ids of the whole level are
+    deduplicated and matches already seen are never fetched twice.
+    """
+    visited = {match.id for match in matches}
+    expanded: Dict[str, Match] = {}
+    level = list(matches)
+    for _ in range(depth):
+        await async_load_matches(level, ['head2heads'], progress)
+        level = _history_matches(level, visited)
+        if not level: break
+        await async_load_matches(level, sections, progress)
+        expanded.update((match.id, match) for match in level)
+    return expanded
+
+
+def expand_history(matches: List[Match],
+                   depth: int = 1,
+                   sections: Optional[Iterable[str]] = None,
+                   progress: Optional[Callable[[BatchProgress], None]] = None) -> Dict[str, Match]:
+    if not matches: return {}
+    return matches[0]._transport.run(async_expand_history(matches, depth, sections, progress))
@@ -0,0 +1,156 @@
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .base import Base
+from .batch import BatchLoader, BatchLoadError, BatchProgress
+from .transport import Transport
+
+
+# (bookmaker id, betting type, betting scope, selection)
+OddsKey = Tuple[int, str, str, str]
+
+
+def odds_url(odds_endpoint: str, event_id: str) -> str:
+    """ The GraphQL persisted query takes a single event, so this is also the
+    smallest number of calls for many events """
+    return f'{odds_endpoint}?_hash=ope&eventId={event_id}&projectId=2&geoIpCode=UA&geoIpSubdivisionCode=UA46'
+
+
+def _selection(data: dict) -> str:
+    """ Participant id for home/away selections, the selection name (or
+    'draw') otherwise, with the handicap or total line appended """
+    selection = data.get('eventParticipantId') or data.get('selection') or 'draw'
+    handicap = data.get('handicap')
+    if isinstance(handicap, dict):
+        handicap = handicap.get('value')
+    return '%s@%s' % (selection, handicap) if handicap not in (None, '') else str(selection)
+
+
+def parse_event_odds(odds_content: str) -> Dict[OddsKey, float]:
+    """ Every bookmaker and market of an odds response as one flat dict """
+    odds_json = json.loads(odds_content)
+    prematch_odds = (odds_json.get('data') or {}).get('findPrematchOddsById') or {}
+
+    odds = {}
+    for market in prematch_odds.get('odds') or []:
+        bookmaker_id = market.get('bookmakerId')
+        betting_type = market.get('bettingType')
+        betting_scope = market.get('bettingScope')
+        for data in market.get('odds') or []:
+            if data.get('value') in (None, ''): continue
+            odds[(bookmaker_id, betting_type, betting_scope, _selection(data))] = float(data['value'])
+    return odds
+
+
+@dataclass(slots=True)
+class EventOdds:
+    event_id: str
+    odds: Dict[OddsKey, float] = field(default_factory=dict)
+
+    def bookmakers(self) -> List[int]:
+        return sorted({key[0] for key in self.odds}, key=str)
+
+    def market(self,
+               betting_type: str = 'HOME_DRAW_AWAY',
+               betting_scope: str = 'FULL_TIME',
+               bookmaker_id: Optional[int] = None) -> Dict[str, float]:
+        """ Selections of one market, of the first bookmaker having it when
+        `bookmaker_id` is not given """
+        market = {}
+        for (bookmaker, type, scope, selection), value in self.odds.items():
+            if type != betting_type or scope != betting_scope: continue
+            if bookmaker_id is None: bookmaker_id = bookmaker
+            if bookmaker != bookmaker_id: continue
+            market[selection] = value
+        return market
+
+    def home_draw_away(self,
+                       home_participant_id: str,
+                       away_participant_id: str,
+                       bookmaker_id: Optional[int] = None) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """ Full time 1X2 odds, the participant ids are the
+        `home_participant_id` and `away_participant_id` of the match """
+        market = self.market(bookmaker_id=bookmaker_id)
+        return market.get(home_participant_id), market.get('draw'), market.get(away_participant_id)
+
+
+@dataclass()
+class OddsMovement:
+    event_id: str
+    key: OddsKey
+    old: Optional[float]
+    new: Optional[float]
+
+
+@dataclass()
+class OddsSnapshot:
+    taken_at: float
+    events: Dict[str, EventOdds] = field(default_factory=dict)
+    # Events whose odds could not be fetched
+    failed: List[str] = field(default_factory=list)
+
+    def diff(self, previous: 'OddsSnapshot') -> List[OddsMovement]:
+        """ Odds that moved, appeared or disappeared since `previous`, events
+        missing from either snapshot are skipped """
+        movements = []
+        for event_id, event in self.events.items():
+            previous_event = previous.events.get(event_id)
+            if previous_event is None or previous_event.odds == event.odds: continue
+            for key in event.odds.keys() | previous_event.odds.keys():
+                old, new = previous_event.odds.get(key), event.odds.get(key)
+                if old != new:
+                    movements.append(OddsMovement(event_id, key, old, new))
+        return movements
+
+
+class OddsFetcher(Base):
+    """ Fetches the pre-match odds of many events, at most `concurrency`
+    requests at a time, keeping every bookmaker and market.
+
+        fetcher = OddsFetcher()
+        before = fetcher.snapshot([match.id for match in api.get_today_matches()])
+        ...
+        movements = fetcher.snapshot(before.events).diff(before)
+
+    Responses go through the transport cache, snapshots taken more often
+    than the odds ttl of its CachePolicy return the same odds.
+    """
+
+    def __init__(self,
+                 locale: str = 'en',
+                 concurrency: Optional[int] = None,
+                 progress: Optional[Callable[[BatchProgress], None]] = None,
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
+
+        self.concurrency = concurrency
+        self.progress = progress
+
+    async def async_snapshot(self, events_ids: List[str]) -> OddsSnapshot:
+        events_ids = list(dict.fromkeys(events_ids))
+        snapshot = OddsSnapshot(taken_at=time.time())
+
+        def on_result(index: int, text: str) -> None:
+            event_id = events_ids[index]
+            try:
+                snapshot.events[event_id] = EventOdds(event_id, parse_event_odds(text))
+            except (ValueError, AttributeError, TypeError):
+                snapshot.failed.append(event_id)
+
+        loader = BatchLoader(self._transport, self._headers, self.concurrency, progress=self.progress)
+        try:
+            await loader.async_load([odds_url(self._odds_endpoint, id) for id in events_ids], on_result)
+        except BatchLoadError:
+            snapshot.failed.extend(id for id in events_ids if id not in snapshot.events and id not in snapshot.failed)
+        return snapshot
+
+    def snapshot(self, events_ids: List[str]) -> OddsSnapshot:
+        return self._transport.run(self.async_snapshot(events_ids))
+
+    async def async_get_odds(self, events_ids: List[str]) -> Dict[str, EventOdds]:
+        return (await self.async_snapshot(events_ids)).events
+
+    def get_odds(self, events_ids: List[str]) -> Dict[str, EventOdds]:
+        return self.snapshot(events_ids).events
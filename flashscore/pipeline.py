@@ -0,0 +1,105 @@
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .batch import BatchLoader, BatchLoadError, BatchProgress
+from .match import Match, _batch_requests, parse_sections
+
+
+def parse_matches_sections(matches_contents: List[Dict[str, str]]) -> List[Dict[str, Dict[str, Any]]]:
+    """ Worker side of `ParsePool`, parses the sections of several matches """
+    return [parse_sections(contents) for contents in matches_contents]
+
+
+class ParsePool:
+    """ Parses match payloads in worker processes while the rest of the
+    batch is still downloading.
+
+    A match is handed to the pool as soon as all of its sections arrived,
+    `chunk_size` matches per task, and the parsed records are applied back
+    to the `Match` objects in this process.
+
+        with ParsePool(workers=16) as pool:
+            pool.load_matches(season.get_matches())
+
+    Any `concurrent.futures.Executor` can be given instead, for example an
+    interpreter pool on Pythons that have one.
+    """
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 executor: Optional[concurrent.futures.Executor] = None,
+                 chunk_size: int = 32):
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else concurrent.futures.ProcessPoolExecutor(workers)
+        self.chunk_size = chunk_size
+
+    async def async_load_matches(self,
+                                 matches: List[Match],
+                                 sections: Optional[Iterable[str]] = None,
+                                 progress: Optional[Callable[[BatchProgress], None]] = None,
+                                 reload: bool = False) -> None:
+        requests = _batch_requests(matches, sections, reload)
+        if not requests: return
+
+        loop = asyncio.get_running_loop()
+        pending: Dict[int, int] = {}
+        contents: Dict[int, Dict[str, str]] = {}
+        for match, _ in requests:
+            pending[id(match)] = pending.get(id(match), 0) + 1
+        ready: List[Match] = []
+        tasks: List[Tuple[List[Match], asyncio.Future]] = []
+
+        def submit() -> None:
+            chunk = ready[:]
+            ready.clear()
+            tasks.append((chunk, loop.run_in_executor(
+                self.executor, parse_matches_sections, [contents.pop(id(match)) for match in chunk],
+            )))
+
+        def on_result(index: int, text: str) -> None:
+            match, section = requests[index]
+            contents.setdefault(id(match), {})[section] = text
+            pending[id(match)] -= 1
+            if pending[id(match)] == 0:
+                ready.append(match)
+                if len(ready) >= self.chunk_size:
+                    submit()
+
+        urls = [match._section_urls[section] for match, section in requests]
+        transport, headers = matches[0]._transport, matches[0]._headers
+        error = None
+        try:
+            await BatchLoader(transport, headers, progress=progress).async_load(urls, on_result)
+        except BatchLoadError as batch_error:
+            # Matches downloaded completely are still loaded
+            error = batch_error
+        if ready:
+            submit()
+
+        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+        for (chunk, _), parsed in zip(tasks, results):
+            if isinstance(parsed, BaseException):
+                raise parsed
+            for match, match_parsed in zip(chunk, parsed):
+                match._load_parsed_sections(match_parsed)
+        if error is not None:
+            raise error
+
+    def load_matches(self,
+                     matches: List[Match],
+                     sections: Optional[Iterable[str]] = None,
+                     progress: Optional[Callable[[BatchProgress], None]] = None,
+                     reload: bool = False) -> None:
+        if not matches: return
+        matches[0]._transport.run(self.async_load_matches(matches, sections, progress, reload))
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .instrumentation import endpoint_for
+from .transport import CachedResponse, FetchResult, Transport
+
+if TYPE_CHECKING:
+    import requests
+
+
+class ReplayTransport(Transport):
+    """ Serves responses recorded in `directory` instead of the network.
+
+    Fixtures are stored as `<endpoint>/<hash of the url>.txt`. With
+    `fallback` a url without a fixture gets one of its endpoint, so a few
+    recorded matches can stand in for a whole season. Every response
+    waits `latency` seconds plus up to `jitter` more.
+
+    With `record` requests go to the network and every successful response
+    is written to `directory`.
+
+        set_transport(ReplayTransport('fixtures', latency=0.05))
+    """
+
+    def __init__(self,
+                 directory: str,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 fallback: bool = True,
+                 record: bool = False,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.directory = directory
+        self.latency = latency
+        self.jitter = jitter
+        self.fallback = fallback
+        self.record = record
+        self._fixtures: Dict[str, List[str]] = {}
+
+    def fixture_path(self, url: str) -> str:
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, endpoint_for(url), name + '.txt')
+
+    def _endpoint_fixtures(self, endpoint: str) -> List[str]:
+        fixtures = self._fixtures.get(endpoint)
+        if fixtures is None:
+            endpoint_directory = os.path.join(self.directory, endpoint)
+            fixtures = sorted(
+                os.path.join(endpoint_directory, name)
+                for name in os.listdir(endpoint_directory)
+            ) if os.path.isdir(endpoint_directory) else []
+            self._fixtures[endpoint] = fixtures
+        return fixtures
+
+    def _read(self, url: str) -> Optional[str]:
+        path = self.fixture_path(url)
+        if not os.path.exists(path):
+            fixtures = self._endpoint_fixtures(endpoint_for(url)) if self.fallback else []
+            if not fixtures:
+                return None
+            # Same url, same fixture, so replays are deterministic
+            path = fixtures[int(hashlib.sha1(url.encode('utf-8')).hexdigest(), 16) % len(fixtures)]
+
+        with open(path, encoding='utf-8') as file:
+            return file.read()
+
+    def _write(self, url: str, text: str) -> None:
+        path = self.fixture_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text)
+        self._fixtures.pop(endpoint_for(url), None)
+
+    def _delay(self) -> float:
+        return self.latency + random.uniform(0, self.jitter) if self.jitter else self.latency
+
+    def _fetch(self, url: str, headers: Dict[str, str]) -> 'requests.Response':
+        if self.record:
+            response = super()._fetch(url, headers)
+            if response.status_code == 200:
+                self._write(url, response.text)
+            return response
+
+        started_at, started = time.time(), time.perf_counter()
+        time.sleep(self._delay())
+        text = self._read(url)
+        response = CachedResponse(url, text if text is not None else '')
+        if text is None:
+            response.status_code, response.ok = 404, False
+        if self.instrumentation.enabled:
+            self._report_request(
+                url, started_at, time.perf_counter() - started,
+                status=response.status_code, bytes=len(response.content),
+            )
+        return response
+
+    def _transient_errors(self, asynchronous: bool) -> Tuple[type, ...]:
+        if self.record:
+            return super()._transient_errors(asynchronous)
+        return (asyncio.TimeoutError, )
+
+    async def _async_fetch(self, url: str, headers: Dict[str, str]) -> FetchResult:
+        if self.record:
+            result = await super()._async_fetch(url, headers)
+            if result.status == 200:
+                self._write(url, result.text)
+            return result
+
+        started_at, started = time.time(), time.perf_counter()
+        await asyncio.sleep(self._delay())
+        text = self._read(url)
+        if text is None:
+            result = FetchResult(url=url, status=404, text='', size=0)
+        else:
+            result = FetchResult(url=url, status=200, text=text, size=len(text.encode('utf-8')))
+        if self.instrumentation.enabled:
+            self._report_request(url, started_at, time.perf_counter() - started, status=result.status, bytes=result.size)
+        return result
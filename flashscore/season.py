@@ -1,11 +1,21 @@
-from typing import List, Optional
+from collections.abc import Sequence
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from . import converter
 from .base import Base
-from .match import Match
+from .batch import BatchProgress
+from .match import Match, async_load_matches, get_match, load_matches
+from .pipeline import ParsePool
+from .transport import Transport
+
+
+# Pages of the season feed fetched at once
+PAGES_WAVE_SIZE = 3
 
 
 class Season(Base):
+    __slots__ = ('id', 'title', 'country_id', 'league_id', 'country_name', 'league_name')
+
     def __init__(self,
                  id: int,
                  title: str,
@@ -13,9 +23,9 @@ class Season(Base):
                  league_id: str,
                  country_name: str,
                  league_name: str,
-                 locale: Optional[str] = 'en'):
-        self.locale = locale
-        super().__init__(self.locale)
+                 locale: Optional[str] = 'en',
+                 transport: Optional[Transport] = None):
+        super().__init__(locale, transport)
         
         self.id = id
         self.title = title
@@ -24,8 +34,6 @@ class Season(Base):
         self.country_name = country_name
         self.league_name = league_name
         
-        self._matches_url += f'tr_1_{self.country_id}_{self.league_id}_{self.id}_0_3_en_1'
-        
     def __repr__(self) -> str:
         return "%s(id='%s', title='%s')" % (
             self.__class__.__name__,
@@ -34,45 +42,180 @@ class Season(Base):
         )
 
     def get_matches_url(self, page: int) -> str:
-        return self._matches_url + f'tr_1_{self.country_id}_{self.league_id}_{self.id}_{page}_3_en_1'
-
-    def get_matches_ids(self):
-        matches_ids = []
-        for response in self.make_grequest([self.get_matches_url(i) for i in range(5)]):
-            flashscore_api_json = converter.gzip_to_json(response.text)
-            matches = flashscore_api_json
-            
-            for match in matches: 
-                if match.get('AA') is None: continue
-                if match.get('AA') in matches_ids: continue
-                matches_ids.append(match['AA'])
-                
-        return matches_ids
+        return self._matches_url + f'tr_1_{self.country_id}_{self.league_id}_{self.id}_{page}_3_{self.locale}_1'
+
+    def _page_records(self, page: str, seen: Dict[str, None]) -> Tuple[int, List[Tuple[Optional[Dict[str, str]], Dict[str, str]]]]:
+        """ Returns the number of match records on the page and the ones not
+        `seen` yet with the tournament header above them """
+        header = None
+        count = 0
+        records = []
+        for match in converter.iter_records(page):
+            if match.get('ZA') is not None: header = match
+            if match.get('AA') is None: continue
+            count += 1
+            if match['AA'] in seen: continue
+            seen[match['AA']] = None
+            records.append((header, match))
+        return count, records
+
+    def _wave_urls(self, wave: int, wave_size: int) -> List[str]:
+        return [self.get_matches_url(page) for page in range(wave * wave_size, (wave + 1) * wave_size)]
+
+    def iter_pages(self, wave_size: int = PAGES_WAVE_SIZE) -> Iterator[List[Tuple[Optional[Dict[str, str]], Dict[str, str]]]]:
+        """ Yields the new match records of every page.
+
+        Pages are fetched `wave_size` at a time until a page without
+        matches or a wave without new ones, past the last page the feed
+        answers with an empty or a repeated page.
+        """
+        seen: Dict[str, None] = {}
+        wave = 0
+        while True:
+            responses = self.make_grequest(self._wave_urls(wave, wave_size))
+            new_records = False
+            for response in responses:
+                count, records = self._page_records(response.text, seen)
+                if count == 0: return
+                if not records: continue
+                new_records = True
+                yield records
+            if not new_records: return
+            wave += 1
+
+    async def async_iter_pages(self, wave_size: int = PAGES_WAVE_SIZE) -> AsyncIterator[List[Tuple[Optional[Dict[str, str]], Dict[str, str]]]]:
+        seen: Dict[str, None] = {}
+        wave = 0
+        while True:
+            pages = await self.async_requests(self._wave_urls(wave, wave_size))
+            new_records = False
+            for page in pages:
+                count, records = self._page_records(page, seen)
+                if count == 0: return
+                if not records: continue
+                new_records = True
+                yield records
+            if not new_records: return
+            wave += 1
+
+    def _iter_matches_records(self) -> Iterator[Tuple[Optional[Dict[str, str]], Dict[str, str]]]:
+        for records in self.iter_pages():
+            yield from records
+
+    async def _async_get_matches_records(self) -> List[Tuple[Optional[Dict[str, str]], Dict[str, str]]]:
+        return [record async for records in self.async_iter_pages() for record in records]
+
+    def _create_match(self, header: Optional[Dict[str, str]], match: Dict[str, str]) -> Match:
+        created_match = get_match(
+            id=match['AA'],
+            country_name=self.country_name,
+            league_name=self.league_name,
+            locale=self.locale,
+            transport=self._transport,
+        )
+        created_match._load_feed_record(match, header)
+        return created_match
+
+    def iter_matches(self) -> Iterator[Match]:
+        for header, match in self._iter_matches_records():
+            yield self._create_match(header, match)
+
+    async def async_iter_matches(self) -> AsyncIterator[Match]:
+        async for records in self.async_iter_pages():
+            for header, match in records:
+                yield self._create_match(header, match)
+
+    def get_matches_ids(self) -> List[str]:
+        return [match['AA'] for _, match in self._iter_matches_records()]
+
+    async def async_get_matches_ids(self) -> List[str]:
+        return [match['AA'] for _, match in await self._async_get_matches_records()]
 
     def get_matches(self) -> List[Match]:
-        matches_ids = self.get_matches_ids()
-        return [
-            Match(
-                id=match_id,
-                country_name=self.country_name,
-                league_name=self.league_name,
-            )
-            for match_id in matches_ids
-        ]
-
-    def get_matches_with_alreday_loaded_content(self) -> List[Match]:
+        return list(self.iter_matches())
+
+    async def async_get_matches(self) -> List[Match]:
+        return [self._create_match(header, match) for header, match in await self._async_get_matches_records()]
+
+    def get_matches_with_alreday_loaded_content(self,
+                                                progress: Optional[Callable[[BatchProgress], None]] = None,
+                                                sections: Optional[List[str]] = None,
+                                                parse_pool: Optional[ParsePool] = None) -> List[Match]:
         matches = self.get_matches()
-        urls = []
-        for match in matches:
-            urls+= [
-                match._flashscore_url, 
-                match._general_url,
-                match._stats_url,
-                match._events_url,
-                match._odds_url,
-                match._head2heads_url,
-            ]
-        
-        for match, responses in zip(matches, self.split_list_to_chinks(self.make_grequest(urls), 6)):
-            match.load_content(*[response.text for response in responses]) 
-        return matches    
+        if parse_pool is not None:
+            parse_pool.load_matches(matches, sections, progress)
+        else:
+            load_matches(matches, sections, progress)
+        return matches
+
+    async def async_get_matches_with_already_loaded_content(self,
+                                                            progress: Optional[Callable[[BatchProgress], None]] = None,
+                                                            sections: Optional[List[str]] = None,
+                                                            parse_pool: Optional[ParsePool] = None) -> List[Match]:
+        matches = await self.async_get_matches()
+        if parse_pool is not None:
+            await parse_pool.async_load_matches(matches, sections, progress)
+        else:
+            await async_load_matches(matches, sections, progress)
+        return matches
+
+
+class Seasons(Sequence):
+    """ Lazy list of a league seasons, newest first, loaded by `loader` on
+    first access and indexed by position, title or id.
+
+        seasons['2022/2023'], seasons.by_id(176), seasons[0]
+    """
+
+    def __init__(self, loader: Callable[[], List[Season]]):
+        self._loader = loader
+        self._seasons: Optional[List[Season]] = None
+        self._by_title: Dict[str, Season] = {}
+        self._by_id: Dict[int, Season] = {}
+
+    @classmethod
+    def from_list(cls, seasons: List[Season]) -> 'Seasons':
+        return cls(lambda: seasons)
+
+    @property
+    def loaded(self) -> bool:
+        return self._seasons is not None
+
+    def _load(self) -> List[Season]:
+        if self._seasons is None:
+            self._seasons = list(self._loader())
+            self._by_title = {season.title: season for season in self._seasons}
+            self._by_id = {season.id: season for season in self._seasons}
+        return self._seasons
+
+    def __getitem__(self, key: Union[int, slice, str]) -> Union[Season, List[Season]]:
+        if isinstance(key, str):
+            season = self.by_title(key)
+            if season is None:
+                raise KeyError(key)
+            return season
+        return self._load()[key]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self) -> Iterator[Season]:
+        return iter(self._load())
+
+    def __contains__(self, season: object) -> bool:
+        if isinstance(season, str):
+            return self.by_title(season) is not None
+        return season in self._load()
+
+    def __repr__(self) -> str:
+        if self._seasons is None:
+            return '%s(not loaded)' % self.__class__.__name__
+        return '%s(%s)' % (self.__class__.__name__, self._seasons)
+
+    def by_title(self, title: str) -> Optional[Season]:
+        self._load()
+        return self._by_title.get(title)
+
+    def by_id(self, id: int) -> Optional[Season]:
+        self._load()
+        return self._by_id.get(int(id))
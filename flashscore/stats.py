@@ -0,0 +1,161 @@
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .match import Match
+
+
+# Fixed vocabulary of stats, the names of the english locale
+STATS_NAMES = (
+    'Expected Goals (xG)',
+    'Ball Possession',
+    'Goal Attempts',
+    'Shots on Goal',
+    'Shots off Goal',
+    'Blocked Shots',
+    'Shots inside the Box',
+    'Shots outside the Box',
+    'Big Chances',
+    'Hit the Woodwork',
+    'Free Kicks',
+    'Corner Kicks',
+    'Offsides',
+    'Throw-ins',
+    'Goalkeeper Saves',
+    'Fouls',
+    'Yellow Cards',
+    'Red Cards',
+    'Total Passes',
+    'Completed Passes',
+    'Passes in Final Third',
+    'Crosses',
+    'Tackles',
+    'Interceptions',
+    'Clearances',
+    'Duels Won',
+    'Attacks',
+    'Dangerous Attacks',
+)
+
+# Other names flashscore used for the same stats
+STATS_ALIASES = {
+    'xg': 'Expected Goals (xG)',
+    'total shots': 'Goal Attempts',
+    'shots on target': 'Shots on Goal',
+    'shots off target': 'Shots off Goal',
+    'corners': 'Corner Kicks',
+    'throw-in': 'Throw-ins',
+    'passes': 'Total Passes',
+    'accurate passes': 'Completed Passes',
+}
+
+STATS_INDEX = {name.lower(): i for i, name in enumerate(STATS_NAMES)}
+STATS_INDEX.update({alias: STATS_INDEX[name.lower()] for alias, name in STATS_ALIASES.items()})
+
+# Ids of stats in the feed (`SD`), the same in every locale while the names
+# are translated. Stats of other ids are matched by their english name.
+STATS_IDS = {
+    '432': 'Expected Goals (xG)',
+    '12': 'Ball Possession',
+    '34': 'Goal Attempts',
+    '13': 'Shots on Goal',
+    '16': 'Corner Kicks',
+    '342': 'Completed Passes',
+}
+STATS_IDS_INDEX = {id: STATS_INDEX[name.lower()] for id, name in STATS_IDS.items()}
+STATS_COLUMNS_IDS = tuple({index: id for id, index in STATS_IDS_INDEX.items()}.get(i) for i in range(len(STATS_NAMES)))
+
+PERIODS = ('Match', '1st Half', '2nd Half')
+PERIODS_ATTRIBUTES = ('_stats_match', '_stats_first_half', '_stats_second_half')
+SIDES = ('home', 'away')
+
+# Leading number of a value: 54 of '54%', 1.23 of '1.23', 12 of '12 (3)'
+NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def parse_stat_number(value: Any) -> Optional[Union[int, float]]:
+    if isinstance(value, (int, float)):
+        return value
+    matched = NUMBER_PATTERN.search(str(value))
+    if matched is None:
+        return None
+    number = matched.group()
+    return float(number) if '.' in number else int(number)
+
+
+def stat_index(name: str) -> Optional[int]:
+    """ Position of a stat name in `STATS_NAMES`, None for other stats """
+    return STATS_INDEX.get(name.lower())
+
+
+@dataclass()
+class StatsMatrix:
+    """ Stats of many matches as one array indexed by
+    `[match, stat, side, period]`, missing values are NaN.
+
+    The columns are `STATS_NAMES` followed by the stats of other ids, named
+    as the feed shows them. """
+
+    values: Any
+    matches_ids: List[str]
+    stats: Tuple[str, ...] = STATS_NAMES
+    stats_ids: Tuple[Optional[str], ...] = STATS_COLUMNS_IDS
+    sides: Tuple[str, ...] = SIDES
+    periods: Tuple[str, ...] = PERIODS
+
+    def stat_column(self, stat: str) -> int:
+        """ Column of a stat id, english name or name of the feed """
+        if stat in self.stats_ids:
+            return self.stats_ids.index(stat)
+        index = stat_index(stat)
+        if index is not None:
+            return index
+        if stat in self.stats:
+            return self.stats.index(stat)
+        raise KeyError(stat)
+
+    def stat(self, stat: str, side: str = 'home', period: str = 'Match') -> Any:
+        """ One stat of every match by id or name, a view of `values` """
+        return self.values[:, self.stat_column(stat), self.sides.index(side), self.periods.index(period)]
+
+
+def season_stats_matrix(matches: Iterable['Match']) -> StatsMatrix:
+    """ Packs the loaded stats of `matches` into a `StatsMatrix`, reading
+    backing fields so nothing is fetched, matches without stats are rows
+    of NaN. Needs numpy. """
+    # numpy is optional, only needed for the matrix
+    import numpy
+
+    matches = list(matches)
+    loaded = [
+        (row, period, stat)
+        for row, match in enumerate(matches) if match._is_loaded('stats')
+        for period, attribute in enumerate(PERIODS_ATTRIBUTES)
+        for stat in getattr(match, attribute) or []
+    ]
+
+    # Ids missing from STATS_IDS take the column of their english name when
+    # some match has it, otherwise a column of their own
+    columns: Dict[str, int] = dict(STATS_IDS_INDEX)
+    for _, _, stat in loaded:
+        index = stat_index(stat.name)
+        if stat.stat_id is None or index is None: continue
+        columns.setdefault(stat.stat_id, index)
+
+    stats, stats_ids = list(STATS_NAMES), list(STATS_COLUMNS_IDS)
+    cells = []
+    for row, period, stat in loaded:
+        index = columns.get(stat.stat_id) if stat.stat_id is not None else stat_index(stat.name)
+        if index is None:
+            if stat.stat_id is None: continue
+            index = columns[stat.stat_id] = len(stats)
+            stats.append(stat.name)
+            stats_ids.append(stat.stat_id)
+        cells.append((row, index, period, stat))
+
+    values = numpy.full((len(matches), len(stats), len(SIDES), len(PERIODS)), numpy.nan)
+    for row, index, period, stat in cells:
+        if stat.home is not None: values[row, index, 0, period] = stat.home
+        if stat.away is not None: values[row, index, 1, period] = stat.away
+    return StatsMatrix(values, [match.id for match in matches], tuple(stats), tuple(stats_ids))
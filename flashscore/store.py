@@ -0,0 +1,256 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .batch import BatchProgress
+from .export import TABLES, _chunks, iter_rows
+from .match import SECTIONS_BITS, Match, _check_sections, async_load_matches
+from .season import Season
+
+
+SQLITE_TYPES = {
+    'string': 'TEXT',
+    'int64': 'INTEGER',
+    'float64': 'REAL',
+    # ISO 8601 text, ordered like the dates
+    'timestamp': 'TEXT',
+}
+
+# Tables rewritten when their section of a match is saved again
+SECTIONS_TABLES = {
+    'stats': 'stats',
+    'events': 'events',
+    'head2heads': 'history_matches',
+    'odds': 'odds',
+}
+
+INDEXES = (
+    'CREATE INDEX IF NOT EXISTS matches_home_team ON matches (home_team_name, timestamp)',
+    'CREATE INDEX IF NOT EXISTS matches_away_team ON matches (away_team_name, timestamp)',
+    'CREATE INDEX IF NOT EXISTS matches_season ON matches (country_name, league_name, season)',
+    'CREATE INDEX IF NOT EXISTS matches_timestamp ON matches (timestamp)',
+    'CREATE INDEX IF NOT EXISTS matches_status ON matches (status)',
+    'CREATE INDEX IF NOT EXISTS stats_match ON stats (match_id, period, name)',
+    'CREATE INDEX IF NOT EXISTS events_match ON events (match_id, position)',
+    'CREATE INDEX IF NOT EXISTS history_matches_match ON history_matches (match_id, kind)',
+    'CREATE INDEX IF NOT EXISTS odds_match ON odds (match_id)',
+)
+
+OPERATORS = ('<', '<=', '>', '>=', '=', '!=')
+
+# Leading number of a stat value, 60 of '60%' and 412 of '412 (85%)'
+STAT_NUMBER = "CAST(RTRIM(%s, '%%') AS REAL)"
+
+
+def _sqlite_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class MatchStore:
+    """ Local SQLite store of matches and their stats, events, history
+    matches and odds, in the tables of `export.TABLES`, indexed by match
+    id, team, league and season, date and status.
+
+    `sync(season)` only fetches the matches that are not stored yet, not
+    `Ended` when they were stored or stored without one of `sections`,
+    `query` answers from the indexes without any request.
+
+        store = MatchStore('flashscore.sqlite')
+        store.sync(league.get_seasons()['2021/2022'], sections=['general', 'stats'])
+        store.query(away_team='Arsenal', season='2021/2022', stats=[('Ball Possession', '>', 60)])
+    """
+
+    def __init__(self, path: str = 'flashscore.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute('PRAGMA journal_mode=WAL')
+
+        for table, columns in TABLES.items():
+            definitions = ['%s %s' % (name, SQLITE_TYPES[type]) for name, type in columns]
+            if table == 'matches':
+                definitions[0] += ' PRIMARY KEY'
+                definitions += ['season TEXT', 'sections INTEGER NOT NULL DEFAULT 0', 'updated_at REAL NOT NULL']
+            self._connection.execute('CREATE TABLE IF NOT EXISTS %s (%s)' % (table, ', '.join(definitions)))
+        for index in INDEXES:
+            self._connection.execute(index)
+
+    def save(self, matches: Iterable[Match], season: Optional[str] = None) -> int:
+        """ Stores the loaded sections of `matches`, values missing from a
+        match keep what was stored, returns the number of matches """
+        columns = [name for name, _ in TABLES['matches']]
+        upsert = 'INSERT INTO matches (%s, season, sections, updated_at) VALUES (%s) ON CONFLICT (id) DO UPDATE SET %s' % (
+            ', '.join(columns),
+            ', '.join('?' * (len(columns) + 3)),
+            ', '.join(
+                ['%s = COALESCE(excluded.%s, %s)' % (name, name, name) for name in columns[1:] + ['season']]
+                + ['sections = sections | excluded.sections', 'updated_at = excluded.updated_at']
+            ),
+        )
+        inserts = {
+            table: 'INSERT INTO %s VALUES (%s)' % (table, ', '.join('?' * len(columns)))
+            for table, columns in TABLES.items() if table != 'matches'
+        }
+
+        updated_at = time.time()
+        count = 0
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                for match in matches:
+                    for section, table in SECTIONS_TABLES.items():
+                        if match._is_loaded(section):
+                            self._connection.execute('DELETE FROM %s WHERE match_id = ?' % table, (match.id, ))
+                    for table, row in iter_rows(match):
+                        row = tuple(_sqlite_value(value) for value in row)
+                        if table == 'matches':
+                            self._connection.execute(upsert, row + (season, match._loaded, updated_at))
+                        else:
+                            self._connection.execute(inserts[table], row)
+                    count += 1
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+        return count
+
+    def _stale_matches(self, matches: List[Match], sections: List[str]) -> List[Match]:
+        required = 0
+        for section in sections:
+            required |= SECTIONS_BITS[section]
+
+        stored = {}
+        with self._lock:
+            # Chunked to stay under the sqlite variables limit
+            for chunk in _chunks([match.id for match in matches], 500):
+                rows = self._connection.execute(
+                    'SELECT id, status, sections FROM matches WHERE id IN (%s)' % ', '.join('?' * len(chunk)), chunk,
+                )
+                stored.update((row['id'], (row['status'], row['sections'])) for row in rows)
+
+        return [
+            match for match in matches
+            if match.id not in stored
+            or stored[match.id][0] != 'Ended'
+            or stored[match.id][1] & required != required
+        ]
+
+    async def async_sync(self,
+                         season: Season,
+                         sections: Optional[Iterable[str]] = None,
+                         chunk_size: int = 500,
+                         progress: Optional[Callable[[BatchProgress], None]] = None) -> int:
+        """ Fetches the season listing, then loads and stores only the
+        stale matches `chunk_size` at a time, returns how many were stored """
+        sections = _check_sections(sections)
+        matches = self._stale_matches(await season.async_get_matches(), sections)
+        for chunk in _chunks(matches, chunk_size):
+            await async_load_matches(chunk, sections, progress)
+            self.save(chunk, season.title)
+        return len(matches)
+
+    def sync(self,
+             season: Season,
+             sections: Optional[Iterable[str]] = None,
+             chunk_size: int = 500,
+             progress: Optional[Callable[[BatchProgress], None]] = None) -> int:
+        return season._transport.run(self.async_sync(season, sections, chunk_size, progress))
+
+    def query(self,
+              team: Optional[str] = None,
+              home_team: Optional[str] = None,
+              away_team: Optional[str] = None,
+              country: Optional[str] = None,
+              league: Optional[str] = None,
+              season: Optional[str] = None,
+              status: Optional[str] = None,
+              date_from: Optional[datetime] = None,
+              date_to: Optional[datetime] = None,
+              stats: Optional[List[Tuple[str, str, float]]] = None,
+              period: str = 'Match',
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ Stored matches rows, oldest first.
+
+        `stats` filters are `(name, operator, value)` comparing the leading
+        number of the stat of the filtered team over `period`, so they need
+        one of `team`, `home_team` or `away_team`.
+        """
+        conditions, params = [], []
+        if team is not None:
+            conditions.append('(m.home_team_name = ? OR m.away_team_name = ?)')
+            params += [team, team]
+        for column, value in (
+            ('m.home_team_name', home_team),
+            ('m.away_team_name', away_team),
+            ('m.country_name', country),
+            ('m.league_name', league),
+            ('m.season', season),
+            ('m.status', status),
+        ):
+            if value is None: continue
+            conditions.append('%s = ?' % column)
+            params.append(value)
+        if date_from is not None:
+            conditions.append('m.timestamp >= ?')
+            params.append(int(date_from.timestamp()))
+        if date_to is not None:
+            conditions.append('m.timestamp < ?')
+            params.append(int(date_to.timestamp()))
+
+        if stats:
+            if home_team is not None:
+                side, side_params = 's.home', []
+            elif away_team is not None:
+                side, side_params = 's.away', []
+            elif team is not None:
+                side, side_params = 'CASE WHEN m.home_team_name = ? THEN s.home ELSE s.away END', [team]
+            else:
+                raise ValueError('Stats filters need a team, home_team or away_team')
+
+            for name, operator, value in stats:
+                if operator not in OPERATORS:
+                    raise ValueError("Unknown operator '%s', expected one of %s" % (operator, ', '.join(OPERATORS)))
+                conditions.append(
+                    'EXISTS (SELECT 1 FROM stats s WHERE s.match_id = m.id AND s.period = ? AND s.name = ? AND %s %s ?)'
+                    % (STAT_NUMBER % side, operator)
+                )
+                params += [period, name] + side_params + [value]
+
+        sql = 'SELECT m.* FROM matches m'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY m.timestamp'
+        if limit is not None:
+            sql += ' LIMIT %d' % limit
+        return self.execute(sql, params)
+
+    def get(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """ A stored match row with its stats, events, history matches and
+        odds rows """
+        rows = self.execute('SELECT * FROM matches WHERE id = ?', [match_id])
+        if not rows:
+            return None
+        match = rows[0]
+        for table in SECTIONS_TABLES.values():
+            match[table] = self.execute('SELECT * FROM %s WHERE match_id = ? ORDER BY rowid' % table, [match_id])
+        return match
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, list(params))]
+
+    def __len__(self) -> int:
+        return self.execute('SELECT COUNT(*) AS count FROM matches')[0]['count']
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'MatchStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
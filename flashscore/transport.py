@@ -0,0 +1,673 @@
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .batch import RETRY_STATUSES, RateLimiter, RetryBudget, RetryPolicy
+from .cache import Cache, CachePolicy
+from .instrumentation import Instrumentation, RequestEvent, RetryEvent, endpoint_for
+
+# The http backends are imported by the first request of their mode:
+# requests for sync calls and get_many, aiohttp for async calls and batches
+if TYPE_CHECKING:
+    import requests
+    from aiohttp import ClientSession, TraceConfig
+
+
+# Polled feeds worth revalidating: today's matches and match summaries
+CONDITIONAL_ENDPOINTS = ('feed', 'general')
+
+
+@dataclass()
+class FetchResult:
+    url: str
+    status: int
+    text: str
+    size: int
+    cached: bool = False
+    # Answered 304, `text` is the body of the previous response
+    not_modified: bool = False
+
+
+class CachedResponse:
+    """ Stands in for `requests.Response` when a body comes from the cache """
+
+    status_code = 200
+    ok = True
+
+    def __init__(self, url: str, text: str):
+        self.url = url
+        self.text = text
+        self.headers: Dict[str, str] = {}
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode('utf-8')
+
+
+class _Call:
+    """ One in-flight sync request other threads can wait for """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+@dataclass(frozen=True, slots=True)
+class _Validators:
+    """ ETag and Last-Modified of the last response of a url, with its body
+    to answer a 304 """
+    etag: Optional[str]
+    last_modified: Optional[str]
+    text: str
+    size: int
+
+
+def _requests_accept_encoding() -> str:
+    """ Encodings urllib3 can decode, zstd and br need their packages """
+    from urllib3.util.request import ACCEPT_ENCODING
+    return ACCEPT_ENCODING
+
+
+def _aiohttp_accept_encoding() -> str:
+    try:
+        from aiohttp import compression_utils as decoders
+    except ImportError:
+        from aiohttp import http_parser as decoders
+    encodings = ['gzip', 'deflate']
+    if getattr(decoders, 'HAS_BROTLI', False): encodings.append('br')
+    if getattr(decoders, 'HAS_ZSTD', False): encodings.append('zstd')
+    return ','.join(encodings)
+
+
+def _compression_saved(headers: Any, size: int) -> int:
+    """ Bytes a compressed body saved, when its length was announced """
+    length = headers.get('Content-Length')
+    if not headers.get('Content-Encoding') or length is None or not length.isdigit():
+        return 0
+    return max(0, size - int(length))
+
+
+def _elapsed(response: Any) -> Optional[float]:
+    """ Time until the headers arrived, as measured by requests """
+    elapsed = getattr(response, 'elapsed', None)
+    return elapsed.total_seconds() if elapsed is not None else None
+
+
+class _RequestTimings:
+    """ Phases of one aiohttp request, filled by the trace config """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self._phase_started = 0.0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+def _trace_config() -> 'TraceConfig':
+    from aiohttp import TraceConfig
+
+    async def on_phase_start(session, context, params) -> None:
+        if isinstance(context.trace_request_ctx, _RequestTimings):
+            context.trace_request_ctx._phase_started = time.perf_counter()
+
+    def on_phase_end(phase: str):
+        async def on_end(session, context, params) -> None:
+            timings = context.trace_request_ctx
+            if isinstance(timings, _RequestTimings):
+                setattr(timings, phase, time.perf_counter() - timings._phase_started)
+        return on_end
+
+    async def on_request_end(session, context, params) -> None:
+        timings = context.trace_request_ctx
+        if isinstance(timings, _RequestTimings):
+            timings.ttfb = time.perf_counter() - timings.started
+
+    trace_config = TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(on_phase_start)
+    trace_config.on_dns_resolvehost_end.append(on_phase_end('dns'))
+    trace_config.on_connection_create_start.append(on_phase_start)
+    trace_config.on_connection_create_end.append(on_phase_end('connect'))
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+class Transport:
+    """ Process-wide HTTP layer with keep-alive connection pooling.
+
+    One `requests.Session` serves the sync and threaded paths, and one
+    `aiohttp.ClientSession` per event loop serves the async path, so repeated
+    requests to flashscore.ninja / lsapp.eu reuse already opened connections.
+
+    Concurrent requests for the same url share one in-flight request.
+    Every request waits for the per host `rate_limit` and is retried on
+    network errors and on 429/5xx statuses as set by `retry`.
+
+    With `conditional` the ETag and Last-Modified of the polled
+    `conditional_endpoints` are sent back as If-None-Match and
+    If-Modified-Since, a 304 answers with the previous body, the very same
+    string, so pollers can tell nothing changed without parsing. Those
+    bodies are kept up to `validators_bytes` in total, least recently used
+    first out. Bytes saved by 304s and compression are reported to the
+    instrumentation.
+    """
+
+    def __init__(self,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 32,
+                 limit: int = 100,
+                 limit_per_host: int = 32,
+                 timeout: float = 20,
+                 concurrency: int = 32,
+                 rate_limit: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 cache: Optional[Cache] = None,
+                 cache_policy: Optional[CachePolicy] = None,
+                 client_session: Optional['ClientSession'] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 conditional: bool = True,
+                 conditional_endpoints: Iterable[str] = CONDITIONAL_ENDPOINTS,
+                 validators_bytes: int = 8 * 1024 * 1024):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = RateLimiter(rate_limit, burst) if rate_limit is not None else None
+        self.cache = cache
+        self.cache_policy = cache_policy if cache_policy is not None else CachePolicy()
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self.conditional = conditional
+        self.conditional_endpoints = frozenset(conditional_endpoints)
+        self.validators_bytes = validators_bytes
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._client_session = client_session
+        self._loop = loop
+        self._session: Optional['requests.Session'] = None
+        self._async_sessions: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClientSession]' = \
+            weakref.WeakKeyDictionary()
+        # Requests in flight by cache key, futures are bound to their loop
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]' = \
+            weakref.WeakKeyDictionary()
+        self._validators: 'OrderedDict[str, _Validators]' = OrderedDict()
+        self._validators_size = 0
+        self._accept_encodings: Dict[str, str] = {}
+
+    @property
+    def session(self) -> 'requests.Session':
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                    )
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def _cache_key(self, url: str, headers: Dict[str, str]) -> str:
+        return '%s|%s' % (headers.get('Accept-Language', ''), url)
+
+    def _get_cached(self, url: str, headers: Dict[str, str]) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(url, headers))
+
+    def _set_cached(self, url: str, headers: Dict[str, str], status: int, text: str) -> None:
+        if self.cache is None or status != 200:
+            return
+
+        ttl = self.cache_policy.ttl_for(url)
+        if ttl != 0:
+            self.cache.set(self._cache_key(url, headers), text, ttl)
+
+    def _accept_encoding(self, backend: str) -> str:
+        encoding = self._accept_encodings.get(backend)
+        if encoding is None:
+            encoding = _requests_accept_encoding() if backend == 'requests' else _aiohttp_accept_encoding()
+            self._accept_encodings[backend] = encoding
+        return encoding
+
+    def _is_conditional(self, url: str) -> bool:
+        return self.conditional and endpoint_for(url) in self.conditional_endpoints
+
+    def _get_validators(self, url: str, key: str) -> Optional[_Validators]:
+        if not self._is_conditional(url):
+            return None
+        with self._lock:
+            validators = self._validators.get(key)
+            if validators is not None:
+                self._validators.move_to_end(key)
+            return validators
+
+    def _set_validators(self,
+                        url: str,
+                        key: str,
+                        response_headers: Any,
+                        status: int,
+                        text: str,
+                        size: int) -> None:
+        if status != 200 or size > self.validators_bytes or not self._is_conditional(url):
+            return
+        etag, last_modified = response_headers.get('ETag'), response_headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return
+        with self._lock:
+            previous = self._validators.pop(key, None)
+            if previous is not None:
+                self._validators_size -= previous.size
+            self._validators[key] = _Validators(etag, last_modified, text, size)
+            self._validators_size += size
+            while self._validators_size > self.validators_bytes:
+                _, evicted = self._validators.popitem(last=False)
+                self._validators_size -= evicted.size
+
+    def _request_headers(self, headers: Dict[str, str], backend: str, validators: Optional[_Validators]) -> Dict[str, str]:
+        headers = {**headers, 'Accept-Encoding': self._accept_encoding(backend)}
+        if validators is not None:
+            if validators.etag is not None: headers['If-None-Match'] = validators.etag
+            if validators.last_modified is not None: headers['If-Modified-Since'] = validators.last_modified
+        return headers
+
+    def _conditional_response(self,
+                              url: str,
+                              key: str,
+                              validators: Optional[_Validators],
+                              response: 'requests.Response') -> 'requests.Response':
+        """ The previous body for a 304, otherwise keeps the validators of
+        `response` """
+        if response.status_code == 304 and validators is not None:
+            return CachedResponse(url, validators.text)
+        self._set_validators(url, key, response.headers, response.status_code, response.text, len(response.content))
+        return response
+
+    def pin(self, urls: List[str], headers: Dict[str, str]) -> None:
+        """ Keeps already cached responses of `urls` forever """
+        if self.cache is None:
+            return
+        for url in urls:
+            key = self._cache_key(url, headers)
+            value = self.cache.get(key)
+            if value is not None:
+                self.cache.set(key, value, None)
+
+    def _report_request(self, url: str, started_at: float, elapsed: float, **fields: Any) -> None:
+        self.instrumentation.on_request(RequestEvent(
+            url=url, endpoint=endpoint_for(url), started_at=started_at, elapsed=elapsed, **fields,
+        ))
+
+    def _report_retry(self, url: str, attempt: int, delay: float, status: Optional[int] = None) -> None:
+        self.instrumentation.on_retry(RetryEvent(
+            url=url, endpoint=endpoint_for(url), attempt=attempt, delay=delay, status=status,
+        ))
+
+    def get(self,
+            url: str,
+            headers: Dict[str, str],
+            budget: Optional[RetryBudget] = None,
+            retry: Optional[RetryPolicy] = None) -> 'requests.Response':
+        cached = self._get_cached(url, headers)
+        if cached is not None:
+            if self.instrumentation.enabled:
+                self._report_request(url, time.time(), 0.0, status=200, cached=True)
+            return CachedResponse(url, cached)
+
+        key = self._cache_key(url, headers)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            response = self._send(url, headers, budget, retry)
+            self._set_cached(url, headers, response.status_code, response.text)
+            call.result = response
+            return response
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _send(self,
+              url: str,
+              headers: Dict[str, str],
+              budget: Optional[RetryBudget] = None,
+              retry: Optional[RetryPolicy] = None) -> 'requests.Response':
+        """ Every sync request goes out here: waits for the per host rate
+        limit, then retries network errors and retryable statuses with
+        backoff, `retry` or the transport policy, returning the last
+        response once retries run out """
+        retry = retry if retry is not None else self.retry
+        host = urlsplit(url).netloc
+        errors = self._transient_errors(asynchronous=False)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                time.sleep(self.rate_limiter.reserve(host))
+            try:
+                response, error = self._fetch(url, headers), None
+            except errors as fetch_error:
+                response, error = None, fetch_error
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+
+            attempt += 1
+            if attempt >= retry.attempts or (budget is not None and not budget.take()):
+                if error is not None:
+                    raise error
+                return response
+
+            delay = retry.delay(attempt - 1)
+            if self.instrumentation.enabled:
+                self._report_retry(url, attempt, delay, response.status_code if response is not None else None)
+            time.sleep(delay)
+
+    def _fetch(self, url: str, headers: Dict[str, str]) -> 'requests.Response':
+        """ One sync request, revalidated when validators are kept """
+        key = self._cache_key(url, headers)
+        started_at, started = time.time(), time.perf_counter()
+        try:
+            validators = self._get_validators(url, key)
+            response = self.session.get(
+                url, headers=self._request_headers(headers, 'requests', validators), timeout=self.timeout,
+            )
+        except BaseException as error:
+            if self.instrumentation.enabled:
+                self._report_request(url, started_at, time.perf_counter() - started, error=type(error).__name__)
+            raise
+
+        not_modified = response.status_code == 304 and validators is not None
+        if self.instrumentation.enabled:
+            self._report_request(
+                url, started_at, time.perf_counter() - started,
+                status=response.status_code, bytes=len(response.content),
+                ttfb=_elapsed(response), not_modified=not_modified,
+                saved_bytes=validators.size if not_modified else _compression_saved(
+                    response.headers, len(response.content),
+                ),
+            )
+        return self._conditional_response(url, key, validators, response)
+
+    def get_many(self, urls: List[str], headers: Dict[str, str]) -> List[Optional['requests.Response']]:
+        """ Fetches `urls` through `get` on up to `concurrency` threads,
+        sharing one retry budget, responses that failed after retries are
+        left as `None` """
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) < len(urls):
+            responses = dict(zip(unique_urls, self.get_many(unique_urls, headers)))
+            return [responses[url] for url in urls]
+        if not urls:
+            return []
+
+        errors = self._transient_errors(asynchronous=False)
+        budget = RetryBudget(self.retry.budget_for(len(urls)))
+
+        def get(url: str) -> Optional['requests.Response']:
+            try:
+                response = self.get(url, headers, budget)
+            except errors:
+                return None
+            return response if response.status_code not in RETRY_STATUSES else None
+
+        with concurrent.futures.ThreadPoolExecutor(min(self.concurrency, len(urls))) as executor:
+            return list(executor.map(get, urls))
+
+    def _transient_errors(self, asynchronous: bool) -> Tuple[type, ...]:
+        """ Network errors worth retrying, of the backend of each mode """
+        if asynchronous:
+            from aiohttp import ClientError
+            return (ClientError, asyncio.TimeoutError)
+
+        import requests
+        return (requests.RequestException, )
+
+    async def async_session(self) -> 'ClientSession':
+        if self._client_session is not None:
+            return self._client_session
+        from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300,
+                ),
+                timeout=ClientTimeout(total=self.timeout),
+                trace_configs=[_trace_config()] if self.instrumentation.enabled else None,
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    async def async_get(self,
+                        url: str,
+                        headers: Dict[str, str],
+                        budget: Optional[RetryBudget] = None,
+                        retry: Optional[RetryPolicy] = None) -> FetchResult:
+        cached = self._get_cached(url, headers)
+        if cached is not None:
+            if self.instrumentation.enabled:
+                self._report_request(url, time.time(), 0.0, status=200, cached=True)
+            return FetchResult(url=url, status=200, text=cached, size=0, cached=True)
+
+        key = self._cache_key(url, headers)
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+        call = calls.get(key)
+        if call is not None:
+            try:
+                result = await asyncio.shield(call)
+            except asyncio.CancelledError:
+                # The first caller was cancelled, not this one
+                if not call.cancelled(): raise
+                return await self.async_get(url, headers, budget, retry)
+            # Shared response, its bytes are counted by the first caller
+            return replace(result, size=0)
+
+        call = calls[key] = loop.create_future()
+        try:
+            result = await self._async_send(url, headers, budget, retry)
+            self._set_cached(url, headers, result.status, result.text)
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as error:
+            call.set_exception(error)
+            # Retrieved so a call nobody joined does not log a warning
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del calls[key]
+
+    async def _async_send(self,
+                          url: str,
+                          headers: Dict[str, str],
+                          budget: Optional[RetryBudget] = None,
+                          retry: Optional[RetryPolicy] = None) -> FetchResult:
+        """ Every async request goes out here, like `_send` """
+        retry = retry if retry is not None else self.retry
+        host = urlsplit(url).netloc
+        errors = self._transient_errors(asynchronous=True)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(host)
+            try:
+                result, error = await self._async_fetch(url, headers), None
+            except errors as fetch_error:
+                result, error = None, fetch_error
+            if result is not None and result.status not in RETRY_STATUSES:
+                return result
+
+            attempt += 1
+            if attempt >= retry.attempts or (budget is not None and not budget.take()):
+                if error is not None:
+                    raise error
+                return result
+
+            delay = retry.delay(attempt - 1)
+            if self.instrumentation.enabled:
+                self._report_retry(url, attempt, delay, result.status if result is not None else None)
+            await asyncio.sleep(delay)
+
+    async def _async_fetch(self, url: str, headers: Dict[str, str]) -> FetchResult:
+        """ One async request, revalidated when validators are kept """
+        session = await self.async_session()
+        key = self._cache_key(url, headers)
+        validators = self._get_validators(url, key)
+        request_headers = self._request_headers(headers, 'aiohttp', validators)
+        if not self.instrumentation.enabled:
+            async with session.get(url, headers=request_headers) as response:
+                body = await response.read()
+                result = self._fetch_result(url, key, validators, response, body)
+            return result
+
+        timings = _RequestTimings()
+        try:
+            async with session.get(url, headers=request_headers, trace_request_ctx=timings) as response:
+                body = await response.read()
+                result = self._fetch_result(url, key, validators, response, body)
+                saved = validators.size if result.not_modified else _compression_saved(response.headers, len(body))
+        except BaseException as error:
+            self._report_request(url, timings.started_at, timings.elapsed(), error=type(error).__name__)
+            raise
+        self._report_request(
+            url, timings.started_at, timings.elapsed(),
+            status=304 if result.not_modified else result.status, bytes=len(body),
+            dns=timings.dns, connect=timings.connect, ttfb=timings.ttfb,
+            not_modified=result.not_modified, saved_bytes=saved,
+        )
+        return result
+
+    def _fetch_result(self,
+                      url: str,
+                      key: str,
+                      validators: Optional[_Validators],
+                      response: Any,
+                      body: bytes) -> FetchResult:
+        if response.status == 304 and validators is not None:
+            return FetchResult(url=url, status=200, text=validators.text, size=0, not_modified=True)
+
+        result = FetchResult(
+            url=url,
+            status=response.status,
+            text=body.decode(response.get_encoding()),
+            size=len(body),
+        )
+        self._set_validators(url, key, response.headers, result.status, result.text, result.size)
+        return result
+
+    async def async_get_text(self, url: str, headers: Dict[str, str]) -> str:
+        return (await self.async_get(url, headers)).text
+
+    def run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """ Runs `coroutine` on a per-thread loop owned by the transport,
+        so async sessions stay open between sync calls """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coroutine.close()
+            raise RuntimeError(
+                'Sync flashscore methods cannot be called from a running event loop, '
+                'use the async_* methods or AsyncFlashscoreApi instead'
+            )
+
+        if self._loop is not None:
+            return self._loop.run_until_complete(coroutine)
+
+        loop = getattr(self._local, 'loop', None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+        return loop.run_until_complete(coroutine)
+
+    async def aclose(self) -> None:
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+        for loop, session in list(self._async_sessions.items()):
+            if session.closed or loop.is_closed() or loop.is_running():
+                continue
+            loop.run_until_complete(session.close())
+        self._async_sessions.clear()
+
+        # The loop `run` created for this thread, a caller's loop is left open
+        loop = getattr(self._local, 'loop', None)
+        if loop is not None and not loop.is_running():
+            loop.close()
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = Transport()
+    return _transport
+
+
+def set_transport(transport: Transport) -> None:
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+@atexit.register
+def _close_transport() -> None:
+    if _transport is not None:
+        _transport.close()
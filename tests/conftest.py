@@ -0,0 +1,161 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flashscore.base import Base
+from flashscore.instrumentation import Instrumentation, RequestEvent
+from flashscore.match import Match
+from flashscore.replay import ReplayTransport
+from flashscore.season import Season
+from flashscore.transport import Transport
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+LEAGUE_URL = 'https://www.flashscore.com/football/england/premier-league/'
+
+
+class RequestsRecorder(Instrumentation):
+    """ Keeps the urls of the requests that were not answered by the cache """
+
+    enabled = True
+
+    def __init__(self):
+        self.urls: List[str] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        if not event.cached:
+            self.urls.append(event.url)
+
+
+class ConditionalServer:
+    """ Answers like a server keeping validators of one body, 304 when the
+    request sends them back """
+
+    def __init__(self, body: str, etag: Optional[str] = '"1"', last_modified: Optional[str] = None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.requests: List[Dict[str, str]] = []
+
+    def change(self, body: str) -> None:
+        self.body = body
+        self.etag = '"%d"' % len(self.requests)
+
+    def answer(self, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        self.requests.append(headers)
+        validators = {'ETag': self.etag, 'Last-Modified': self.last_modified}
+        validators = {name: value for name, value in validators.items() if value is not None}
+        if ((self.etag is not None and headers.get('If-None-Match') == self.etag)
+                or (self.etag is None and self.last_modified is not None
+                    and headers.get('If-Modified-Since') == self.last_modified)):
+            return 304, validators, b''
+        return 200, validators, self.body.encode('utf-8')
+
+
+class ServerResponse:
+    """ What `requests` and `aiohttp` responses of `ConditionalServer` expose """
+
+    def __init__(self, answer: Tuple[int, Dict[str, str], bytes]):
+        self.status_code, self.headers, self.content = answer
+        self.status = self.status_code
+        self.text = self.content.decode('utf-8')
+
+    def get_encoding(self) -> str:
+        return 'utf-8'
+
+    async def read(self) -> bytes:
+        return self.content
+
+    async def __aenter__(self) -> 'ServerResponse':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class ServerSession:
+    """ Stands in for both a `requests.Session` and an `aiohttp.ClientSession` """
+
+    closed = False
+
+    def __init__(self, server: ConditionalServer):
+        self.server = server
+
+    def get(self, url: str, headers: Dict[str, str], **kwargs: Any) -> ServerResponse:
+        return ServerResponse(self.server.answer(headers))
+
+    def close(self) -> None:
+        pass
+
+
+class ServerTransport(Transport):
+    """ A Transport whose sync and async requests are answered by `server`
+    through its real request and revalidation code """
+
+    def __init__(self, server: ConditionalServer, **kwargs: Any):
+        session = ServerSession(server)
+        super().__init__(client_session=session, **kwargs)
+        self._session = session
+        self._accept_encodings = {'requests': 'gzip, deflate', 'aiohttp': 'gzip, deflate'}
+
+    def _transient_errors(self, asynchronous: bool) -> Tuple[type, ...]:
+        return (asyncio.TimeoutError, )
+
+
+def fixture_text(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding='utf-8')
+
+
+def write_fixtures(directory: str) -> None:
+    """ Writes tests/fixtures as ReplayTransport fixtures, one per endpoint
+    so every match and page of an endpoint is served its fixture """
+    transport = ReplayTransport(directory)
+    base = Base(transport=transport)
+    match = Match('Ac5Lxwbd', transport=transport)
+    season = Season(176, '2022/2023', 198, 'dYlOSQOD', 'England', 'Premier League', transport=transport)
+
+    fixtures = {
+        base._main_url: 'main.html',
+        base._league_url + '198': 'leagues.txt',
+        LEAGUE_URL + 'archive/': 'archive.html',
+        season.get_matches_url(0): 'season.txt',
+        base._today_matches_url.replace('{day}', '0'): 'feed.txt',
+        match._flashscore_url: 'names.html',
+        match._general_url: 'general.txt',
+        Match('hWn9Kd2u', transport=transport)._stats_url: 'stats-hWn9Kd2u.txt',
+        match._events_url: 'events.txt',
+        match._odds_url: 'odds.json',
+        match._head2heads_url: 'head2heads.txt',
+    }
+    # The stats endpoint has two fixtures, the other matches are given theirs
+    for id in ('Ac5Lxwbd', 'zR3kQp7a', 'Tb8mNx1c'):
+        fixtures[Match(id, transport=transport)._stats_url] = 'stats.txt'
+    for title in ('2023-2024', '2022-2023', '2021-2022'):
+        fixtures[base._main_url + 'football/england/premier-league-%s/' % title] = 'season-%s.html' % title
+
+    for url, name in fixtures.items():
+        transport._write(url, fixture_text(name))
+
+
+@pytest.fixture()
+def fixtures_directory(tmp_path: Path) -> str:
+    directory = str(tmp_path / 'fixtures')
+    write_fixtures(directory)
+    return directory
+
+
+@pytest.fixture()
+def recorder() -> RequestsRecorder:
+    return RequestsRecorder()
+
+
+@pytest.fixture()
+def replay(fixtures_directory: str, recorder: RequestsRecorder) -> ReplayTransport:
+    transport = ReplayTransport(fixtures_directory, instrumentation=recorder)
+    yield transport
+    transport.close()
@@ -0,0 +1,108 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from flashscore import converter
+
+
+# Records as they come in flashscore feeds: empty values, `·` params,
+# repeated keys, a trailing space param and unterminated last fields
+RECORDS = [
+    'SA÷1¬',
+    'ZA÷ENGLAND: Premier League¬ZEE÷dYlOSQOD¬ZB÷198¬ZY÷England¬',
+    'AA÷xQ1e3zHi¬AD÷1696000000¬AB÷3¬CR÷3¬AC÷3¬AE÷Arsenal¬AF÷Chelsea¬AG÷2¬AH÷1¬WM÷ARS¬WN÷CHE¬AX÷1¬',
+    'AA÷xQ1e3zHi¬AE÷Arsenal¬AG÷¬AH÷¬',
+    'SE÷Match¬',
+    'SG÷Ball Possession¬SH÷54%¬SI÷46%¬',
+    'III÷1¬IK÷Goal¬IB÷23\'¬IF÷Saka B.¬IU÷/player/saka¬INX÷1¬IOX÷0¬',
+    'KB÷Last matches: Arsenal¬',
+    'MN÷Premier League¬MTI÷abc¬MU÷premier-league¬MT÷x¬ ¬',
+    'DA÷3¬DB÷3¬DC÷1696000000¬DD÷1696000000¬DE÷2¬DF÷1¬DE÷3¬',
+    'AB÷¬X÷b¬¬AB÷-b¬X÷',
+    'x·÷X÷÷AB-b',
+    'A1÷d41d8cd98f00b204e9800998ecf8427e¬',
+    'A1÷x',
+    'AB·1¬AC÷2¬',
+    '¬AA÷1¬',
+]
+
+FEEDS = sorted((Path(__file__).resolve().parent / 'fixtures').glob('*.txt'))
+
+# 'Ã' and 'з' leave the utf-8 bytes of '÷' once the others are deleted
+TOKENS = ['AA', 'AB', 'X', 'x', '-b', '÷', '÷', '¬', '¬', '¬', '·', ' ', '', '~', 'Ã', 'з']
+
+
+def baseline_gzip_to_json(gzip):
+    """ The parser before the fast paths, which the converter must match """
+    items = gzip.split('~')
+
+    json_result = []
+    for item in items:
+        if item in ['', ' ']: continue
+        item_params = item.split('¬')
+        item_data = {}
+
+        for param in item_params:
+            if param in ['', ' ']: continue
+
+            try:
+                key, value = param.split('÷')
+            except Exception:
+                key, value = param.split('·')
+
+            if item_data.get(key) is None:
+                item_data[key] = value
+            else:
+                item_data[f'{key}_2'] = value
+
+        json_result.append(item_data)
+    return json_result
+
+
+def parsed(parse, gzip):
+    try:
+        return parse(gzip)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize('item', RECORDS)
+def test_parse_record_matches_baseline(item):
+    assert converter.parse_record(item) == baseline_gzip_to_json(item)[0]
+    assert converter.gzip_to_json(item) == baseline_gzip_to_json(item)
+
+
+@pytest.mark.parametrize('item', ['A¬B÷÷C¬', 'AB÷1¬C', 'AB÷1¬ ¬C·D·E¬'])
+def test_malformed_params_raise_like_baseline(item):
+    with pytest.raises(ValueError):
+        baseline_gzip_to_json(item)
+    with pytest.raises(ValueError):
+        converter.parse_record(item)
+    with pytest.raises(ValueError):
+        converter.gzip_to_json(item)
+
+
+def test_converter_matches_baseline_fuzzed():
+    generator = random.Random(20231001)
+    for _ in range(20000):
+        gzip = ''.join(generator.choice(TOKENS) for _ in range(generator.randint(1, 16)))
+        expected = parsed(baseline_gzip_to_json, gzip)
+        assert parsed(converter.gzip_to_json, gzip) == expected, gzip
+        assert parsed(lambda gzip: list(converter.iter_records(gzip)), gzip) == expected, gzip
+
+
+@pytest.mark.parametrize('path', FEEDS, ids=lambda path: path.name)
+def test_converter_matches_baseline_on_fixtures(path):
+    feed = path.read_text(encoding='utf-8')
+    assert converter.gzip_to_json(feed) == baseline_gzip_to_json(feed)
+    assert list(converter.iter_records(feed)) == baseline_gzip_to_json(feed)
+
+
+def test_parse_record_unterminated_last_field():
+    assert converter.parse_record('AB÷¬X÷b¬¬AB÷-b¬X÷') == {'AB': '', 'X': 'b', 'AB_2': '-b', 'X_2': ''}
+
+
+def test_gzip_to_json_matches_iter_records():
+    feed = '~'.join(RECORDS) + '~A1÷x¬~'
+    assert converter.gzip_to_json(feed) == list(converter.iter_records(feed))
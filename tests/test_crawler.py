@@ -0,0 +1,93 @@
+import pytest
+
+from conftest import fixture_text
+from flashscore.crawler import CrawlCheckpoint, Crawler
+from flashscore.match import Match
+from flashscore.season import Season
+
+
+@pytest.fixture()
+def checkpoint_path(tmp_path) -> str:
+    return str(tmp_path / 'crawl.sqlite')
+
+
+def crawl(replay, checkpoint_path, seasons=('2022/2023', ), sections=('general', ), **kwargs):
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    crawled = []
+    crawler = Crawler(
+        countries=['England'], leagues=['Premier League'], seasons=seasons,
+        sections=list(sections), chunk_size=3, checkpoint=checkpoint,
+        on_matches=lambda matches: crawled.extend(match.id for match in matches),
+        transport=replay, **kwargs,
+    )
+    stats = crawler.run()
+    checkpoint.close()
+    return stats, crawled
+
+
+def test_checkpoint_persists(checkpoint_path):
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    checkpoint.complete_matches(['a', 'b'], '198/x/176')
+    checkpoint.complete_matches(['c'], '198/x/172')
+    checkpoint.complete_season('198/x/176')
+    checkpoint.close()
+
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    assert checkpoint.completed_matches('198/x/176') == {'a', 'b'}
+    assert checkpoint.completed_matches() == {'a', 'b', 'c'}
+    assert checkpoint.completed_seasons() == {'198/x/176'}
+    checkpoint.close()
+
+
+def test_crawl_selected_season(replay, checkpoint_path):
+    stats, crawled = crawl(replay, checkpoint_path)
+    assert (stats.seasons, stats.seasons_done, stats.matches, stats.failed) == (1, 1, 4, 0)
+    assert crawled == ['Ac5Lxwbd', 'hWn9Kd2u', 'zR3kQp7a', 'Tb8mNx1c']
+
+
+def test_crawl_again_skips_completed_seasons(replay, checkpoint_path, recorder):
+    crawl(replay, checkpoint_path)
+    requests_count = len(recorder.urls)
+
+    stats, crawled = crawl(replay, checkpoint_path)
+    assert (stats.seasons, stats.matches, crawled) == (0, 0, [])
+    assert not any('/x/feed/' in url for url in recorder.urls[requests_count:])
+
+
+def test_interrupted_crawl_resumes_from_its_matches(replay, checkpoint_path):
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    checkpoint.complete_matches(['Ac5Lxwbd', 'hWn9Kd2u'], '198/dYlOSQOD/176')
+    checkpoint.close()
+
+    stats, crawled = crawl(replay, checkpoint_path)
+    assert (stats.skipped, stats.matches) == (2, 2)
+    assert crawled == ['zR3kQp7a', 'Tb8mNx1c']
+
+
+def test_failed_listing_is_recorded_and_other_seasons_crawled(replay, checkpoint_path, monkeypatch):
+    async_get_matches = Season.async_get_matches
+
+    async def fail_season_172(season):
+        if season.id == 172: raise ValueError('not a feed')
+        return await async_get_matches(season)
+
+    monkeypatch.setattr(Season, 'async_get_matches', fail_season_172)
+
+    stats, crawled = crawl(replay, checkpoint_path, seasons=['2022/2023', '2021/2022'])
+    assert (stats.seasons, stats.seasons_done, stats.seasons_failed) == (2, 1, 1)
+    assert list(stats.errors) == ['198/dYlOSQOD/172']
+    assert crawled == ['Ac5Lxwbd', 'hWn9Kd2u', 'zR3kQp7a', 'Tb8mNx1c']
+
+
+def test_failed_chunk_is_recorded_and_retried_next_run(replay, checkpoint_path):
+    broken = Match('zR3kQp7a', transport=replay)
+    replay._write(broken._stats_url, 'not a feed')
+
+    stats, crawled = crawl(replay, checkpoint_path, sections=['stats'])
+    assert (stats.matches, stats.failed, stats.seasons_failed) == (1, 3, 1)
+    assert stats.errors['198/dYlOSQOD/176'].startswith('ValueError')
+    assert crawled == ['Tb8mNx1c']
+
+    replay._write(broken._stats_url, fixture_text('stats.txt'))
+    stats, crawled = crawl(replay, checkpoint_path, sections=['stats'])
+    assert (stats.skipped, stats.seasons_done, crawled) == (1, 1, ['Ac5Lxwbd', 'hWn9Kd2u', 'zR3kQp7a'])
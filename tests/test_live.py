@@ -0,0 +1,60 @@
+from conftest import ConditionalServer, ServerTransport, fixture_text
+from flashscore.live import LiveTracker
+
+LIVE = 'AA÷Qm2Vx8Lp¬AD÷1696003600¬AB÷2¬CR÷2¬AE÷Liverpool¬PX÷lId4TMwf¬AF÷Tottenham¬PY÷UDg08Ohm¬AG÷1¬AH÷0¬'
+
+
+def write_feed(replay, tracker, feed):
+    replay._write(tracker._today_matches_url.replace('{day}', '0'), feed)
+
+
+def test_poll_emits_only_changed_matches(replay):
+    updates = []
+    tracker = LiveTracker(track_events=False, on_update=updates.append, transport=replay)
+    feed = fixture_text('feed.txt')
+
+    assert [update.match.id for update in tracker.poll()] == ['Qm2Vx8Lp']
+    assert list(tracker.matches) == ['Qm2Vx8Lp']
+    assert tracker.poll() == []
+
+    write_feed(replay, tracker, feed.replace(LIVE, LIVE.replace('AG÷1', 'AG÷2')))
+    update = tracker.poll()[0]
+    assert update.changes == {'home_team_score': (1, 2), 'final_total_score': ('1:0', '2:0')}
+    assert len(updates) == 2
+
+
+def test_ended_matches_are_no_longer_tracked(replay):
+    tracker = LiveTracker(track_events=False, transport=replay)
+    tracker.poll()
+
+    write_feed(replay, tracker, fixture_text('feed.txt').replace(LIVE, LIVE.replace('AB÷2', 'AB÷3')))
+    assert tracker.poll()[0].changes['status'] == ('Live', 'Ended')
+    assert tracker.matches == {}
+
+
+def test_matches_gone_from_the_feed_are_no_longer_tracked(replay):
+    tracker = LiveTracker(track_events=False, transport=replay)
+    tracker.poll()
+
+    write_feed(replay, tracker, fixture_text('feed.txt').replace(LIVE + '~', ''))
+    assert tracker.poll() == []
+    assert tracker.matches == {}
+
+
+def test_poll_loads_new_events(replay):
+    tracker = LiveTracker(transport=replay)
+    update = tracker.poll()[0]
+    assert len(update.new_events) == 5
+
+
+def test_poll_skips_a_feed_answered_not_modified():
+    server = ConditionalServer(fixture_text('feed.txt'))
+    tracker = LiveTracker(track_events=False, transport=ServerTransport(server))
+    assert len(tracker.poll()) == 1
+
+    assert tracker.poll() == []
+    assert server.requests[1]['If-None-Match'] == '"1"'
+
+    server.change(fixture_text('feed.txt').replace(LIVE, LIVE.replace('AH÷0', 'AH÷1')))
+    assert tracker.poll()[0].changes['away_team_score'] == (0, 1)
+    tracker._transport.close()
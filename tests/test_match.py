@@ -0,0 +1,231 @@
+from datetime import datetime
+
+import pytest
+
+from conftest import fixture_text
+from flashscore.api import FlashscoreApi
+from flashscore.match import (SECTIONS, Event, Match, StatValue, async_load_matches, get_match, load_matches,
+                              parse_events_content, parse_general_content, parse_head2heads_content,
+                              parse_names_content, parse_odds_content, parse_stats_content)
+from flashscore.stats import season_stats_matrix
+
+
+def test_parse_names():
+    assert parse_names_content(fixture_text('names.html')) == {
+        'tournament': 'Premier League - Round 37',
+        'league_name': 'Premier League - Round 37',
+        'country_name': 'ENGLAND',
+        'home_team_name': 'Arsenal',
+        'away_team_name': 'Chelsea',
+        'home_participant_id': 'hA1Zm19f',
+        'away_participant_id': '4fGZN2oK',
+    }
+
+
+def test_parse_general():
+    assert parse_general_content(fixture_text('general.txt')) == {
+        'timestamp': 1684677600,
+        'date': datetime.fromtimestamp(1684677600),
+        'status': 'Ended',
+        'home_team_score': 3,
+        'away_team_score': 1,
+        'final_total_score': '3:1',
+    }
+
+
+def test_parse_stats():
+    stats = parse_stats_content(fixture_text('stats.txt'))
+    assert stats['stats_match'][:2] == [
+        StatValue('Expected Goals (xG)', 2.31, 0.87, '2.31', '0.87', '432'),
+        StatValue('Ball Possession', 58, 42, '58%', '42%', '12'),
+    ]
+    assert stats['stats_match'][-1] == StatValue('Completed Passes', 512, 341, '512 (88%)', '341 (80%)', '342')
+    assert [stat.home for stat in stats['stats_first_half']] == [55, 9]
+    assert [stat.away for stat in stats['stats_second_half']] == [39, 5]
+
+
+def test_parse_events():
+    events = parse_events_content(fixture_text('events.txt'))['events']
+    assert [(event.type, event.time) for event in events] == [
+        ('Goal', "12'"), ('Yellow Card', "34'"), ('Penaltie', "58'"), ('Goal', "71'"), ('Goal', "88'"),
+    ]
+    assert events[0] == Event(
+        type='Goal',
+        player_name='Saka B.',
+        player_url='/player/saka-bukayo/vgOOdZbd',
+        time="12'",
+        current_score='1:0',
+        second_player_name='Odegaard M.',
+        second_player_url='/player/odegaard-martin/WfFwnmjG',
+    )
+    assert events[1].description == 'Foul'
+
+
+def test_parse_odds_keeps_participants_odds_by_id():
+    # The 1X2 market lists draw, away, home
+    assert parse_odds_content(fixture_text('odds.json')) == {
+        'prematch_home_odds': 1.72,
+        'prematch_middle_odds': 3.9,
+        'prematch_away_odds': 4.75,
+        'prematch_participants_odds': {'4fGZN2oK': 4.75, 'hA1Zm19f': 1.72},
+    }
+
+
+def test_parse_head2heads():
+    history = parse_head2heads_content(fixture_text('head2heads.txt'))
+    assert [match.id for match in history['home_matches']] == ['hWn9Kd2u', 'Uq3wE5rt']
+    assert [match.id for match in history['away_matches']] == ['zR3kQp7a']
+    assert [match.id for match in history['head2head_matches']] == ['Vw1xY2za']
+    assert history['home_matches'][1].result_for_main_team == 'Loss'
+    assert history['head2head_matches'][0].final_total_score == '0:1'
+
+
+def test_load_content(replay):
+    match = Match('Ac5Lxwbd', transport=replay)
+    match.load_content()
+
+    assert match.home_team_name == 'Arsenal'
+    assert match.home_participant_id == 'hA1Zm19f'
+    assert match.final_total_score == '3:1'
+    assert match.status == 'Ended'
+    assert (match.prematch_home_odds, match.prematch_middle_odds, match.prematch_away_odds) == (1.72, 3.9, 4.75)
+    assert len(match.events) == 5
+    assert match.get_json()['stats_match'][1] == {
+        'name': 'Ball Possession', 'home': 58, 'away': 42, 'raw_home': '58%', 'raw_away': '42%',
+    }
+
+
+def test_lazy_sections_fetch_only_their_endpoint(replay, recorder):
+    match = Match('Ac5Lxwbd', transport=replay)
+    assert match.final_total_score == '3:1'
+    assert recorder.urls == [match._general_url]
+
+    assert match.status == 'Ended'
+    assert len(recorder.urls) == 1
+
+
+def test_odds_without_participant_ids_keep_the_listed_order(replay, recorder):
+    match = Match('Ac5Lxwbd', transport=replay)
+    match.load(['odds'])
+    assert recorder.urls == [match._odds_url]
+    assert (match.prematch_home_odds, match.prematch_middle_odds, match.prematch_away_odds) == (1.72, 3.9, 4.75)
+
+
+def load_listed_odds(replay, home_participant_id, away_participant_id) -> Match:
+    match = get_match('hWn9Kd2u', transport=replay)
+    match._load_feed_record(
+        {'AA': 'hWn9Kd2u', 'AD': '1685286000', 'AB': '3', 'AE': 'Liverpool', 'AF': 'Arsenal',
+         'PX': home_participant_id, 'PY': away_participant_id, 'AG': '2', 'AH': '2'},
+        {'ZA': 'ENGLAND: Premier League'},
+    )
+    match.load(['odds'])
+    return match
+
+
+def test_listing_record_gives_names_and_participants(replay, recorder):
+    match = load_listed_odds(replay, '4fGZN2oK', 'hA1Zm19f')
+
+    # Odds are fetched alone and mapped by the participant ids of the listing
+    assert recorder.urls == [match._odds_url]
+    assert (match.home_team_name, match.away_team_name) == ('Liverpool', 'Arsenal')
+    assert (match.prematch_home_odds, match.prematch_away_odds) == (4.75, 1.72)
+
+
+def test_odds_of_other_participants_keep_the_listed_order(replay, caplog):
+    match = load_listed_odds(replay, 'lId4TMwf', 'hA1Zm19f')
+    assert (match.prematch_home_odds, match.prematch_away_odds) == (1.72, 4.75)
+    assert 'not keyed by its participants lId4TMwf and hA1Zm19f' in caplog.text
+
+
+def test_get_match_returns_the_same_match(replay):
+    assert get_match('Ac5Lxwbd', transport=replay) is get_match('Ac5Lxwbd', transport=replay)
+
+
+def test_load_matches_in_one_batch(replay, recorder):
+    matches = [Match(id, transport=replay) for id in ('Ac5Lxwbd', 'hWn9Kd2u')]
+    load_matches(matches, ['general', 'stats'])
+
+    assert len(recorder.urls) == 4
+    assert [match.stats_match[0].home for match in matches] == [2.31, 35]
+
+    load_matches(matches, ['general', 'stats'])
+    assert len(recorder.urls) == 4
+
+
+def test_async_load_matches(replay):
+    matches = [Match(id, transport=replay) for id in ('Ac5Lxwbd', 'hWn9Kd2u')]
+    replay.run(async_load_matches(matches, ['head2heads']))
+    assert [len(match.home_matches) for match in matches] == [2, 2]
+
+
+def test_loading_a_live_match_again_fetches_it_again(replay, recorder):
+    api = FlashscoreApi(transport=replay)
+    match = get_match('Qm2Vx8Lp', transport=replay)
+    replay._write(match._general_url, fixture_text('general.txt').replace('DA÷3¬DB÷3', 'DA÷2¬DB÷38', 1))
+
+    live = api.get_matches_with_already_loaded_content(['Qm2Vx8Lp'], sections=['general', 'stats'])
+    assert live == [match] and match.status == 'Half Time'
+    assert len(recorder.urls) == 2
+
+    api.get_matches_with_already_loaded_content(['Qm2Vx8Lp'], sections=['general', 'stats'])
+    assert recorder.urls[2:] == recorder.urls[:2]
+
+
+def test_loading_an_ended_match_again_reuses_it(replay, recorder):
+    api = FlashscoreApi(transport=replay)
+    ended = api.get_matches_with_already_loaded_content(['Ac5Lxwbd'], sections=['general', 'stats'])
+    api.get_matches_with_already_loaded_content(['Ac5Lxwbd'], sections=['general', 'stats'])
+    assert ended[0].status == 'Ended'
+    assert len(recorder.urls) == 2
+
+
+def test_get_json_loads_missing_sections_in_one_batch(replay, recorder):
+    match = Match('Ac5Lxwbd', transport=replay)
+    assert match.final_total_score == '3:1'
+    json = match.get_json()
+
+    assert len(recorder.urls) == len(SECTIONS)
+    assert (json['home_team_name'], json['prematch_home_odds'], len(json['events'])) == ('Arsenal', 1.72, 5)
+
+
+def test_async_get_json_inside_an_event_loop(replay):
+    match = Match('Ac5Lxwbd', transport=replay)
+    assert replay.run(match.async_get_json())['head2heads_matches'][0]['id'] == 'Vw1xY2za'
+
+
+def test_expand_history_takes_names_from_the_history_rows(replay, recorder):
+    match = Match('Ac5Lxwbd', transport=replay)
+    expanded = match.expand_history(sections=['names', 'general'])
+
+    assert list(expanded) == ['hWn9Kd2u', 'Uq3wE5rt', 'zR3kQp7a', 'Vw1xY2za']
+    assert not any(url.startswith(match._flashscore_endpoint) for url in recorder.urls)
+    assert len(recorder.urls) == 1 + len(expanded)
+    history = expanded['Uq3wE5rt']
+    assert (history.home_team_name, history.away_team_name, history.tournament) == ('Arsenal', 'Brighton', 'Premier League')
+
+
+UA_STATS = (
+    'SE÷Матч¬~SD÷12¬SG÷Володіння м\'ячем¬SH÷58%¬SI÷42%¬~SD÷21¬SG÷Фоли¬SH÷11¬SI÷14¬~'
+    'SE÷1-й тайм¬~SD÷12¬SG÷Володіння м\'ячем¬SH÷55%¬SI÷45%¬~A1÷0d9e1c7b3a5f2468¬~'
+)
+
+
+def test_parse_stats_of_another_locale_keeps_periods_and_ids():
+    stats = parse_stats_content(UA_STATS)
+    assert [(stat.stat_id, stat.home) for stat in stats['stats_match']] == [('12', 58), ('21', 11)]
+    assert [stat.away for stat in stats['stats_first_half']] == [45]
+    assert stats['stats_second_half'] == []
+
+
+def test_stats_matrix_columns_are_keyed_by_stat_id(replay):
+    numpy = pytest.importorskip('numpy')
+    english, ukrainian = Match('Ac5Lxwbd', transport=replay), Match('Ac5Lxwbd', locale='ua', transport=replay)
+    english.load(['stats'])
+    ukrainian._load_sections({'stats': UA_STATS})
+
+    matrix = season_stats_matrix([english, ukrainian])
+    assert matrix.stat('Ball Possession').tolist() == [58, 58]
+    assert matrix.stat('12', 'away', '1st Half').tolist() == [45, 45]
+    # An id outside STATS_IDS gets a column named as the feed shows it
+    assert matrix.stats[-1] == 'Фоли' and matrix.stats_ids[-1] == '21'
+    assert numpy.isnan(matrix.stat('21')[0]) and matrix.stat('Фоли')[1] == 11
@@ -0,0 +1,51 @@
+from conftest import fixture_text
+from flashscore.odds import EventOdds, OddsFetcher, OddsMovement, OddsSnapshot, odds_url, parse_event_odds
+
+HOME, AWAY = 'hA1Zm19f', '4fGZN2oK'
+
+
+def test_parse_event_odds():
+    odds = parse_event_odds(fixture_text('odds.json'))
+    assert odds[(16, 'HOME_DRAW_AWAY', 'FULL_TIME', HOME)] == 1.72
+    assert odds[(417, 'HOME_DRAW_AWAY', 'FULL_TIME', 'draw')] == 4.0
+    assert odds[(16, 'OVER_UNDER', 'FULL_TIME', 'OVER@2.5')] == 1.65
+    assert len(odds) == 8
+
+
+def test_home_draw_away_by_participant_id():
+    event = EventOdds('Ac5Lxwbd', parse_event_odds(fixture_text('odds.json')))
+    assert event.bookmakers() == [16, 417]
+    assert event.home_draw_away(HOME, AWAY) == (1.72, 3.9, 4.75)
+    # Bookmaker 417 lists the away participant first
+    assert event.home_draw_away(HOME, AWAY, bookmaker_id=417) == (1.75, 4.0, 4.6)
+    assert event.market('OVER_UNDER') == {'OVER@2.5': 1.65, 'UNDER@2.5': 2.2}
+
+
+def test_snapshot_diff():
+    key = (16, 'HOME_DRAW_AWAY', 'FULL_TIME', HOME)
+    draw = (16, 'HOME_DRAW_AWAY', 'FULL_TIME', 'draw')
+    previous = OddsSnapshot(0, {
+        'a': EventOdds('a', {key: 1.72, draw: 3.9}),
+        'b': EventOdds('b', {key: 2.0}),
+        'c': EventOdds('c', {key: 3.0}),
+    })
+    current = OddsSnapshot(1, {
+        'a': EventOdds('a', {key: 1.65}),
+        'b': EventOdds('b', {key: 2.0}),
+        'd': EventOdds('d', {key: 1.5}),
+    })
+    assert sorted(current.diff(previous), key=lambda movement: movement.key) == [
+        OddsMovement('a', draw, 3.9, None),
+        OddsMovement('a', key, 1.72, 1.65),
+    ]
+
+
+def test_fetcher_snapshot(replay):
+    fetcher = OddsFetcher(transport=replay)
+    replay._write(odds_url(fetcher._odds_endpoint, 'broken'), 'not json')
+    snapshot = fetcher.snapshot(['Ac5Lxwbd', 'hWn9Kd2u', 'broken', 'Ac5Lxwbd'])
+
+    assert sorted(snapshot.events) == ['Ac5Lxwbd', 'hWn9Kd2u']
+    assert snapshot.failed == ['broken']
+    assert snapshot.events['Ac5Lxwbd'].home_draw_away(HOME, AWAY) == (1.72, 3.9, 4.75)
+    assert snapshot.diff(snapshot) == []
@@ -0,0 +1,58 @@
+""" Checks over responses recorded from flashscore by
+benchmarks/record_fixtures.py, skipped until they are recorded """
+import json
+from pathlib import Path
+
+import pytest
+
+from conftest import ConditionalServer, ServerTransport
+from flashscore.match import Match, load_matches
+from flashscore.replay import ReplayTransport
+
+RECORDED = Path(__file__).resolve().parent.parent / 'benchmarks' / 'fixtures'
+
+pytestmark = pytest.mark.skipif(
+    not (RECORDED / 'recorded.json').exists(), reason='run benchmarks/record_fixtures.py to record fixtures',
+)
+
+
+@pytest.fixture()
+def recorded() -> dict:
+    return json.loads((RECORDED / 'recorded.json').read_text(encoding='utf-8'))
+
+
+@pytest.fixture()
+def transport() -> ReplayTransport:
+    transport = ReplayTransport(str(RECORDED), fallback=False)
+    yield transport
+    transport.close()
+
+
+def test_recorded_odds_are_keyed_by_the_participants(recorded, transport):
+    matches = [Match(id, transport=transport) for id in recorded['matches']]
+    load_matches(matches, ['names', 'odds'])
+
+    for match in matches:
+        listed = recorded['matches'][match.id]
+        if None not in listed:
+            assert listed == [match.home_participant_id, match.away_participant_id]
+        if match.prematch_participants_odds:
+            assert set(match.prematch_participants_odds) == {match.home_participant_id, match.away_participant_id}
+
+
+def test_recorded_feeds_are_answered_not_modified(recorded, transport):
+    if not recorded['validators']:
+        pytest.skip('no recorded feed sent validators')
+
+    for url, validators in recorded['validators'].items():
+        server = ConditionalServer(transport.get(url, {}).text, validators['etag'], validators['last_modified'])
+        revalidating = ServerTransport(server)
+        first = revalidating.get(url, {})
+        second = revalidating.get(url, {})
+        revalidating.close()
+
+        assert second.text is first.text
+        if validators['etag'] is not None:
+            assert server.requests[1]['If-None-Match'] == validators['etag']
+        else:
+            assert server.requests[1]['If-Modified-Since'] == validators['last_modified']
@@ -0,0 +1,95 @@
+import pytest
+
+from conftest import LEAGUE_URL
+from flashscore.api import AsyncFlashscoreApi, FlashscoreApi
+from flashscore.league import League, SeasonsParseError
+from flashscore.replay import ReplayTransport
+from flashscore.season import Season
+
+
+def create_league(transport) -> League:
+    return League('dYlOSQOD', 'Premier League', LEAGUE_URL, 198, 'England', '1_198_dYlOSQOD', transport=transport)
+
+
+def test_countries_and_leagues(replay):
+    countries = FlashscoreApi(transport=replay).get_countries()
+    assert [(country.id, country.name) for country in countries] == [(81, 'Germany'), (198, 'England')]
+    assert countries[1].url == 'https://www.flashscore.com/football/england/'
+
+    leagues = countries[1].get_leagues()
+    assert [(league.id, league.name) for league in leagues] == [
+        ('2DSCa5fE', 'Championship'), ('dYlOSQOD', 'Premier League'),
+    ]
+    assert leagues[1].url == LEAGUE_URL
+
+
+def test_seasons_ids_come_from_season_pages(replay, recorder):
+    seasons = create_league(replay).get_seasons()
+    assert not recorder.urls
+
+    assert [(season.id, season.title) for season in seasons] == [
+        (190, '2023/2024'), (176, '2022/2023'), (172, '2021/2022'),
+    ]
+    assert seasons['2022/2023'].id == 176
+    assert seasons.by_id(172).title == '2021/2022'
+    assert len(recorder.urls) == 4
+
+
+def test_async_seasons(replay):
+    seasons = replay.run(create_league(replay).async_get_seasons())
+    assert seasons[0].id == 190
+
+
+def test_season_page_without_id_raises(replay):
+    replay._write('https://www.flashscore.com/football/england/premier-league-2021-2022/', '<html></html>')
+    with pytest.raises(SeasonsParseError) as error:
+        list(create_league(replay).get_seasons())
+    assert error.value.url == 'https://www.flashscore.com/football/england/premier-league-2021-2022/'
+
+
+def test_archive_without_seasons_raises(replay):
+    replay._write(LEAGUE_URL + 'archive/', '<div class="archive"></div>')
+    with pytest.raises(SeasonsParseError):
+        list(create_league(replay).get_seasons())
+
+
+def test_season_matches_from_listing(replay, recorder):
+    season = Season(176, '2022/2023', 198, 'dYlOSQOD', 'England', 'Premier League', transport=replay)
+    matches = season.get_matches()
+
+    assert [match.id for match in matches] == ['Ac5Lxwbd', 'hWn9Kd2u', 'zR3kQp7a', 'Tb8mNx1c']
+    requests_count = len(recorder.urls)
+
+    # The listing carries the names, participants and result of ended matches
+    match = matches[1]
+    assert (match.home_team_name, match.away_team_name, match.final_total_score) == ('Liverpool', 'Arsenal', '2:2')
+    assert (match.home_participant_id, match.away_participant_id) == ('lId4TMwf', 'hA1Zm19f')
+    assert (match.tournament, match.status) == ('Premier League', 'Ended')
+    assert len(recorder.urls) == requests_count
+
+
+def test_today_and_live_matches(replay):
+    api = FlashscoreApi(transport=replay)
+    assert [match.id for match in api.get_today_matches()] == ['Ac5Lxwbd', 'Qm2Vx8Lp', 'Jk4Rt6Yw']
+    assert [match.id for match in api.get_live_matches()] == ['Qm2Vx8Lp']
+
+
+def test_async_api_iterates_matches_without_blocking(fixtures_directory):
+    transport = ReplayTransport(fixtures_directory)
+
+    async def iterate():
+        async with AsyncFlashscoreApi(transport=transport) as api:
+            today = [match.id async for match in api.iter_today_matches()]
+            live = [match.id async for match in api.iter_live_matches()]
+        return today, live
+
+    assert transport.run(iterate()) == (['Ac5Lxwbd', 'Qm2Vx8Lp', 'Jk4Rt6Yw'], ['Qm2Vx8Lp'])
+
+
+def test_season_pages_are_read_once_per_transport(replay, recorder):
+    assert len(create_league(replay).get_seasons()) == 3
+    assert len(recorder.urls) == 4
+
+    seasons = replay.run(create_league(replay).async_get_seasons())
+    assert [season.id for season in seasons] == [190, 176, 172]
+    assert recorder.urls[4:] == [LEAGUE_URL + 'archive/']
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+from flashscore.season import Season
+from flashscore.store import MatchStore
+
+
+@pytest.fixture()
+def season(replay) -> Season:
+    return Season(176, '2022/2023', 198, 'dYlOSQOD', 'England', 'Premier League', transport=replay)
+
+
+@pytest.fixture()
+def store(tmp_path, season) -> MatchStore:
+    store = MatchStore(str(tmp_path / 'matches.sqlite'))
+    store.sync(season, sections=['general', 'stats', 'events'])
+    yield store
+    store.close()
+
+
+def ids(rows):
+    return [row['id'] for row in rows]
+
+
+def test_sync_stores_the_season(store):
+    assert len(store) == 4
+    row = store.query(home_team='Liverpool')[0]
+    assert (row['away_team_name'], row['final_total_score'], row['season']) == ('Arsenal', '2:2', '2022/2023')
+
+
+def test_sync_skips_stored_ended_matches(store, season, recorder):
+    requests_count = len(recorder.urls)
+    assert store.sync(season, sections=['general', 'stats']) == 0
+    # Only the season listing is fetched again
+    assert all('/x/feed/tr_' in url for url in recorder.urls[requests_count:])
+
+    assert store.sync(season, sections=['stats', 'head2heads']) == 4
+
+
+def test_query_filters(store):
+    assert ids(store.query(team='Arsenal')) == ['Ac5Lxwbd', 'hWn9Kd2u', 'Tb8mNx1c']
+    assert ids(store.query(away_team='Tottenham', limit=1)) == ['zR3kQp7a']
+    assert ids(store.query(country='England', league='Premier League', season='2022/2023')) == [
+        'Ac5Lxwbd', 'hWn9Kd2u', 'zR3kQp7a', 'Tb8mNx1c',
+    ]
+    assert ids(store.query(
+        date_from=datetime.fromtimestamp(1685286000), date_to=datetime.fromtimestamp(1686495600),
+    )) == ['hWn9Kd2u', 'zR3kQp7a']
+    assert store.query(status='Live') == []
+
+
+def test_query_stats_of_the_filtered_team(store):
+    # Arsenal has 58% at home and 65% away at Liverpool
+    assert ids(store.query(team='Arsenal', stats=[('Ball Possession', '>', 60)])) == ['hWn9Kd2u']
+    assert ids(store.query(home_team='Arsenal', stats=[('Ball Possession', '>', 50)])) == ['Ac5Lxwbd', 'Tb8mNx1c']
+    assert ids(store.query(away_team='Arsenal', stats=[('Ball Possession', '<', 50)])) == []
+    assert ids(store.query(
+        team='Tottenham', stats=[('Goal Attempts', '>=', 8), ('Ball Possession', '<=', 42)],
+    )) == ['zR3kQp7a', 'Tb8mNx1c']
+    assert ids(store.query(
+        team='Arsenal', stats=[('Ball Possession', '>', 50)], period='2nd Half',
+    )) == ['Ac5Lxwbd', 'Tb8mNx1c']
+
+
+def test_query_rejects_bad_stats_filters(store):
+    with pytest.raises(ValueError):
+        store.query(stats=[('Ball Possession', '>', 50)])
+    with pytest.raises(ValueError):
+        store.query(team='Arsenal', stats=[('Ball Possession', '; DROP TABLE matches', 50)])
+
+
+def test_get_returns_sections_rows(store):
+    match = store.get('Ac5Lxwbd')
+    assert match['home_team_name'] == 'Arsenal'
+    assert [(row['name'], row['home']) for row in match['stats'] if row['period'] == 'Match'][:2] == [
+        ('Expected Goals (xG)', '2.31'), ('Ball Possession', '58%'),
+    ]
+    assert len(match['events']) == 5
+    assert store.get('missing') is None
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+from typing import Dict, List, Tuple
+
+import pytest
+
+from conftest import ConditionalServer, RequestsRecorder, ServerTransport
+from flashscore.batch import BatchLoader, BatchLoadError, RetryPolicy
+from flashscore.cache import MemoryCache
+from flashscore.replay import ReplayTransport
+from flashscore.transport import CachedResponse, FetchResult, Transport
+
+GENERAL_URL = 'https://global.flashscore.ninja/2/x/feed/dc_1_Ac5Lxwbd'
+FEED_URL = 'https://global.flashscore.ninja/2/x/feed/f_1_0_3_en_1'
+NAMES_URL = 'https://www.flashscore.com/match/Ac5Lxwbd'
+
+
+class StatusTransport(Transport):
+    """ Answers every request with the next status of `statuses`, then 200 """
+
+    def __init__(self, statuses: List[int], **kwargs):
+        super().__init__(retry=RetryPolicy(backoff=0.001), **kwargs)
+        self.statuses = statuses
+        self.sent: List[str] = []
+        self._statuses_lock = threading.Lock()
+
+    def _next_status(self, url: str) -> int:
+        with self._statuses_lock:
+            self.sent.append(url)
+            return self.statuses.pop(0) if self.statuses else 200
+
+    def _fetch(self, url: str, headers: Dict[str, str]) -> CachedResponse:
+        response = CachedResponse(url, 'body')
+        response.status_code = self._next_status(url)
+        return response
+
+    async def _async_fetch(self, url: str, headers: Dict[str, str]) -> FetchResult:
+        return FetchResult(url=url, status=self._next_status(url), text='body', size=4)
+
+    def _transient_errors(self, asynchronous: bool) -> Tuple[type, ...]:
+        return (asyncio.TimeoutError, )
+
+
+def test_concurrent_gets_share_one_request(fixtures_directory, recorder):
+    transport = ReplayTransport(fixtures_directory, latency=0.05, instrumentation=recorder)
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(transport.get(GENERAL_URL, {})))
+        for _ in range(8)
+    ]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    assert recorder.urls == [GENERAL_URL]
+    assert len({id(response) for response in responses}) == 1
+
+
+def test_concurrent_async_gets_share_one_request(fixtures_directory, recorder):
+    transport = ReplayTransport(fixtures_directory, latency=0.05, instrumentation=recorder)
+
+    async def get_all():
+        return await asyncio.gather(*[transport.async_get(GENERAL_URL, {}) for _ in range(8)])
+
+    results = transport.run(get_all())
+    assert recorder.urls == [GENERAL_URL]
+    assert {result.text for result in results} == {results[0].text}
+    # Bytes of a shared response are counted once
+    assert sum(result.size for result in results) == results[0].size
+
+
+def test_cached_responses_skip_the_replay(fixtures_directory, recorder):
+    transport = ReplayTransport(fixtures_directory, cache=MemoryCache(), instrumentation=recorder)
+    assert transport.get(GENERAL_URL, {}).text == transport.get(GENERAL_URL, {}).text
+    assert recorder.urls == [GENERAL_URL]
+
+
+def test_retryable_statuses_are_retried():
+    transport = StatusTransport([503, 429])
+    assert transport.get(GENERAL_URL, {}).status_code == 200
+    assert len(transport.sent) == 3
+
+
+def test_last_status_is_returned_after_retries():
+    transport = StatusTransport([503] * 10)
+    assert transport.get(GENERAL_URL, {}).status_code == 503
+    assert len(transport.sent) == transport.retry.attempts
+
+
+def test_get_many_shares_one_retry_budget():
+    transport = StatusTransport([503] * 100)
+    transport.retry.budget = 2
+    responses = transport.get_many([GENERAL_URL, FEED_URL, NAMES_URL], {})
+
+    assert responses == [None, None, None]
+    assert len(transport.sent) == 3 + 2
+
+
+def test_every_request_waits_for_the_rate_limit():
+    transport = StatusTransport([503], rate_limit=1000)
+    hosts = []
+    reserve = transport.rate_limiter.reserve
+    transport.rate_limiter.reserve = lambda host: hosts.append(host) or reserve(host)
+
+    transport.get(GENERAL_URL, {})
+    transport.run(transport.async_get(NAMES_URL, {}))
+    assert hosts == ['global.flashscore.ninja', 'global.flashscore.ninja', 'www.flashscore.com']
+
+
+def test_batch_loader_reports_failed_urls():
+    transport = StatusTransport([500] * 100)
+    transport.retry.budget = 0
+    with pytest.raises(BatchLoadError) as error:
+        BatchLoader(transport, {}).load([GENERAL_URL, FEED_URL])
+    assert sorted(error.value.urls) == sorted([GENERAL_URL, FEED_URL])
+
+
+def test_batch_loader_retries_with_its_policy():
+    transport = StatusTransport([503] * 100)
+    with pytest.raises(BatchLoadError):
+        BatchLoader(transport, {}, retry=RetryPolicy(attempts=2, backoff=0.001, budget=10)).load([GENERAL_URL])
+    assert len(transport.sent) == 2
+
+
+def test_validators_kept_for_polled_feeds_only():
+    transport = Transport(validators_bytes=10)
+    headers = {'ETag': '"v1"'}
+    transport._set_validators(NAMES_URL, NAMES_URL, headers, 200, 'names', 5)
+    transport._set_validators(FEED_URL, FEED_URL, headers, 200, 'feed', 4)
+    assert transport._get_validators(NAMES_URL, NAMES_URL) is None
+    assert transport._get_validators(FEED_URL, FEED_URL).text == 'feed'
+
+
+def test_validators_capped_by_bytes():
+    transport = Transport(validators_bytes=10)
+    headers = {'ETag': '"v1"'}
+    for i in range(3):
+        url = FEED_URL + str(i)
+        transport._set_validators(url, url, headers, 200, 'x' * 4, 4)
+    assert list(transport._validators) == [FEED_URL + '1', FEED_URL + '2']
+    assert transport._validators_size == 8
+
+    transport._set_validators(GENERAL_URL, GENERAL_URL, headers, 200, 'x' * 11, 11)
+    assert transport._get_validators(GENERAL_URL, GENERAL_URL) is None
+
+
+def test_not_modified_feed_returns_the_previous_body():
+    server = ConditionalServer('feed')
+    transport = ServerTransport(server)
+    first = transport.get(FEED_URL, {})
+    second = transport.get(FEED_URL, {})
+
+    assert server.requests[1]['If-None-Match'] == '"1"'
+    assert second.status_code == 200 and second.text is first.text
+
+    server.change('changed')
+    assert transport.get(FEED_URL, {}).text == 'changed'
+
+
+def test_not_modified_async_feed_is_reported_as_saved():
+    server = ConditionalServer('feed', etag=None, last_modified='Sun, 18 Oct 2026 12:00:00 GMT')
+    recorder = RequestsRecorder()
+    recorder.events = []
+    recorder.on_request = recorder.events.append
+    transport = ServerTransport(server, instrumentation=recorder)
+    first = transport.run(transport.async_get(FEED_URL, {}))
+    second = transport.run(transport.async_get(FEED_URL, {}))
+    transport.close()
+
+    assert server.requests[1]['If-Modified-Since'] == 'Sun, 18 Oct 2026 12:00:00 GMT'
+    assert second.not_modified and second.text is first.text
+    assert [(event.status, event.saved_bytes) for event in recorder.events] == [(200, 0), (304, 4)]
+
+
+def test_pages_are_not_revalidated():
+    server = ConditionalServer('names')
+    transport = ServerTransport(server)
+    transport.get(NAMES_URL, {})
+    transport.get(NAMES_URL, {})
+    assert 'If-None-Match' not in server.requests[1]